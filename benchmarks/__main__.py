@@ -0,0 +1,63 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import argparse
+import sys
+
+from . import cases  # noqa: F401  (registers the benchmark cases)
+from . import runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the hot-path benchmark suite",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default=None,
+        help="Only run the benchmarks of a group (generator) or whose name "
+        "contains group.case (handler.handle_message)",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="PATH",
+        help="Write the results as a JSON baseline to PATH",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare the results against the JSON baseline at PATH",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio flagged as a regression (default: 1.25)",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Shorter timing samples, for a fast sanity run",
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        results = runner.run(args.filter, min_time=0.01, repeat=2)
+    else:
+        results = runner.run(args.filter)
+
+    if args.save:
+        runner.save(results, args.save)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        regressions = runner.compare(results, runner.load(args.compare), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
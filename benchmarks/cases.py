@@ -0,0 +1,402 @@
+"""Benchmark cases for the game's hot paths.
+
+Each factory builds its fixtures once and yields the callables to time.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from PIL import Image
+
+from src.client.main_client import (
+    build_turtle_atlas,
+    explored_curve_points,
+    quantize_angle,
+    rasterize_explored_regions,
+    turtle_sprite,
+)
+from src.server.admission import AdmissionController
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.leaderboard import Leaderboard
+from src.server.live_positions import LivePositions
+from src.server.player import Player
+from src.server.rate_limit import RateLimiter
+from src.server.scheduler import TimerScheduler
+from src.server.spectators import SpectatorHub
+from src.server.verification import parse_position, verify_scores
+from src.shared import compression
+from src.shared.direct_search import (
+    BatchGame,
+    CompassSearch,
+    FunctionBatch,
+    WindowDescent,
+    play,
+)
+from src.shared.function_bank import FunctionBank, build_bank, save_bank
+from src.shared.function_generator_claude import Difficulty, FunctionGenerator, HiddenFunction
+from src.shared.heatmap import HeatmapRasterizer
+from src.shared.progressive import curve_levels, heatmap_levels
+
+from .runner import register
+
+SEED = 12345
+
+
+class NullConnection:
+    """Socket stand-in that swallows everything sent to it."""
+
+    def sendall(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullWriter(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+
+def quiet(func):
+    """Wrap *func* so that its ``print`` output is discarded."""
+    sink = NullWriter()
+
+    def wrapper():
+        with contextlib.redirect_stdout(sink):
+            func()
+
+    return wrapper
+
+
+@register("generator")
+def generator_cases():
+    for dim in (1, 2):
+        for difficulty in Difficulty:
+            yield (
+                f"init.{dim}d.{difficulty.value}",
+                lambda dim=dim, difficulty=difficulty: HiddenFunction(
+                    SEED, dim=dim, difficulty=difficulty
+                ),
+            )
+
+            hf = HiddenFunction(SEED, dim=dim, difficulty=difficulty)
+            yield (
+                f"true_minimum.{dim}d.{difficulty.value}",
+                hf._compute_true_minimum,
+            )
+
+    # Functions of a 10-round game start: generated versus read from a bank
+    records = build_bank(range(SEED, SEED + 50), dim=2, difficulty=Difficulty.HARD, workers=1)
+    # Removed once the runner has timed the last case
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.npy")
+        save_bank(path, records)
+        bank = FunctionBank(path)
+        generated = FunctionGenerator(2, difficulty=Difficulty.HARD, base_seed=SEED)
+        banked = FunctionGenerator(2, difficulty=Difficulty.HARD, base_seed=SEED, bank=bank)
+        yield "game_start_10.2d.hard.generated", lambda: [generated.generate() for _ in range(10)]
+        yield "game_start_10.2d.hard.bank", lambda: [banked.generate() for _ in range(10)]
+        yield "bank_open", lambda: FunctionBank(path)
+
+
+@register("raw_eval")
+def raw_eval_cases():
+    hf1 = HiddenFunction(SEED, dim=1, difficulty=Difficulty.HARD)
+    hf2 = HiddenFunction(SEED, dim=2, difficulty=Difficulty.HARD)
+    lo, hi = hf1.domain
+
+    xs = np.linspace(lo, hi, 1000)
+    X, Y = np.meshgrid(np.linspace(lo, hi, 200), np.linspace(lo, hi, 200))
+
+    yield "1d.scalar", lambda: hf1._raw_eval(0.5)
+    yield "1d.vector_1000", lambda: hf1._raw_eval(xs)
+    yield "2d.scalar", lambda: hf2._raw_eval((0.5, -0.5))
+    yield "2d.vector_1000", lambda: hf2._raw_eval((xs, xs[::-1]))
+    yield "2d.grid_200x200", lambda: hf2._raw_eval((X, Y))
+
+    hf5 = HiddenFunction(SEED, dim=5, difficulty=Difficulty.HARD)
+    points = np.random.default_rng(SEED).uniform(lo, hi, size=(1000, 5))
+    yield "5d.batch_1000", lambda: hf5._eval_array(points)
+
+
+@register("direct_search")
+def direct_search_cases():
+    functions = [HiddenFunction(SEED + i, dim=2, difficulty=Difficulty.HARD) for i in range(1000)]
+    batch = FunctionBatch(functions)
+    points = np.random.default_rng(SEED).uniform(*batch.domain, size=(1000, 2))
+
+    # One point per function: a loop of scalar calls versus the padded batch
+    yield "evaluate_1000_seeds.loop", lambda: [
+        f._raw_eval(tuple(x)) for f, x in zip(functions, points)
+    ]
+    yield "evaluate_1000_seeds.batch", lambda: batch.evaluate(points)
+
+    # Whole 10-step rounds of 1000 games
+    yield "play_1000_games.compass", lambda: play(CompassSearch(), BatchGame(batch))
+    yield "play_1000_games.window", lambda: play(WindowDescent(), BatchGame(batch))
+
+
+@register("client_draw")
+def client_draw_cases():
+    hf1 = HiddenFunction(SEED, dim=1, difficulty=Difficulty.HARD)
+    hf2 = HiddenFunction(SEED, dim=2, difficulty=Difficulty.HARD)
+    domain = hf1.domain
+    width, height = 800, 600
+
+    # A typical end-of-round exploration: 10 steps with a 0.5 reveal radius
+    rng = np.random.default_rng(SEED)
+    centers = rng.uniform(domain[0] + 0.5, domain[1] - 0.5, size=(10, 2))
+    ranges_1d = sorted((x - 0.5, x + 0.5) for x in centers[:, 0])
+    ranges_2d = [(x - 0.5, x + 0.5, y - 0.5, y + 0.5) for x, y in centers]
+    z_range = (float(hf2.true_minimum["y"]), float(hf2.true_minimum["y"]) + 20.0)
+
+    def curve_points():
+        hf1.reset()  # evaluate() keeps a history that would grow across calls
+        explored_curve_points(hf1, domain, ranges_1d, 20.0, 300, width)
+
+    yield "1d.curve_points_10_ranges", curve_points
+    raster = HeatmapRasterizer(width, height)
+    yield (
+        "2d.raster_10_rects",
+        lambda: rasterize_explored_regions(
+            hf2, domain, ranges_2d, z_range, width, height, rasterizer=raster
+        ),
+    )
+
+    # Per-step turtle sprite: rotating on the fly versus an atlas lookup
+    turtle = Image.open("src/assets/tortue.png").convert("RGBA").resize((40, 30), Image.LANCZOS)
+    atlas = build_turtle_atlas(turtle)
+    yield "turtle_sprite.rotate", lambda: turtle_sprite(turtle, True, 23.7)
+    yield "turtle_sprite.atlas_lookup", lambda: atlas[(True, quantize_angle(23.7))]
+    yield "turtle_sprite.atlas_build", lambda: build_turtle_atlas(turtle)
+
+
+def _legacy_reveal_image(Z, width, height):
+    """The 2D reveal heatmap as it was built before the shared rasterizer."""
+    Z_min, Z_max = Z.min(), Z.max()
+    Z_norm = (Z - Z_min) / max(Z_max - Z_min, 1e-10)
+    R = (Z_norm * 255).astype(np.uint8)
+    G = np.zeros_like(R)
+    B = (255 - R).astype(np.uint8)
+    img_arr = np.flipud(np.stack([R, G, B], axis=2))
+    return Image.fromarray(img_arr, "RGB").resize((width, height), Image.NEAREST)
+
+
+@register("heatmap")
+def heatmap_cases():
+    hf2 = HiddenFunction(SEED, dim=2, difficulty=Difficulty.HARD)
+    xs = np.linspace(*hf2.domain, 200)
+    Z = hf2._raw_eval(np.meshgrid(xs, xs))
+    raster = HeatmapRasterizer(200, 200)
+
+    def lut_reveal():
+        raster.render_grid(Z)
+        return raster.ppm()
+
+    # Both stop before the Tk handoff, which needs a display: the legacy path
+    # then converts an 800x600 PIL image, the new one zooms a 200x200 PPM
+    yield "reveal_200.legacy_pil_800x600", lambda: _legacy_reveal_image(Z, 800, 600)
+    yield "reveal_200.lut_ppm", lut_reveal
+
+    # Reveal cost on the UI thread: the former synchronous 200x200 grid versus
+    # the first progressive level; the remaining levels run on a worker thread
+    raster_200 = HeatmapRasterizer(200, 200)
+
+    def sync_reveal():
+        raster_200.render_grid(hf2._raw_eval(np.meshgrid(xs, xs)))
+        return raster_200.ppm()
+
+    never = threading.Event()
+    yield "reveal.sync_200_grid", sync_reveal
+    yield "reveal.progressive_first_level", lambda: next(
+        heatmap_levels(hf2, hf2.domain, 800, 600, never)
+    )
+    yield "reveal.progressive_all_levels", lambda: list(
+        heatmap_levels(hf2, hf2.domain, 800, 600, never)
+    )
+
+    hf1 = HiddenFunction(SEED, dim=1, difficulty=Difficulty.HARD)
+    yield "reveal.curve_all_levels", lambda: list(
+        curve_levels(hf1, hf1.domain, 800, lambda ys: 300 - 40 * ys, never)
+    )
+
+
+def _players(n):
+    return [Player(f"p{i}", i, None) for i in range(n)]
+
+
+@register("leaderboard")
+def leaderboard_cases():
+    rng = np.random.default_rng(SEED)
+    for n in (10, 100, 1000, 10_000):
+        players = _players(n)
+        leaderboard = Leaderboard(players, 1)
+        for p, score in zip(players, rng.uniform(0, 10, n)):
+            leaderboard.update_function_score(p, 0, float(score))
+        yield (
+            f"update_player_scores.{n}",
+            lambda leaderboard=leaderboard: leaderboard.update_player_scores(0),
+        )
+        yield f"standings.{n}", leaderboard.standings
+
+
+@register("verification")
+def verification_cases():
+    rng = np.random.default_rng(SEED)
+    for dim in (1, 2):
+        hf = HiddenFunction(SEED, dim=dim, difficulty=Difficulty.HARD)
+        for n in (10, 500):
+            X = rng.uniform(*hf.domain, size=(n, dim))
+            positions = [",".join(str(c) for c in x) for x in X.tolist()]
+            claimed = hf._eval_points(X)
+            yield f"batch.{dim}d.{n}", lambda hf=hf, c=claimed, p=positions: verify_scores(hf, c, p)
+
+            def one_by_one(hf=hf, claimed=claimed, positions=positions):
+                for value, pos_str in zip(claimed.tolist(), positions):
+                    coords = parse_position(pos_str, hf.dim)
+                    x = coords[0] if hf.dim == 1 else coords
+                    abs(hf._raw_eval(x) - value)
+
+            yield f"per_player.{dim}d.{n}", one_by_one
+
+
+@register("scheduler")
+def scheduler_cases():
+    # Arming and cancelling a round deadline with many rounds' timers pending
+    for n in (10, 10_000):
+        scheduler = TimerScheduler()
+        for i in range(n):
+            scheduler.call_later(60.0 + i, print)
+
+        def arm_and_cancel(scheduler=scheduler):
+            scheduler.call_later(30.0, print).cancel()
+
+        yield f"arm_cancel.{n}", arm_and_cancel
+
+
+@register("live_positions")
+def live_positions_cases():
+    # 300 turtles streaming their moves
+    game = Game(dim=2, player_list=[], nb_round=1)
+    handler = ClientHandler(7, NullConnection(), ("127.0.0.1", 0), game, threading.Lock())
+    game.submissions = {7: False}
+    yield "handle_message.move", lambda: handler.handle_message("MOVE 1.25,-3.5")
+
+    live = LivePositions(dim=2)
+    for i in range(300):
+        live.update(i, (0.0, 0.0))
+    yield "update", lambda: live.update(150, (1.0, 2.0))
+    yield "snapshot.300", live.snapshot
+
+
+@register("compression")
+def compression_cases():
+    # A REVEAL broadcast to 300 players, compressed or not
+    n = 300
+    message = "REVEAL " + " ".join(f"player{i}|{i * 0.04 - 6:.6f},{i * 0.03 - 4:.6f}|{i * 0.011:.6f}" for i in range(n))
+    handlers = [ClientHandler(i, NullConnection(), ("127.0.0.1", 0), None, None) for i in range(n)]
+    compressed = [ClientHandler(i, NullConnection(), ("127.0.0.1", 0), None, None) for i in range(n)]
+    for handler in compressed:
+        handler.compression = compression.MODE
+
+    def broadcast(handlers):
+        compression.compressed_line.cache_clear()
+        for handler in handlers:
+            handler.send(message)
+
+    yield f"reveal_broadcast.plain.{n}", quiet(lambda: broadcast(handlers))
+    yield f"reveal_broadcast.zlib.{n}", quiet(lambda: broadcast(compressed))
+
+
+@register("rate_limit")
+def rate_limit_cases():
+    # A client flooding GAME messages, handled or dropped at the rate limit
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler = ClientHandler(1, NullConnection(), ("127.0.0.1", 0), game, threading.Lock())
+    limited = ClientHandler(
+        2, NullConnection(), ("127.0.0.1", 0), game, threading.Lock(), rate_limiter=RateLimiter()
+    )
+    quiet(lambda: [limited.handle_message("GAME") for _ in range(10)])()  # use up the burst
+    yield "handle_message.game", quiet(lambda: handler.handle_message("GAME"))
+    yield "handle_message.game.dropped", quiet(lambda: limited.handle_message("GAME"))
+    limiter = RateLimiter()
+    yield "allow", lambda: limiter.allow("MOVE")
+
+
+@register("admission")
+def admission_cases():
+    # The accept loop admitting a connection, and refusing one when full
+    admission = AdmissionController(max_sessions=1_000_000)
+
+    def admit_and_release():
+        admission.admit_connection()
+        admission.release_connection()
+
+    yield "admit_release", admit_and_release
+    full = AdmissionController(max_sessions=0)
+    yield "admit.full", full.admit_connection
+
+
+class NullHandler:
+    def __init__(self, id):
+        self.id = id
+
+    def send(self, message):
+        return True
+
+
+@register("spectators")
+def spectator_cases():
+    # A burst of 30 submissions watched by 50 spectators
+    players = _players(30)
+    game = Game(dim=1, player_list=list(players), nb_round=1)
+    game.spectators = hub = SpectatorHub(game, threading.Lock(), TimerScheduler(lambda: 0.0))
+    spectators = [NullHandler(i) for i in range(50)]
+    for spectator in spectators:
+        hub.subscribe(spectator)
+
+    def coalesced():
+        hub._last_flush = float("-inf")
+        for _ in players:
+            game.notify_change()
+        hub.scheduler.run_due()
+
+    def per_event():
+        for _ in players:
+            frame = hub.frame()
+            for spectator in spectators:
+                spectator.send(frame)
+
+    yield "burst.coalesced.30x50", coalesced
+    yield "burst.per_event.30x50", per_event
+
+
+@register("handler")
+def handler_cases():
+    lock = threading.Lock()
+    players = _players(50)
+    game = Game(dim=1, player_list=list(players), nb_round=1)
+    game.leaderboard = Leaderboard(game.player_list, 1)
+
+    handler = ClientHandler(1000, NullConnection(), ("127.0.0.1", 0), game, lock)
+    handler.player.update_username = lambda username: None
+
+    # A started game where this player already submitted: SCORE is parsed and
+    # dispatched but ignored, so the case can be repeated indefinitely.
+    game.player_list.append(handler.player)
+    game.leaderboard = Leaderboard(game.player_list, 1)
+    game.started = True
+    game.submissions = {p.id: True for p in game.player_list}
+
+    yield "handle_message.username", quiet(lambda: handler.handle_message("USERNAME p0"))
+    yield "handle_message.score", quiet(lambda: handler.handle_message("SCORE 1.2345 0.5"))
+    yield "handle_message.unknown", quiet(lambda: handler.handle_message("HELLO"))
+
+    game.started = False
+    yield "handle_message.game", quiet(lambda: handler.handle_message("GAME"))
@@ -0,0 +1,148 @@
+"""Timing, baseline storage and comparison for the benchmark suite.
+
+Benchmarks are registered with :func:`register`: each registered factory
+yields ``(name, callable)`` pairs. The runner calibrates how many calls fit
+in one timing sample, keeps the best and median time per call, and can save
+the results as a JSON baseline or compare them against one.
+"""
+
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+
+# (group, factory) pairs, in registration order
+REGISTRY = []
+
+
+def register(group):
+    """Register a factory yielding ``(name, callable)`` benchmark cases."""
+
+    def decorator(factory):
+        REGISTRY.append((group, factory))
+        return factory
+
+    return decorator
+
+
+def time_case(func, min_time=0.05, repeat=5):
+    """Time *func* and return per-call statistics in seconds.
+
+    The number of calls per sample is doubled until one sample takes at least
+    ``min_time`` seconds, then ``repeat`` samples are taken.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "best": min(samples),
+        "median": statistics.median(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def selects(group, pattern):
+    """
+    Whether *pattern* can select cases of *group*. Factories build their
+    cases' inputs (functions, banks, games), so the groups are filtered
+    before a factory runs: *pattern* must be part of the group name, or
+    start with the end of it followed by a dot (``handler.handle_message``).
+    """
+    if not pattern or pattern in group:
+        return True
+    head, dot, _ = pattern.partition(".")
+    return bool(dot) and group.endswith(head)
+
+
+def run(pattern=None, min_time=0.05, repeat=5, out=sys.stdout):
+    """Run every registered benchmark whose name contains *pattern*."""
+    results = {}
+    for group, factory in REGISTRY:
+        if not selects(group, pattern):
+            continue
+        for name, func in factory():
+            full_name = f"{group}.{name}"
+            if pattern and pattern not in full_name:
+                continue
+            stats = time_case(func, min_time=min_time, repeat=repeat)
+            results[full_name] = stats
+            print(f"{full_name:<55} {format_time(stats['best']):>10}", file=out)
+    return results
+
+
+def format_time(seconds):
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def environment():
+    import numpy
+    import scipy
+
+    return {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump({"meta": environment(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=1.25, out=sys.stdout):
+    """Print a comparison table and return the names of regressed benchmarks.
+
+    A benchmark regresses when its best time is more than ``threshold`` times
+    the baseline's best time.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<55} {'baseline':>10} {'current':>10} {'ratio':>7}", file=out)
+    for name, stats in results.items():
+        if name not in baseline:
+            print(f"{name:<55} {'-':>10} {format_time(stats['best']):>10} {'new':>7}", file=out)
+            continue
+        base = baseline[name]["best"]
+        ratio = stats["best"] / base if base > 0 else float("inf")
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        else:
+            flag = ""
+        print(
+            f"{name:<55} {format_time(base):>10} {format_time(stats['best']):>10} "
+            f"{ratio:>6.2f}x{flag}",
+            file=out,
+        )
+    return regressions
@@ -1,15 +1,29 @@
+from ..shared import compression
+from ..shared.lazy_import import StartupProfile, lazy_import, prefetch
+
+import argparse
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import font
 
 my_font = ("Segoe UI Symbol", 10)  # Police qui gère bien les flèches
+import queue
 import socket
 import threading
+import time
+import traceback
 import random
 import math
-from PIL import Image, ImageTk
-from ..shared.function_generator_claude import FunctionGenerator, Difficulty
-import numpy as np
+
+# Heavy modules, only needed once connected: imported on first use (or
+# prefetched while the connection window is shown)
+Image = lazy_import("PIL.Image")
+ImageTk = lazy_import("PIL.ImageTk")
+np = lazy_import("numpy")
+generator_module = lazy_import("..shared.function_generator_claude", __package__)
+heatmap = lazy_import("..shared.heatmap", __package__)
+function_bank = lazy_import("..shared.function_bank", __package__)
+progressive = lazy_import("..shared.progressive", __package__)
 
 # -------------------------
 # Global state
@@ -21,19 +35,35 @@ server_function_generator = None
 nb_round = None
 joined_game = False
 waiting_for_start = False
-waiting_for_func = False
 current_x = 0.0
 steps_left = None
 step_size = 1.0
 direction = 1
+function_bank_dir = None  # --function-bank: directory of prebuilt functions
+session_token = None  # issued with "USERNAME ok", to resume after a disconnection
+stream_moves = True  # send a MOVE at each step, for the Game Master's live map
+server_address = None
+
+# Reconnection attempts after the connection dropped, and seconds between them
+RESUME_ATTEMPTS = 10
+RESUME_DELAY = 1.0
 
 
 # -------------------------
 # Networking helpers
 # -------------------------
+send_lock = threading.Lock()  # the UI and the message reader both send
+
+
 def send(msg):
-    print(f"Sending {msg}")
-    sock.sendall((msg + "\n").encode())
+    if msg != "PONG":
+        print(f"Sending {msg}")
+    with send_lock:
+        try:
+            sock.sendall((msg + "\n").encode())
+        except OSError as e:
+            # The message reader notices the lost connection and resumes it
+            print(f"Could not send {msg}: {e}")
 
 
 buffer = ""  # Keep a buffer outside the function
@@ -49,11 +79,218 @@ def receive():
 
     # Split one complete message from the buffer
     line, buffer = buffer.split("\n", 1)
-    msg = line.strip().strip('"')
-    print(f"Got {msg}")
+    msg = compression.decode(line.strip().strip('"'))
+    if msg != "PING":
+        print(f"Got {msg}")
     return msg
 
 
+def resume_session():
+    """
+    Reconnect after the connection dropped and resume the session with its
+    token. Returns whether it worked; the server then replays the game state.
+    """
+    global sock, buffer
+    if session_token is None:
+        return False
+    for attempt in range(RESUME_ATTEMPTS):
+        time.sleep(RESUME_DELAY)
+        print(f"Reconnecting ({attempt + 1}/{RESUME_ATTEMPTS})...")
+        try:
+            new_sock = socket.create_connection(server_address, timeout=5)
+            new_sock.settimeout(None)
+        except OSError:
+            continue
+        with send_lock:
+            sock, buffer = new_sock, ""
+        send(f"RESUME {session_token}")
+        try:
+            reply = receive()
+        except (ConnectionError, OSError):
+            continue
+        if reply == "SERVER full":
+            continue  # try again once someone left
+        if reply != "RESUME ok":
+            return False
+        # The reply reaches the message reader, which ignores it
+        send(f"COMPRESS {compression.MODE}")
+        return True
+    return False
+
+
+def parse_game_start(msg):
+    """Settings of a ``GAME start`` message, as a dict."""
+    split_msg = msg.split()
+    domain_str = " ".join(split_msg[7:]).strip()
+    return {
+        "nb_round": int(split_msg[2]),
+        "dim": int(split_msg[3]),
+        "difficulty": generator_module.Difficulty[split_msg[4].upper()],
+        "steps": int(split_msg[5]),
+        "reveal_radius": float(split_msg[6]),
+        "domain": tuple(float(x.strip()) for x in domain_str.strip("()").split(",")),
+    }
+
+
+def function_value_range(function, domain, dim):
+    """(min, max) of a function sampled over its domain, for display scaling."""
+    if dim == 1:
+        values = function._raw_eval(np.linspace(*domain, 600))
+    else:
+        xs = np.linspace(domain[0], domain[1], 100)
+        X, Y = np.meshgrid(xs, xs)
+        values = function._raw_eval((X, Y))
+    return float(values.min()), float(values.max())
+
+
+class MessageReader:
+    """
+    The only thread reading the socket once logged in.
+
+    Every message is put on *inbox* as ``(msg, prepared)`` for the Tk thread
+    to handle. ``prepared`` holds the heavy work a message needs, done here
+    instead of on the UI thread: the settings and function generator of a
+    ``GAME start``, the generated function and its value range for a ``FUNC``.
+    The generator is owned by this thread, so the UI never races it. When the
+    connection is lost, the thread tries to resume the session; if it cannot,
+    ``(None, error)`` is queued and the thread ends. A message that cannot be
+    prepared is logged and skipped.
+    """
+
+    def __init__(self, inbox):
+        self.inbox = inbox
+        self.settings = None
+        self.generator = None
+        self.thread = threading.Thread(target=self.run, name="message-reader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                while True:
+                    msg = receive()
+                    if msg == "PING":
+                        send("PONG")  # heartbeat: answered here, the UI never sees it
+                        continue
+                    try:
+                        prepared = self.prepare(msg)
+                    except Exception:
+                        print(f"Malformed message ignored: {msg}")
+                        traceback.print_exc()
+                        continue
+                    self.inbox.put((msg, prepared))
+            except (ConnectionError, OSError) as e:
+                # The server replays the game state after a successful resume
+                if not resume_session():
+                    self.inbox.put((None, e))
+                    return
+
+    def prepare(self, msg):
+        if msg.startswith("GAME start"):
+            self.settings = parse_game_start(msg)
+            dim, difficulty, domain = (
+                self.settings["dim"],
+                self.settings["difficulty"],
+                self.settings["domain"],
+            )
+            bank = None
+            if function_bank_dir is not None:  # function_bank imports the calibration
+                bank = function_bank.open_bank(function_bank_dir, dim, difficulty, domain)
+            self.generator = generator_module.FunctionGenerator(
+                dim, difficulty=difficulty, domain=domain, bank=bank
+            )
+            return self.settings, self.generator
+        if msg.startswith("FUNC") and self.generator is not None:
+            function = self.generator.generate(int(msg.split()[1]))
+            value_range = function_value_range(
+                function, self.settings["domain"], self.settings["dim"]
+            )
+            return function, value_range
+        return None
+
+
+# Turtle sprite rotations are precomputed every SPRITE_ANGLE_STEP degrees
+SPRITE_ANGLE_STEP = 2
+
+
+def quantize_angle(angle_deg, step=SPRITE_ANGLE_STEP):
+    """Round an angle to the sprite atlas resolution, within [-90, 90]."""
+    return max(-90, min(90, int(round(angle_deg / step)) * step))
+
+
+def turtle_sprite(base, flipped, angle):
+    """The turtle image *base*, mirrored if *flipped*, rotated by *angle* degrees."""
+    img = base.transpose(Image.FLIP_LEFT_RIGHT) if flipped else base
+    return img.rotate(angle, resample=Image.BICUBIC, expand=True)
+
+
+def build_turtle_atlas(base, step=SPRITE_ANGLE_STEP):
+    """Every sprite of the turtle, keyed by (flipped, quantized angle)."""
+    return {
+        (flipped, angle): turtle_sprite(base, flipped, angle)
+        for flipped in (False, True)
+        for angle in range(-90, 91, step)
+    }
+
+
+def explored_curve_points(function, domain, explored_ranges, scale_y, mid_y, width):
+    """Return, for each explored 1D range, the canvas points of the curve."""
+    min_x, max_x = domain
+    scale_x = width / (max_x - min_x)
+
+    curves = []
+    for a, b in explored_ranges:
+        start_px = int((a - min_x) * scale_x)
+        end_px = int((b - min_x) * scale_x)
+        pxs = np.arange(start_px, end_px + 1)
+        ys = function._raw_eval(min_x + pxs / scale_x)
+        curves.append(list(zip(pxs.tolist(), (mid_y - ys * scale_y).tolist())))
+    return curves
+
+
+def rasterize_explored_regions(
+    function, domain, explored_ranges, z_range, width, height, rasterizer=None
+):
+    """Paint the revealed rectangles of a 2D function and return the RGB pixels.
+
+    ``z_range`` is the ``(min, max)`` used for colour normalisation; when its
+    minimum is ``None`` the range of the revealed values is used instead.
+    Unexplored areas are dark grey. Pass a ``width`` x ``height``
+    :class:`HeatmapRasterizer` to reuse its buffers across frames.
+    """
+    x_min, x_max = domain
+    y_min, y_max = domain
+    if rasterizer is None:
+        rasterizer = heatmap.HeatmapRasterizer(width, height)
+    rasterizer.clear()
+
+    # Evaluate all revealed rects and collect values for global normalisation
+    region_data = []
+    for a, b, c, d in explored_ranges:
+        px0 = int((a - x_min) / (x_max - x_min) * width)
+        px1 = int((b - x_min) / (x_max - x_min) * width)
+        py0 = int((1 - (d - y_min) / (y_max - y_min)) * height)
+        py1 = int((1 - (c - y_min) / (y_max - y_min)) * height)
+        w = max(px1 - px0, 1)
+        h = max(py1 - py0, 1)
+        xs = np.linspace(a, b, w)
+        ys = np.linspace(d, c, h)  # top→bottom in canvas = high y → low y
+        X, Y = np.meshgrid(xs, ys)
+        Z = function._raw_eval((X, Y))
+        region_data.append((px0, py0, Z))
+
+    if region_data:
+        g_min, g_max = z_range
+        if g_min is None:
+            g_min = min(float(Z.min()) for _, _, Z in region_data)
+            g_max = max(float(Z.max()) for _, _, Z in region_data)
+        for px0, py0, Z in region_data:
+            rasterizer.paint(Z, px0, py0, g_min, g_max)
+    return rasterizer.pixels
+
+
 # -------------------------
 # Connection window
 # -------------------------
@@ -79,7 +316,7 @@ class ConnectionWindow:
         )
 
     def connect(self):
-        global sock, username
+        global sock, username, session_token, server_address
 
         username = self.user_entry.get().strip()
         addr = self.addr_entry.get().strip()
@@ -99,11 +336,19 @@ class ConnectionWindow:
         send(f"USERNAME {username}")
         reply = receive()
 
-        if reply == "USERNAME ok":
+        if reply.startswith("USERNAME ok"):
+            token = reply.split()[2:]
+            session_token = token[0] if token else None
+            server_address = (addr, int(port))
+            # Large messages (REVEAL) compressed if the server agrees
+            send(f"COMPRESS {compression.MODE}")
+            receive()
             self.root.destroy()
             open_game_window()
         elif reply == "USERNAME taken":
             messagebox.showerror("Erreur", "Nom d'utilisateur déjà pris")
+        elif reply == "SERVER full":
+            messagebox.showerror("Erreur", "Serveur complet, réessayez plus tard")
         else:
             print(repr(reply), type(reply))
             messagebox.showerror("Erreur", f"Réponse serveur inconnue {reply}")
@@ -112,6 +357,10 @@ class ConnectionWindow:
 # -------------------------
 # Game window
 # -------------------------
+# Interval at which the Tk thread drains the message queue
+MESSAGE_POLL_MS = 15
+
+
 class GameWindow:
 
     # Canvas size
@@ -125,7 +374,20 @@ class GameWindow:
         self.turtle_pil = Image.open("src/assets/tortue.png").convert("RGBA")
         self.turtle_pil = self.turtle_pil.resize((40, 30), Image.LANCZOS)
         self.turtle_img = ImageTk.PhotoImage(self.turtle_pil)
-        self._rotated_turtle_img = None  # keep reference to avoid GC
+
+        # Rotated sprites: PIL images built in the background, PhotoImages
+        # created on first use (Tk objects belong to the UI thread) and kept,
+        # which also keeps them from being garbage collected
+        self._sprite_atlas = {}
+        self._sprite_photos = {(False, 0): self.turtle_img}
+        self._turtle_item = None
+        threading.Thread(target=self._build_sprite_atlas, daemon=True).start()
+
+        # Heatmap buffer of the 2D region view, reused from frame to frame
+        self._region_raster = None
+        # Progressive reveal of the full function, cancelled by a new round
+        self._reveal_render = None
+        self._reveal_img = None
         self.water_img = tk.PhotoImage(file="src/assets/water.png")
         self.sand_img = tk.PhotoImage(file="src/assets/beach.png")
 
@@ -182,6 +444,13 @@ class GameWindow:
         self.scale_y = 20
         self.plot_mid_y = self.c_height // 2
 
+        # Server messages, read on a single background thread and handled
+        # here on the Tk thread
+        self.inbox = queue.Queue()
+        self.closed = False  # set once the connection is lost for good
+        MessageReader(self.inbox).start()
+        self.root.after(MESSAGE_POLL_MS, self.process_messages)
+
     def bind_keys(self):
         # On nettoie d'abord les anciens binds
         self.root.unbind("<Up>")
@@ -203,27 +472,61 @@ class GameWindow:
         self.root.after(50, lambda: self.root.focus_force())
 
     def join_game(self):
-        global joined_game, waiting_for_start
+        global joined_game
 
         if joined_game or waiting_for_start:
             return  # ignore double click
 
+        # The reply is handled by dispatch() when it arrives
+        joined_game = True
         send("GAME")
-        reply = receive()
 
-        if reply == "GAME ok":
-            joined_game = True
+    def process_messages(self):
+        """Handle every queued server message, then poll again."""
+        while True:
+            try:
+                msg, prepared = self.inbox.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.dispatch(msg, prepared)
+            except Exception:
+                # One bad message must not stop the polling
+                print(f"Failed to handle {msg}")
+                traceback.print_exc()
+            if self.closed:
+                return  # the window is destroyed
+        self.root.after(MESSAGE_POLL_MS, self.process_messages)
+
+    def dispatch(self, msg, prepared):
+        global joined_game, waiting_for_start
+
+        if msg is None:
+            messagebox.showerror("Erreur", f"Connexion perdue : {prepared}")
+            self.closed = True
+            self.root.destroy()
+            return
+
+        if msg == "GAME ok":
             waiting_for_start = True
             self.show_waiting_message()
-            threading.Thread(target=self.wait_for_start, daemon=True).start()
-        elif reply.startswith("GAME start"):
-            # Server already started the game, handle immediately
-            joined_game = True
-            waiting_for_start = False
-            self.handle_game_start(reply)
-            threading.Thread(target=self.wait_for_func, daemon=True).start()
-        else:
+        elif msg == "GAME unavailable":
+            joined_game = False
             messagebox.showinfo("Info", "Partie indisponible")
+        elif msg == "GAME full":
+            joined_game = False
+            messagebox.showinfo("Info", "Partie complète")
+        elif msg.startswith("GAME start"):
+            # Also reached when the server had already started the game
+            waiting_for_start = False
+            self.handle_game_start(*prepared)
+        elif msg.startswith("FUNC") and prepared is not None:
+            self.start_round(*prepared)
+        elif msg.startswith("REVEAL"):
+            self.draw_reveal(self._parse_reveal(msg))
+            self.info_label.config(text="Fonction révélée !")
+        elif msg.startswith("GAME over"):
+            self.reset_client_game()
 
     def show_waiting_message(self):
         self.canvas.delete("all")
@@ -235,25 +538,23 @@ class GameWindow:
             fill="black",
         )
 
-    def handle_game_start(self, msg):
+    def handle_game_start(self, settings, generator):
         global server_function_generator, nb_round, steps_left, step_size
 
-        split_msg = msg.split()
-        nb_round = int(split_msg[2])
-        self.dim = int(split_msg[3])
-        difficulty_str = split_msg[4]
-        difficulty = Difficulty[difficulty_str.upper()]
-        self.steps_left_max = int(split_msg[5])
-        self.reveal_radius = float(split_msg[6])
-        step_size = 1.0
-        steps_left = self.steps_left_max
-        domain_str = " ".join(split_msg[7:]).strip()
-        domain = tuple(float(x.strip()) for x in domain_str.strip("()").split(","))
+        nb_round = settings["nb_round"]
+        self.dim = settings["dim"]
+        self.steps_left_max = settings["steps"]
+        self.reveal_radius = settings["reveal_radius"]
+        domain = settings["domain"]
 
-        server_function_generator = FunctionGenerator(
-            self.dim, difficulty=difficulty, domain=domain
-        )
+        server_function_generator = generator
+        self.bind_keys()
 
+        if server_function is not None:
+            return  # replayed after a resume: the round in progress keeps its state
+
+        step_size = 1.0
+        steps_left = self.steps_left_max
         if self.dim == 2:
             # Reset position to center of domain
             self.current_pos = [
@@ -262,29 +563,14 @@ class GameWindow:
             ]
         else:
             self.current_pos = [0.0]
-        self.bind_keys()
-
-    def wait_for_start(self):
-        global waiting_for_start
-
-        while True:
-            msg = receive()
-            print(f"Game start message is {msg}")
-
-            if msg.startswith("GAME start"):
-                waiting_for_start = False
-                self.handle_game_start(msg)
-                threading.Thread(target=self.wait_for_func, daemon=True).start()
-                return
 
     def reset_client_game(self):
-        global joined_game, waiting_for_start, waiting_for_func, step_size
+        global joined_game, waiting_for_start, step_size
         global server_function, server_function_generator
         global nb_round, steps_left, current_x
 
         joined_game = False
         waiting_for_start = False
-        waiting_for_func = False
 
         server_function = None
         server_function_generator = None
@@ -296,71 +582,44 @@ class GameWindow:
         step_size = 1.0
         self.explored_ranges = []
 
+        self.cancel_reveal()
         self.canvas.delete("all")
         self.info_label.config(text="Pas restants: -")
         self.info_step.config(text="Taille de pas: 1")
 
         print("Client game state reset, waiting for join")
 
-    def wait_for_func(self):
-        global server_function, waiting_for_func
+    def start_round(self, function, value_range):
+        """Start a round on a function prepared by the message reader."""
+        global server_function, steps_left, step_size
 
-        if waiting_for_func:
+        if server_function is not None and function.seed == server_function.seed:
+            # Replayed after a resume: keep the steps left and the position
+            server_function = function
             return
 
-        waiting_for_func = True
-
-        while True:
-            msg = receive()
-
-            if msg.startswith("FUNC"):
-                seed = int(msg.split()[1])
-                server_function = server_function_generator.generate(seed)
-
-                global steps_left, step_size
-                steps_left = self.steps_left_max
-                step_size = 1.0
-                self.current_pos = [0.0, 0.0]
-                self.explored_ranges = []
-
-                # Compute adaptive scaling from the full function range
-                if self.dim == 1:
-                    _xs = np.linspace(*server_function_generator._domain, 600)
-                    _ys = server_function._raw_eval(_xs)
-                    _f_min, _f_max = float(_ys.min()), float(_ys.max())
-                    _f_range = _f_max - _f_min if _f_max != _f_min else 1.0
-                    _margin = self.c_height * 0.12
-                    self.scale_y = (self.c_height - 2 * _margin) / _f_range
-                    self.plot_mid_y = int(_margin + _f_max * self.scale_y)
-                else:
-                    _lo, _hi = server_function_generator._domain
-                    _xs = np.linspace(_lo, _hi, 100)
-                    _X, _Y = np.meshgrid(_xs, _xs)
-                    _Z = server_function._raw_eval((_X, _Y))
-                    self.func_z_min = float(_Z.min())
-                    self.func_z_max = float(_Z.max())
-
-                self.reveal_at(self.current_pos)
-                self.draw_region()
-                self.info_label.config(text=f"Pas restants: {steps_left}")
-                self.info_step.config(text="Taille de pas: 1.0")
-
-                # Stay in the loop: keep listening during the round so a
-                # mid-round GAME over (Force Finish) is caught immediately.
-                continue
+        self.cancel_reveal()
+        server_function = function
+        steps_left = self.steps_left_max
+        step_size = 1.0
+        self.current_pos = [0.0, 0.0]
+        self.explored_ranges = []
 
-            if msg.startswith("REVEAL"):
-                players_data = self._parse_reveal(msg)
-                self.root.after(0, lambda d=players_data: self.draw_reveal(d))
-                self.root.after(
-                    0, lambda: self.info_label.config(text="Fonction révélée !")
-                )
-                continue  # keep waiting for FUNC or GAME over
+        # Adaptive scaling from the full function range
+        f_min, f_max = value_range
+        if self.dim == 1:
+            f_range = f_max - f_min if f_max != f_min else 1.0
+            margin = self.c_height * 0.12
+            self.scale_y = (self.c_height - 2 * margin) / f_range
+            self.plot_mid_y = int(margin + f_max * self.scale_y)
+        else:
+            self.func_z_min = f_min
+            self.func_z_max = f_max
 
-            if msg.startswith("GAME over"):
-                waiting_for_func = False
-                self.reset_client_game()
-                return
+        self.reveal_at(self.current_pos)
+        self.draw_region()
+        self.info_label.config(text=f"Pas restants: {steps_left}")
+        self.info_step.config(text="Taille de pas: 1.0")
 
     def reveal_at(self, pos):
         if self.dim == 1:
@@ -397,8 +656,33 @@ class GameWindow:
 
         return merged
 
+    def _build_sprite_atlas(self):
+        self._sprite_atlas = build_turtle_atlas(self.turtle_pil)
+
+    def turtle_photo(self, flipped, angle_deg):
+        """PhotoImage of the turtle for a direction and slope angle."""
+        key = (flipped, quantize_angle(angle_deg))
+        photo = self._sprite_photos.get(key)
+        if photo is None:
+            sprite = self._sprite_atlas.get(key)
+            if sprite is None:  # atlas still being built
+                sprite = turtle_sprite(self.turtle_pil, *key)
+            photo = self._sprite_photos[key] = ImageTk.PhotoImage(sprite)
+        return photo
+
+    def place_turtle(self, x, y, flipped=False, angle_deg=0.0):
+        """Move the persistent turtle canvas item, creating it if needed."""
+        photo = self.turtle_photo(flipped, angle_deg)
+        if self._turtle_item is None or not self.canvas.type(self._turtle_item):
+            self._turtle_item = self.canvas.create_image(x, y, image=photo, tags="turtle")
+        else:
+            self.canvas.coords(self._turtle_item, x, y)
+            self.canvas.itemconfig(self._turtle_item, image=photo)
+            self.canvas.tag_raise(self._turtle_item)
+
     def draw_region(self):
-        self.canvas.delete("all")
+        # Everything but the turtle, which is moved instead of recreated
+        self.canvas.delete("!turtle")
 
         if self.dim == 1:
 
@@ -416,80 +700,42 @@ class GameWindow:
             scale_y = self.scale_y
             mid_y = self.plot_mid_y
 
-            for a, b in self.explored_ranges:
-                start_px = int((a - min_x) * scale_x)
-                end_px = int((b - min_x) * scale_x)
-                prev = None
-                for px in range(start_px, end_px + 1):
-                    x = min_x + px / scale_x
-                    y = server_function.evaluate(x)
-                    py = mid_y - y * scale_y
-                    if prev is not None:
-                        self.canvas.create_line(prev[0], prev[1], px, py)
-                    prev = (px, py)
+            for points in explored_curve_points(
+                server_function,
+                server_function_generator._domain,
+                self.explored_ranges,
+                scale_y,
+                mid_y,
+                self.c_width,
+            ):
+                for prev, cur in zip(points, points[1:]):
+                    self.canvas.create_line(prev[0], prev[1], cur[0], cur[1])
 
             turtle_x = int((self.current_pos[0] - min_x) * scale_x)
-            turtle_y = mid_y - server_function.evaluate(self.current_pos[0]) * scale_y
-
-            # Compute slope for rotation
-            eps = 0.01
-            x0 = self.current_pos[0]
-            slope = (
-                server_function.evaluate(x0 + eps) - server_function.evaluate(x0 - eps)
-            ) / (2 * eps)
-            angle_deg = math.degrees(math.atan(slope * scale_y / scale_x))
+            turtle_y = mid_y - server_function._raw_eval(self.current_pos[0]) * scale_y
 
-            # Flip turtle image if going left
-            img = self.turtle_pil
-            if self.direction in ("left", "down"):
-                img = img.transpose(Image.FLIP_LEFT_RIGHT)
-
-            rotated = img.rotate(angle_deg, resample=Image.BICUBIC, expand=True)
-            self._rotated_turtle_img = ImageTk.PhotoImage(rotated)
-            self.canvas.create_image(
-                turtle_x, turtle_y - 13, image=self._rotated_turtle_img
-            )
+            # Exact slope for rotation, flipped if going left
+            slope = server_function.gradient(self.current_pos[0])
+            angle_deg = math.degrees(math.atan(slope * scale_y / scale_x))
+            flipped = self.direction in ("left", "down")
+            self.place_turtle(turtle_x, turtle_y - 13, flipped, angle_deg)
 
         else:
             x_min, x_max = server_function_generator._domain
             y_min, y_max = server_function_generator._domain
 
-            # Dark-grey base image for unexplored areas
-            img_arr = np.full((self.c_height, self.c_width, 3), 30, dtype=np.uint8)
-
-            # Evaluate all revealed rects and collect values for global normalisation
-            region_data = []
-            all_vals = []
-            for a, b, c, d in self.explored_ranges:
-                px0 = int((a - x_min) / (x_max - x_min) * self.c_width)
-                px1 = int((b - x_min) / (x_max - x_min) * self.c_width)
-                py0 = int((1 - (d - y_min) / (y_max - y_min)) * self.c_height)
-                py1 = int((1 - (c - y_min) / (y_max - y_min)) * self.c_height)
-                w = max(px1 - px0, 1)
-                h = max(py1 - py0, 1)
-                xs = np.linspace(a, b, w)
-                ys = np.linspace(d, c, h)  # top→bottom in canvas = high y → low y
-                X, Y = np.meshgrid(xs, ys)
-                Z = server_function._raw_eval((X, Y))
-                region_data.append((px0, py0, w, h, Z))
-                all_vals.append(Z.ravel())
-
-            if all_vals:
-                g_min = getattr(self, "func_z_min", None)
-                g_max = getattr(self, "func_z_max", None)
-                if g_min is None:
-                    flat = np.concatenate(all_vals)
-                    g_min, g_max = float(flat.min()), float(flat.max())
-                val_range = max(g_max - g_min, 1e-10)
-                for px0, py0, w, h, Z in region_data:
-                    Z_norm = (Z - g_min) / val_range
-                    R = (Z_norm * 255).astype(np.uint8)
-                    G = np.zeros_like(R)
-                    B = (255 - R).astype(np.uint8)
-                    img_arr[py0 : py0 + h, px0 : px0 + w] = np.stack([R, G, B], axis=2)
-
-            img = Image.fromarray(img_arr, "RGB")
-            self._region_img = ImageTk.PhotoImage(img)
+            if self._region_raster is None:
+                self._region_raster = heatmap.HeatmapRasterizer(self.c_width, self.c_height)
+            rasterize_explored_regions(
+                server_function,
+                server_function_generator._domain,
+                self.explored_ranges,
+                (getattr(self, "func_z_min", None), getattr(self, "func_z_max", None)),
+                self.c_width,
+                self.c_height,
+                rasterizer=self._region_raster,
+            )
+            self._region_img = self._region_raster.photo()
             self.canvas.create_image(0, 0, anchor="nw", image=self._region_img)
 
             # Draw turtle
@@ -497,8 +743,7 @@ class GameWindow:
             ty = int(
                 (1 - (self.current_pos[1] - y_min) / (y_max - y_min)) * self.c_height
             )
-            self._rotated_turtle_img = ImageTk.PhotoImage(self.turtle_pil)
-            self.canvas.create_image(tx, ty - 13, image=self._rotated_turtle_img)
+            self.place_turtle(tx, ty - 13)
 
     def show_round_end(self, score):
         self.canvas.create_text(
@@ -579,9 +824,25 @@ class GameWindow:
             font=("Arial", 22, "bold"),
         )
 
+    def cancel_reveal(self):
+        """Stop refining the reveal of the previous round, if still running."""
+        if self._reveal_render is not None:
+            self._reveal_render.cancel()
+
+    def start_reveal_render(self, levels, on_level):
+        if self._reveal_render is None:
+            self._reveal_render = progressive.ProgressiveRenderer(self.root)
+        self._reveal_render.start(levels, on_level)
+
     def draw_reveal(self, players_data):
-        """Draw the full function with true minimum and all players' final positions."""
+        """
+        Draw the full function with true minimum and all players' final positions.
 
+        The function is drawn coarse first and refined in the background up to
+        one point per canvas pixel; the markers stay on top of it.
+        """
+
+        self.cancel_reveal()
         self.canvas.delete("all")
 
         PLAYER_COLORS = [
@@ -610,11 +871,26 @@ class GameWindow:
                 image=self.sand_img,
             )
 
-            # Draw full function curve
-            xs = np.linspace(min_x, max_x, self.c_width)
-            ys = server_function._raw_eval(xs)
-            pts = [(int(px), int(mid_y - ys[px] * scale_y)) for px in range(len(xs))]
-            self.canvas.create_line(pts, fill="royalblue", width=2)
+            # Full function curve, refined in place
+            curve = None
+
+            def show_curve(coords):
+                nonlocal curve
+                if curve is None:
+                    curve = self.canvas.create_line(*coords, fill="royalblue", width=2)
+                else:
+                    self.canvas.coords(curve, *coords)
+
+            self.start_reveal_render(
+                lambda cancel: progressive.curve_levels(
+                    server_function,
+                    server_function_generator._domain,
+                    self.c_width,
+                    lambda ys: mid_y - ys * scale_y,
+                    cancel,
+                ),
+                show_curve,
+            )
 
             # True minimum star
             m = server_function._true_minimum
@@ -653,25 +929,28 @@ class GameWindow:
             scale_x = self.c_width / (x_max - x_min)
             scale_y = self.c_height / (y_max - y_min)
 
-            # Build full heatmap via numpy
-            n = 200
-            xs = np.linspace(x_min, x_max, n)
-            ys = np.linspace(y_min, y_max, n)
-            X, Y = np.meshgrid(xs, ys)
-            Z = server_function._raw_eval((X, Y))
-
-            Z_min, Z_max = Z.min(), Z.max()
-            Z_norm = (Z - Z_min) / max(Z_max - Z_min, 1e-10)
-
-            R = (Z_norm * 255).astype(np.uint8)
-            G = np.zeros_like(R)
-            B = (255 - R).astype(np.uint8)
-            img_arr = np.flipud(np.stack([R, G, B], axis=2))
-            img = Image.fromarray(img_arr, "RGB").resize(
-                (self.c_width, self.c_height), Image.NEAREST
+            # Full heatmap, enlarged to the canvas by Tk until the last level
+            image = None
+
+            def show_heatmap(level):
+                nonlocal image
+                ppm, zoom = level
+                self._reveal_img = heatmap.ppm_photo(ppm, zoom)
+                if image is None:
+                    image = self.canvas.create_image(0, 0, anchor="nw", image=self._reveal_img)
+                else:
+                    self.canvas.itemconfig(image, image=self._reveal_img)
+
+            self.start_reveal_render(
+                lambda cancel: progressive.heatmap_levels(
+                    server_function,
+                    server_function_generator._domain,
+                    self.c_width,
+                    self.c_height,
+                    cancel,
+                ),
+                show_heatmap,
             )
-            self._reveal_img = ImageTk.PhotoImage(img)
-            self.canvas.create_image(0, 0, anchor="nw", image=self._reveal_img)
 
             # True minimum star
             m = server_function._true_minimum
@@ -768,16 +1047,21 @@ class GameWindow:
         steps_left -= 1
         self.info_label.config(text=f"Pas restants: {steps_left}")
 
-        if steps_left == 0:
+        if self.dim == 1:
+            pos_arg = str(self.current_pos[0])
+        else:
+            pos_arg = f"{self.current_pos[0]},{self.current_pos[1]}"
+
+        if steps_left > 0:
+            if stream_moves:
+                send(f"MOVE {pos_arg}")
+        else:
             if self.dim == 1:
-                pos_arg = str(self.current_pos[0])
                 score = server_function.evaluate(self.current_pos[0])
             else:
-                pos_arg = f"{self.current_pos[0]},{self.current_pos[1]}"
                 score = server_function.evaluate(self.current_pos)
             send(f"SCORE {score} {pos_arg}")
             self.show_round_end(score)
-            threading.Thread(target=self.wait_for_func, daemon=True).start()
 
 
 # -------------------------
@@ -789,7 +1073,45 @@ def open_game_window():
     root.mainloop()
 
 
+def wait_for_prefetch(root, thread, profile):
+    """Report the startup profile once the background imports are done."""
+    if thread.is_alive():
+        root.after(50, wait_for_prefetch, root, thread, profile)
+        return
+    profile.mark("game modules prefetched")
+    profile.report(budget_mark="connection window shown")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Direct search for turtles client")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print import and initialisation timings at startup",
+    )
+    parser.add_argument(
+        "--function-bank",
+        default=None,
+        help="Directory of function banks (src.shared.function_bank) to read functions from",
+    )
+    parser.add_argument(
+        "--no-stream-moves",
+        action="store_true",
+        help="Do not send the position at each step (the Game Master's live map)",
+    )
+    args = parser.parse_args()
+    function_bank_dir = args.function_bank
+    stream_moves = not args.no_stream_moves
+    profile = StartupProfile(args.profile_startup)
+    profile.mark("modules imported")
+
     root = tk.Tk()
     ConnectionWindow(root)
+    root.update_idletasks()
+    profile.mark("connection window shown")
+
+    # Load the game dependencies while the user fills in the form
+    thread = prefetch(np, Image, ImageTk, generator_module, heatmap)
+    if args.profile_startup:
+        wait_for_prefetch(root, thread, profile)
     root.mainloop()
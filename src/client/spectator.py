@@ -0,0 +1,138 @@
+"""Read-only spectator screen, to project a game for the room.
+
+Shows the round state and the live standings sent by the server in ``STATE``
+frames, without taking part in the game::
+
+    python -m src.client.spectator <host> <port>
+"""
+
+import argparse
+import queue
+import socket
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+from ..shared import compression
+
+# Interval at which the Tk thread drains the frame queue
+FRAME_POLL_MS = 50
+
+
+def parse_state(msg):
+    """Fields of a ``STATE`` frame, as a dict."""
+    parts = msg.split(" ")
+    standings = []
+    for entry in parts[6:]:
+        name, points, done = entry.rsplit("|", 2)
+        standings.append((name, int(points), done == "1"))
+    return {
+        "status": parts[1],
+        "round": int(parts[2]),
+        "nb_round": int(parts[3]),
+        "submitted": int(parts[4]),
+        "players": int(parts[5]),
+        "standings": standings,
+    }
+
+
+class SpectatorConnection:
+    """
+    Subscribes to a game and reads its frames on a background thread.
+    Only the newest frame is kept for the UI; heartbeats are answered here.
+    """
+
+    def __init__(self, host, port):
+        self.sock = socket.create_connection((host, port))
+        self.frames = queue.Queue(maxsize=1)
+        self.error = None
+        self.sock.sendall(f"COMPRESS {compression.MODE}\nSPECTATE\n".encode())
+        self.thread = threading.Thread(target=self.run, name="spectator-reader", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        buffer = b""
+        try:
+            while True:
+                data = self.sock.recv(4096)
+                if not data:
+                    raise ConnectionError("Server closed the connection")
+                *lines, buffer = (buffer + data).split(b"\n")
+                for line in lines:
+                    self.handle(compression.decode(line.decode().strip().strip('"')))
+        except (ConnectionError, OSError) as e:
+            self.error = e
+
+    def handle(self, msg):
+        if msg == "PING":
+            self.sock.sendall(b"PONG\n")
+        elif msg.startswith("STATE"):
+            # Replace a frame the UI has not shown yet
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                pass
+            self.frames.put(parse_state(msg))
+        elif msg == "SERVER full" or (msg.startswith("SPECTATE") and msg != "SPECTATE ok"):
+            raise ConnectionError(f"Refused by the server: {msg}")
+
+
+class SpectatorWindow:
+    def __init__(self, root, connection):
+        self.root = root
+        self.connection = connection
+        self.root.title("Direct search for turtles — spectateur")
+
+        self.label_status = tk.Label(
+            root, text="Connexion...", font=("Arial", 32, "bold"), fg="white", bg="black"
+        )
+        self.label_status.pack(fill="x")
+
+        self.tree = ttk.Treeview(root, columns=("name", "score", "done"), show="headings")
+        self.tree.heading("name", text="Joueur")
+        self.tree.heading("score", text="Points")
+        self.tree.heading("done", text="Soumis")
+        self.tree.pack(fill="both", expand=True)
+
+        style = ttk.Style()
+        style.configure("Treeview", font=("Arial", 28), rowheight=48)
+        style.configure("Treeview.Heading", font=("Arial", 32, "bold"))
+
+        self.poll()
+
+    def poll(self):
+        try:
+            self.render(self.connection.frames.get_nowait())
+        except queue.Empty:
+            pass
+        if self.connection.error is not None:
+            self.label_status.config(text=f"Déconnecté : {self.connection.error}")
+            return
+        self.root.after(FRAME_POLL_MS, self.poll)
+
+    def render(self, state):
+        if state["status"] == "lobby":
+            text = f"En attente de la partie ({state['players']} joueurs)"
+        elif state["status"] == "round_over":
+            text = f"Round {state['round']}/{state['nb_round']} terminé"
+        else:
+            text = (
+                f"Round {state['round']}/{state['nb_round']} — "
+                f"{state['submitted']}/{state['players']} soumissions"
+            )
+        self.label_status.config(text=text)
+
+        self.tree.delete(*self.tree.get_children())
+        for name, points, done in state["standings"]:
+            self.tree.insert("", "end", values=(name, points, "✅" if done else "⏳"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Direct search for turtles spectator screen")
+    parser.add_argument("host", help="Server address")
+    parser.add_argument("port", type=int, help="Server port")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    SpectatorWindow(root, SpectatorConnection(args.host, args.port))
+    root.mainloop()
@@ -0,0 +1,72 @@
+import threading
+
+# Connections handled at once (players, spectators and the Game Master)
+MAX_SESSIONS = 200
+
+# Players in one game
+MAX_PLAYERS = 100
+
+# Sent to a connection refused at accept time, before closing it
+FULL_MESSAGE = b'"SERVER full"\n'
+
+
+class AdmissionController:
+    """
+    Caps the number of live connections (one handler thread each) and of
+    players per game, so that an overloaded server refuses newcomers instead
+    of running out of threads and memory.
+
+    The accept loop calls :meth:`admit_connection` before starting a handler
+    thread and :meth:`release_connection` when the thread ends; ``GAME``
+    calls :meth:`admit_player` under the game lock. Refusals are counted per
+    reason for the Game Master and the metrics.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS, max_players=MAX_PLAYERS, metrics=None):
+        self.max_sessions = max_sessions
+        self.max_players = max_players
+        self.metrics = metrics
+        self.active = 0
+        self.peak = 0
+        self.rejected_sessions = 0
+        self.rejected_players = 0
+        self._lock = threading.Lock()
+
+    def admit_connection(self) -> bool:
+        """Count a new connection in, unless the server is full."""
+        with self._lock:
+            if self.active >= self.max_sessions:
+                self.rejected_sessions += 1
+                admitted = False
+            else:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                admitted = True
+        if not admitted and self.metrics:
+            self.metrics.inc("admission_rejected", (("reason", "sessions"),))
+        return admitted
+
+    def release_connection(self):
+        with self._lock:
+            self.active -= 1
+
+    def admit_player(self, game) -> bool:
+        """Whether one more player may join *game* (to call under the game lock)."""
+        if len(game.player_list) < self.max_players:
+            return True
+        with self._lock:
+            self.rejected_players += 1
+        if self.metrics:
+            self.metrics.inc("admission_rejected", (("reason", "players"),))
+        return False
+
+
+def reject(connection):
+    """Tell a connection refused at accept time that the server is full, and close it."""
+    try:
+        connection.settimeout(1.0)
+        connection.sendall(FULL_MESSAGE)
+    except OSError:
+        pass
+    finally:
+        connection.close()
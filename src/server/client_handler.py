@@ -1,7 +1,58 @@
+import socket
+import threading
+import time
+
 from .player import Player
+from ..shared import compression
+from .verification import parse_position
+
+# Message types with their own latency histogram; anything else is "UNKNOWN"
+KNOWN_CODES = (
+    "USERNAME", "GAME", "SCORE", "STATS", "RESUME", "SPECTATE", "MOVE", "COMPRESS",
+)
+
+# Frequent messages not echoed to the console
+QUIET_CODES = ("MOVE",)
+
+# Addresses allowed to send Game Master commands (the GM runs on the server host)
+GM_ADDRESSES = ("127.0.0.1", "::1", "localhost")
+
+# A client message longer than this without a newline closes the connection
+MAX_MESSAGE_BYTES = 64 * 1024
+
+
+class TimedLock:
+    """
+    Context manager around the game lock that adds the time spent waiting
+    for it to its handler's ``_lock_wait``.
+    """
+
+    def __init__(self, lock, handler):
+        self.lock = lock
+        self.handler = handler
+
+    def __enter__(self):
+        start = time.perf_counter()
+        self.lock.acquire()
+        self.handler._lock_wait += time.perf_counter() - start
+
+    def __exit__(self, *exc):
+        self.lock.release()
+
 
 class ClientHandler:
-    def __init__(self, id: int, connection, addr, game, lock):
+    def __init__(
+        self,
+        id: int,
+        connection,
+        addr,
+        game,
+        lock,
+        stats=None,
+        metrics=None,
+        sessions=None,
+        rate_limiter=None,
+    ):
         self.id = id
         self.connection = connection
         self.addr = addr
@@ -10,16 +61,42 @@ class ClientHandler:
         self.lock = lock
         self.current_round = 0
         self.running = True
+        self.stats = stats
+        self.metrics = metrics
+        self._lock_wait = 0.0
+        self.game_lock = TimedLock(lock, self)
+        # Heartbeats: the registry pings and reaps on last_seen
+        self.sessions = sessions
+        self.clock = sessions.clock if sessions is not None else time.monotonic
+        self.last_seen = self.clock()
+        self.token = None  # session token, issued at login
+        self.spectating = False  # read-only connection, sent STATE frames
+        self.compression = None  # negotiated with COMPRESS
+        self.rate_limiter = rate_limiter  # checked before anything else, lock included
+        self._send_lock = threading.Lock()  # broadcasts and pings come from several threads
 
     def run(self):
+        if self.metrics:
+            self.metrics.inc("connections_opened")
+        if self.sessions is not None:
+            self.sessions.register(self)
+        buffer = b""
         try:
             while self.running:
-                data = self.connection.recv(1024)
+                data = self.connection.recv(4096)
                 if not data:
                     break
+                self.last_seen = self.clock()
 
-                message = data.decode().strip()
-                self.handle_message(message)
+                # Messages end with a newline; a recv may hold several, or part of one
+                *lines, buffer = (buffer + data).split(b"\n")
+                if len(buffer) > MAX_MESSAGE_BYTES:
+                    print(f"Player {self.id} sent an oversized message, closing the connection")
+                    break
+                for line in lines:
+                    message = line.decode().strip()
+                    if message:
+                        self.handle_message(message)
 
         except Exception as e:
             # Optional: log the error
@@ -27,29 +104,103 @@ class ClientHandler:
 
         finally:
             self.running = False
+            if self.sessions is not None:
+                self.sessions.unregister(self)
+            if self.stats:
+                self.stats.retire_thread()
+            if self.metrics:
+                self.metrics.inc("connections_closed")
             self.connection.close()
-            # Remove the player from the game
+            # Remove the player from the game, or keep it for a RESUME
             if self.game:
                 with self.lock:  # if your game uses a lock for thread safety
-                    self.game.remove_player(self.player)
+                    self._leave()
+            if self.metrics:
+                # Last, after the metrics recorded on the way out
+                self.metrics.retire_thread()
             print(f"Player {self.id} has left the game")
 
+    def _leave(self):
+        """The connection ended (called under the game lock)."""
+        if self.spectating:
+            self.game.spectators.unsubscribe(self)
+            return
+        if self.player.handler is not self:
+            return  # the session was resumed on another connection
+        if (
+            self.token is not None
+            and self.player in self.game.player_list
+            and self.sessions.detach(self.token, self._expire_session)
+        ):
+            print(f"Player {self.player.id} disconnected, keeping its place for a RESUME")
+            return
+        if self.token is not None:
+            self.sessions.forget(self.token)
+        self.game.remove_player(self.player)
+
+    def _expire_session(self):
+        """Scheduler callback: the player did not come back in time."""
+        with self.lock:
+            if self.player.handler is self:
+                print(f"Session of player {self.player.id} expired")
+                self.game.remove_player(self.player)
+
     def handle_message(self, message: str):
+        start = time.perf_counter()
+        self._lock_wait = 0.0
+
         parts = message.split(" ")
         code = parts[0]
         args = parts[1:]
 
-        print(f"Connection {self.id} sends {message}")
+        if self.rate_limiter is not None and not self.rate_limiter.allow(code):
+            self._drop(code)
+            return
+
+        if code == "PONG":
+            return  # heartbeat reply: receiving it already refreshed last_seen
 
-        if code == "USERNAME":
+        if code not in QUIET_CODES:
+            print(f"Connection {self.id} sends {message}")
+
+        if self.spectating and code not in ("STATS", "COMPRESS"):
+            self.send("ERROR spectator")
+        elif code == "USERNAME":
             self.handle_username(args)
         elif code == "GAME":
             self.handle_game()
         elif code == "SCORE":
             self.handle_score(args)
+        elif code == "STATS":
+            self.handle_stats()
+        elif code == "RESUME":
+            self.handle_resume(args)
+        elif code == "SPECTATE":
+            self.handle_spectate()
+        elif code == "MOVE":
+            self.handle_move(args)
+        elif code == "COMPRESS":
+            self.handle_compress(args)
         else:
             self.send("ERROR unknown")
 
+        if self.stats:
+            self.stats.record(
+                code if code in KNOWN_CODES else "UNKNOWN",
+                time.perf_counter() - start,
+                self._lock_wait,
+            )
+
+    def _drop(self, code):
+        """Count a message over the rate limit (dropped silently, without a reply)."""
+        code = code if code in KNOWN_CODES or code == "PONG" else "UNKNOWN"
+        if self.rate_limiter.dropped == 1:
+            print(f"Connection {self.id} exceeds its rate limit, dropping messages")
+        if self.stats:
+            self.stats.record_dropped(code)
+        if self.metrics:
+            self.metrics.inc("messages_rate_limited", (("type", code),))
+
     def handle_username(self, args):
         if not args:
             self.send("USERNAME taken")
@@ -57,24 +208,97 @@ class ClientHandler:
 
         username = args[0]
 
-        with self.lock:
+        with self.game_lock:
             for p in self.game.player_list:
                 if p.username == username:
                     self.send("USERNAME taken")
                     return
 
             self.player.update_username(username)
-            self.send("USERNAME ok")
+            if self.sessions is None:
+                self.send("USERNAME ok")
+                return
+            if self.token is not None:
+                self.sessions.forget(self.token)
+            self.token = self.sessions.issue(self.player)
+            self.send(f"USERNAME ok {self.token}")
+
+    def handle_compress(self, args):
+        """Agree on compressing the large messages sent to this client."""
+        if compression.MODE in args:
+            self.compression = compression.MODE
+            self.send(f"COMPRESS {compression.MODE}")
+        else:
+            self.compression = None
+            self.send("COMPRESS none")
+
+    def handle_move(self, args):
+        """
+        Live position of the player during a round, for the Game Master's
+        map. Fire and forget: no reply, and the game lock is not taken.
+        """
+        # Only while the player is in the round and has not submitted yet
+        if not args or self.game.submissions.get(self.player.id) is not False:
+            return
+        coords = parse_position(args[0], self.game.live_positions.dim)
+        if coords is not None:
+            self.game.live_positions.update(self.player.id, coords)
+
+    def handle_spectate(self):
+        """Turn this connection into a read-only spectator of the game."""
+        with self.game_lock:
+            if self.game.spectators is None:
+                self.send("SPECTATE unavailable")
+                return
+            if self.player in self.game.player_list:
+                self.send("SPECTATE denied")  # players cannot spectate their own game
+                return
+            self.spectating = True
+            self.send("SPECTATE ok")
+            self.game.spectators.subscribe(self)
+
+    def handle_resume(self, args):
+        """Take over the session of a dropped connection and replay the game state."""
+        if not args or self.sessions is None:
+            self.send("RESUME unknown")
+            return
+
+        # Under the game lock, like _leave: the old connection cannot detach
+        # the session again between the resume and the handover
+        with self.game_lock:
+            if self.spectating or any(p is self.player for p in self.game.player_list):
+                # Its own player would be left in the game with nobody behind it
+                self.send("RESUME denied")
+                return
+            player = self.sessions.resume(args[0])
+            if player is None:
+                self.send("RESUME unknown")
+                return
+            if self.token is not None and self.token != args[0]:
+                self.sessions.forget(self.token)  # the session of its USERNAME
+            previous = player.handler
+            player.handler = self
+            self.player = player
+            self.token = args[0]
+            self.send("RESUME ok")
+            self.game.replay(player)
+        if previous is not self:
+            previous.close()  # still open if the drop was not noticed yet
 
     def handle_game(self):
-        with self.lock:
+        with self.game_lock:
             if self.game.started:
                 self.send("GAME unavailable")
                 return
 
             if self.player not in self.game.player_list:
+                admission = self.game.admission
+                if admission is not None and not admission.admit_player(self.game):
+                    self.send("GAME full")
+                    return
                 self.game.player_list.append(self.player)
                 self.player.game = self.game
+                self.game.notify_change()
 
             self.send("GAME ok")
 
@@ -86,13 +310,54 @@ class ClientHandler:
         score = float(args[0])
         pos_str = args[1] if len(args) > 1 else ""
 
-        with self.lock:
+        with self.game_lock:
             if not self.game.started:
                 self.send("ERROR game not started")
                 return
             self.game.compute_score(self.player, score, pos_str)
 
 
-    def send(self, message: str):
-        print(f"Sending {message} to player {self.player.id}")
-        self.connection.sendall(f'"{message}"\n'.encode())
+    def handle_stats(self):
+        """Game Master only: reply with per-message-type latency statistics."""
+        if self.addr[0] not in GM_ADDRESSES:
+            self.send("STATS denied")
+            return
+        if not self.stats:
+            self.send("STATS")
+            return
+        self.send(f"STATS {self.stats.format_protocol()}".rstrip())
+
+    def send(self, message: str) -> bool:
+        """
+        Send *message* to the client. A failed send closes the connection
+        (the receive loop then removes the player) instead of raising, so one
+        dead client cannot abort a broadcast. Returns whether it was sent.
+        """
+        if not self.running:
+            return False  # connection closed, possibly waiting for a RESUME
+        if message != "PING":
+            print(f"Sending {message} to player {self.player.id}")
+        if self.compression and len(message) >= compression.THRESHOLD:
+            # Cached: a broadcast compresses its message only once
+            data = compression.compressed_line(message)
+        else:
+            data = f'"{message}"\n'.encode()
+        try:
+            with self._send_lock:
+                self.connection.sendall(data)
+        except OSError as e:
+            print(f"Could not send to player {self.id}: {e}")
+            self.close()
+            return False
+        if self.metrics:
+            self.metrics.inc("messages_out", (("type", message.split(" ", 1)[0]),))
+            self.metrics.inc("bytes_sent", (), len(data))
+        return True
+
+    def close(self):
+        """Shut the connection down from any thread; the receive loop then ends."""
+        self.running = False
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # already closed
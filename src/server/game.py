@@ -1,5 +1,14 @@
+import math
+from contextlib import nullcontext
+
 from .leaderboard import Leaderboard
-from ..shared.function_generator_claude import FunctionGenerator
+from .live_positions import LivePositions
+from .verification import verify_scores
+from ..shared.lazy_import import lazy_import
+
+# NumPy-backed, only needed when a game starts
+generator_module = lazy_import("..shared.function_generator_claude", __package__)
+function_bank = lazy_import("..shared.function_bank", __package__)
 
 
 class Game:
@@ -15,6 +24,16 @@ class Game:
         difficulty: str = "medium",
         nb_step: int = 10,
         reveal_radius: float = 0.5,
+        metrics=None,
+        hardness_band: tuple = None,
+        hardness_table: dict = None,
+        hardness_settings: dict = None,
+        function_bank_dir: str = None,
+        scheduler=None,
+        lock=None,
+        round_deadline: float = None,
+        quorum: float = 1.0,
+        quorum_grace: float = 10.0,
     ):
         self.nb_round = nb_round
         self.player_list = player_list
@@ -24,6 +43,27 @@ class Game:
         self.difficulty = difficulty
         self.nb_step = nb_step
         self.reveal_radius = reveal_radius
+        self.metrics = metrics
+        # Optional empirical-hardness filter on the drawn seeds
+        self.hardness_band = hardness_band
+        self.hardness_table = hardness_table
+        self.hardness_settings = hardness_settings  # the table was calibrated with, if known
+        # Directory of prebuilt function banks, looked up at every start
+        self.function_bank_dir = function_bank_dir
+        # Automatic end of the rounds: a deadline (seconds, None for none), and
+        # a quorum (fraction of the players) after which the others get
+        # quorum_grace seconds. Timers run on the shared scheduler, under lock.
+        self.scheduler = scheduler
+        self.lock = lock
+        self.round_deadline = round_deadline
+        self.quorum = quorum
+        self.quorum_grace = quorum_grace
+        self.deadline_at = None  # scheduler time at which the round will be force-finished
+        self._round_timers = []
+        self._round_token = 0  # changes at every round start and end, invalidating timers
+        self.spectators = None  # SpectatorHub told about every change, if any
+        self.admission = None  # AdmissionController capping the players, if any
+        self.live_positions = LivePositions(dim)  # streamed with MOVE, for the live map
 
         self.leaderboard = None
         self.function_generator = None
@@ -32,10 +72,22 @@ class Game:
         self.submissions = {}  # track who submitted score for current round
         self.waiting_for_next_round = False  # set True when all submitted, waiting for GM
         self.player_positions = {}  # final position strings for reveal, keyed by player.id
+        self.flagged_scores = {}  # player.id -> reason, for the submissions of the current round
 
         for player in player_list:
             player.game = self
 
+    def _timer(self, name: str, **labels):
+        """Time a block into the server metrics, if enabled."""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.timer(name, tuple(labels.items()))
+
+    def notify_change(self):
+        """Tell the spectators that the round state or the standings changed."""
+        if self.spectators is not None:
+            self.spectators.mark_dirty()
+
     def send_function(self, current_round: int):
         """
         Returns the function for the given round
@@ -52,14 +104,94 @@ class Game:
         if pos_str:
             self.player_positions[player.id] = pos_str
 
-        # check if all players submitted
+        self._check_round_complete()
+        self.notify_change()
+
+    def _check_round_complete(self):
+        """End the round if every remaining player submitted, else check the quorum."""
+        if not self.started or self.waiting_for_next_round or not self.submissions:
+            return
         if all(self.submissions.values()):
+            self._end_round_timers()
+            self.verify_round()
+
             # compute points
             self.leaderboard.update_player_scores(self.current_round)
 
             # wait for the Game Master to click "Next Round"
             self.waiting_for_next_round = True
             print(f"Round {self.current_round} complete — waiting for Game Master to advance")
+        else:
+            self._check_quorum()
+
+    def force_finish(self):
+        """Give the worst score to every player who has not submitted yet, ending the round."""
+        for p in list(self.player_list):
+            if not self.submissions.get(p.id, False):
+                self.compute_score(p, float("inf"))
+
+    # -- round timers --------------------------------------------------------
+
+    def _begin_round_timers(self):
+        """Arm the deadline of the round that just started."""
+        self._end_round_timers()
+        if self.scheduler is not None and self.round_deadline:
+            self._arm(self.round_deadline, "deadline")
+
+    def _end_round_timers(self):
+        for timer in self._round_timers:
+            timer.cancel()
+        self._round_timers = []
+        self._round_token += 1
+        self.deadline_at = None
+
+    def _arm(self, delay, reason):
+        timer = self.scheduler.call_later(delay, self._on_round_timer, self._round_token, reason)
+        self._round_timers.append(timer)
+        if self.deadline_at is None or timer.deadline < self.deadline_at:
+            self.deadline_at = timer.deadline
+
+    def _check_quorum(self):
+        """Once the quorum has submitted, give the others quorum_grace seconds."""
+        if self.scheduler is None or self.quorum is None or self.quorum >= 1:
+            return
+        if any(timer.args[1] == "quorum" for timer in self._round_timers):
+            return
+        needed = math.ceil(self.quorum * len(self.submissions))
+        if sum(self.submissions.values()) >= needed:
+            self._arm(self.quorum_grace, "quorum")
+
+    def _on_round_timer(self, token, reason):
+        """Scheduler callback: force-finish the round, unless it already moved on."""
+        with self.lock if self.lock is not None else nullcontext():
+            if token != self._round_token or not self.started or self.waiting_for_next_round:
+                return
+            print(f"Round {self.current_round} force finished ({reason})")
+            if self.metrics is not None:
+                self.metrics.inc("rounds_force_finished", (("reason", reason),))
+            self.force_finish()
+
+    def verify_round(self):
+        """
+        Recompute the submitted values of the current round from the final
+        positions, all in one batch, and rank the players with the verified
+        values. Flagged submissions are kept in :attr:`flagged_scores`.
+        """
+        ids = self.leaderboard.ids.tolist()
+        positions = [self.player_positions.get(pid) for pid in ids]
+        with self._timer("score_verification"):
+            verified, flags = verify_scores(
+                self.send_function(self.current_round),
+                self.leaderboard.function_scores[:, self.current_round],
+                positions,
+            )
+        self.leaderboard.set_round_scores(self.current_round, verified)
+
+        self.flagged_scores = {ids[i]: reason for i, reason in flags.items()}
+        for pid, reason in self.flagged_scores.items():
+            print(f"Score of player {pid} flagged: {reason}")
+            if self.metrics is not None:
+                self.metrics.inc("scores_flagged", (("reason", reason),))
 
     def advance_round(self):
         """Called by the Game Master to proceed to the next round (or end the game)."""
@@ -68,17 +200,23 @@ class Game:
 
         self.waiting_for_next_round = False
         self.player_positions = {}
+        self.flagged_scores = {}
 
         if self.current_round + 1 < self.nb_round:
             self.current_round += 1
             print(f"Going to round {self.current_round}")
             self.submissions = {p.id: False for p in self.player_list}
-            for p in self.player_list:
-                p.handler.send(f"FUNC {self.send_function(self.current_round).seed}")
+            self.live_positions.reset()
+            with self._timer("broadcast", op="advance_round"):
+                for p in self.player_list:
+                    p.handler.send(f"FUNC {self.send_function(self.current_round).seed}")
+            self._begin_round_timers()
         else:
-            for p in self.player_list:
-                p.handler.send("GAME over")
+            with self._timer("broadcast", op="advance_round"):
+                for p in self.player_list:
+                    p.handler.send("GAME over")
             self.reset_game(kick=True)
+        self.notify_change()
 
     def reveal(self):
         """Broadcast a REVEAL message with each player's final position and score."""
@@ -88,7 +226,7 @@ class Game:
         parts = []
         for p in self.player_list:
             pos_str = self.player_positions.get(p.id, "")
-            score = self.leaderboard.player_function_scores[p.id][self.current_round]
+            score = self.leaderboard.function_score(p, self.current_round)
             if score is None or score == float("inf"):
                 continue  # force-finished player: no meaningful position or score to show
             if not pos_str:
@@ -97,28 +235,69 @@ class Game:
 
         # Always send REVEAL so clients display the full function and their own score panel
         msg = "REVEAL " + " ".join(parts)
-        for p in self.player_list:
-            p.handler.send(msg)
+        with self._timer("broadcast", op="reveal"):
+            for p in self.player_list:
+                p.handler.send(msg)
         print(f"Revealed round {self.current_round}: {msg}")
 
     def _round_complete(self, current_round: int) -> bool:
         """
         Check if all players submitted a score for the round
         """
-        for player in self.player_list:
-            if (
-                self.leaderboard.player_function_scores[player.id][current_round]
-                is None
-            ):
-                return False
-        return True
+        return self.leaderboard.round_complete(current_round)
 
     def ready_to_start(self):
         return len(self.player_list) >= 1
 
+    def _function_generator(self, dim):
+        """The generator of the game's functions, checked before the game starts."""
+        difficulty = generator_module.Difficulty(self.difficulty)
+        bank = None
+        if self.function_bank_dir is not None:
+            bank = function_bank.open_bank(self.function_bank_dir, dim, difficulty)
+        if self.hardness_band is not None and bank is None and self.hardness_table is None:
+            # Calibrating candidate seeds takes seconds each, under the game lock
+            raise ValueError(
+                f"No hardness table nor function bank for {dim}D {self.difficulty} "
+                f"to draw seeds in the hardness band {self.hardness_band}"
+            )
+        if self.hardness_band is not None and bank is None:
+            self._check_hardness_settings(dim)
+        return generator_module.FunctionGenerator(
+            dim,
+            difficulty=difficulty,
+            bank=bank,
+            hardness_band=self.hardness_band,
+            hardness_table=self.hardness_table,
+            nb_step=self.nb_step,
+            reveal_radius=self.reveal_radius,
+        )
+
+    def _check_hardness_settings(self, dim):
+        """Raise ValueError if the hardness table was calibrated for another game."""
+        game = {
+            "dim": dim,
+            "difficulty": self.difficulty,
+            "nb_step": self.nb_step,
+            "reveal_radius": self.reveal_radius,
+        }
+        settings = self.hardness_settings or {}
+        differences = [
+            f"{key} {settings[key]} instead of {value}"
+            for key, value in game.items()
+            if key in settings and settings[key] != value
+        ]
+        if differences:
+            raise ValueError("Hardness table calibrated for " + ", ".join(differences))
+
     def start(self, dim: int = None):
+        """
+        Start the game in *dim* dimensions. Raises ValueError, leaving the game
+        as it was, when its functions cannot be drawn with these settings.
+        """
         if dim is None:
             dim = self.dim  # fallback to stored dim
+        function_generator = self._function_generator(dim)
         self.dim = dim
         if self.leaderboard is None:
             self.leaderboard = Leaderboard(self.player_list, self.nb_round)
@@ -127,51 +306,82 @@ class Game:
         self.started = True
         self.current_round = 0
         self.submissions = {p.id: False for p in self.player_list}
-        self.function_generator = FunctionGenerator(dim)
-        self.function_list = [
-            self.function_generator.generate() for _ in range(self.nb_round)
-        ]
+        self.live_positions.reset(dim)
+        self.function_generator = function_generator
+        self.function_list = []
+        for _ in range(self.nb_round):
+            with self._timer("function_generation", dim=dim):
+                self.function_list.append(self.function_generator.generate())
 
         # broadcast game start
-        for player in self.player_list:
-            player.handler.send(
-                f"GAME start {self.nb_round} {self.dim} {self.difficulty} {self.nb_step} {self.reveal_radius} {self.function_generator._domain}"
-            )
-            function_seed = self.send_function(self.current_round).seed
-            player.handler.send(f"FUNC {function_seed}")
+        with self._timer("broadcast", op="start"):
+            for player in self.player_list:
+                player.handler.send(self.start_message())
+                function_seed = self.send_function(self.current_round).seed
+                player.handler.send(f"FUNC {function_seed}")
+        self._begin_round_timers()
+        self.notify_change()
 
-    def round_finished(self, current_round: int):
-        for player in self.player_list:
-            if (
-                self.leaderboard.player_function_scores[player.id][current_round]
-                is None
-            ):
-                return False
-        return True
+    def named_standings(self):
+        """
+        (username, total points) pairs, best first. Once the game is over, the
+        frozen final standings until a new game starts.
+        """
+        # Frozen state → show snapshot
+        if self.leaderboard and self.leaderboard.frozen:
+            names = {p.id: p.username for p in self.leaderboard.player_list}
+            data = [(names.get(pid, f"id{pid}"), score) for pid, score in self.leaderboard.frozen_snapshot]
+            return sorted(data, key=lambda x: x[1], reverse=True)
 
-    def get_player_result(self, player, current_round):
-        scores = self.leaderboard.player_scores[player.id][current_round]
+        # Live game
+        names = {p.id: p.username or f"id{p.id}" for p in self.player_list}
+        if not self.leaderboard:
+            return [(name, 0) for name in names.values()]
+        # Already sorted, best first
+        return [
+            (names[pid], total)
+            for pid, total in self.leaderboard.standings()
+            if pid in names
+        ]
 
-        ranked = sorted(
-            self.player_list,
-            key=lambda p: self.leaderboard.player_function_scores[p.id][current_round],
-            reverse=True,
-        )
+    def start_message(self):
+        return f"GAME start {self.nb_round} {self.dim} {self.difficulty} {self.nb_step} {self.reveal_radius} {self.function_generator._domain}"
 
-        position = ranked.index(player) + 1
-        points = scores
+    def replay(self, player):
+        """Send a resumed *player* what it missed: the game settings and the current round."""
+        if player not in self.player_list:
+            return
+        if not self.started:
+            player.handler.send("GAME ok")
+            return
+        player.handler.send(self.start_message())
+        # A player who already submitted waits for the next round
+        if not self.submissions.get(player.id, False):
+            player.handler.send(f"FUNC {self.send_function(self.current_round).seed}")
+
+    def round_finished(self, current_round: int):
+        return self.leaderboard.round_complete(current_round)
+
+    def get_player_result(self, player, current_round):
+        row = self.leaderboard.row(player)
+        points = int(self.leaderboard.points[row, current_round])
+        position = self.leaderboard.rank_in_round(player, current_round)
         return position, points
 
     def reset_game(self, kick=False):
+        self._end_round_timers()
         self.started = False
         self.current_round = 0
         self.submissions = {}
         self.waiting_for_next_round = False
         self.player_positions = {}
+        self.flagged_scores = {}
+        self.live_positions.reset()
         if kick:
             self.player_list = []  # Kick all players from the game
         if self.leaderboard:
             self.leaderboard.freeze()
+        self.notify_change()
 
     def remove_player(self, player):
         """
@@ -182,11 +392,16 @@ class Game:
             # Remove from submissions tracking
             if player.id in self.submissions:
                 del self.submissions[player.id]
+            self.live_positions.remove(player.id)
             # Optional: remove player from leaderboard
             if self.leaderboard:
                 self.leaderboard.remove_player(player)
             print(f"Player {player.id} removed from the game.")
+            self.notify_change()
 
             # If no players left, reset the game
             if not self.player_list:
                 self.reset_game(kick=True)
+            else:
+                # The round may have been waiting for this player only
+                self._check_round_complete()
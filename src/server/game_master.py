@@ -1,13 +1,29 @@
 import tkinter as tk
 from tkinter import ttk
-import numpy as np
-from PIL import Image, ImageTk
+
+from ..shared.lazy_import import lazy_import
+
+# Only needed to draw a function: imported on first use
+np = lazy_import("numpy")
+heatmap = lazy_import("..shared.heatmap", __package__)
+progressive = lazy_import("..shared.progressive", __package__)
+
+PLAYER_COLORS = [
+    "#e74c3c", "#e67e22", "#27ae60", "#8e44ad",
+    "#16a085", "#f39c12", "#124ef3", "#1df312",
+]
+
+# Refresh interval of the live map, size of its markers, and lanes of the 1D map
+LIVE_MAP_TICK_MS = 100
+LIVE_MARKER_RADIUS = 5
+LIVE_MAP_LANES = 20
 
 
 class GameMasterGUI:
-    def __init__(self, game, lock):
+    def __init__(self, game, lock, stats=None):
         self.game = game
         self.lock = lock
+        self.stats = stats
 
         self.root = tk.Tk()
         self.root.title("Game Master Console")
@@ -88,6 +104,31 @@ class GameMasterGUI:
         )
         self.button_force.pack(side="left", padx=10)
 
+        # Automatic end of the rounds
+        self.frame_timing = ttk.Frame(self.root, padding=(10, 0, 10, 10))
+        self.frame_timing.pack(fill="x")
+
+        ttk.Label(self.frame_timing, text="Round deadline (s, 0 = none):").pack(side="left")
+        self.deadline_var = tk.IntVar(value=int(self.game.round_deadline or 0))
+        self.spin_deadline = ttk.Spinbox(
+            self.frame_timing, from_=0, to=3600, increment=10, width=6, textvariable=self.deadline_var
+        )
+        self.spin_deadline.pack(side="left", padx=5)
+
+        ttk.Label(self.frame_timing, text="Quorum (%):").pack(side="left", padx=(10, 0))
+        self.quorum_var = tk.IntVar(value=round(100 * (self.game.quorum or 1.0)))
+        self.spin_quorum = ttk.Spinbox(
+            self.frame_timing, from_=1, to=100, increment=5, width=5, textvariable=self.quorum_var
+        )
+        self.spin_quorum.pack(side="left", padx=5)
+
+        ttk.Label(self.frame_timing, text="Grace (s):").pack(side="left", padx=(10, 0))
+        self.grace_var = tk.IntVar(value=int(self.game.quorum_grace))
+        self.spin_grace = ttk.Spinbox(
+            self.frame_timing, from_=0, to=600, increment=5, width=5, textvariable=self.grace_var
+        )
+        self.spin_grace.pack(side="left", padx=5)
+
         # Connected players
         self.label_players = ttk.Label(self.root, text="Connected players: []")
         self.label_players.pack(anchor="w", padx=10)
@@ -141,6 +182,19 @@ class GameMasterGUI:
         )
         self.button_reset.pack(side="left", padx=5)
 
+        self.button_live_map = ttk.Button(
+            self.frame_buttons, text="Live Map", command=lambda: LiveMapWindow(self.root, self.game)
+        )
+        self.button_live_map.pack(side="left", padx=5)
+
+        # Message latency statistics
+        self.frame_stats = ttk.LabelFrame(self.root, text="Message latency", padding=10)
+        self.frame_stats.pack(fill="x", padx=10, pady=(0, 10))
+        self.label_stats = ttk.Label(
+            self.frame_stats, text="No messages yet", font=("Courier", 10), justify="left"
+        )
+        self.label_stats.pack(anchor="w")
+
         # Start periodic GUI update
         self.update_gui()
 
@@ -156,7 +210,7 @@ class GameMasterGUI:
     def update_leaderboard(self):
         if self.game.leaderboard:
             leaderboard_text = {
-                p.username: self.game.leaderboard.player_scores.get(p.id, [])
+                p.username: self.game.leaderboard.player_points(p)
                 for p in self.game.player_list
             }
         else:
@@ -198,9 +252,22 @@ class GameMasterGUI:
                 self.show_status("Invalid reveal radius!")
                 return
 
+            try:
+                deadline = int(self.spin_deadline.get())
+                self.game.round_deadline = deadline if deadline > 0 else None
+                self.game.quorum = min(max(int(self.spin_quorum.get()), 1), 100) / 100
+                self.game.quorum_grace = max(int(self.spin_grace.get()), 0)
+            except ValueError:
+                self.show_status("Invalid deadline, quorum or grace!")
+                return
+
             selected_dim = int(self.dim_var.get())
             print(f"### dim is {selected_dim} ###")
-            self.game.start(dim=selected_dim)
+            try:
+                self.game.start(dim=selected_dim)
+            except ValueError as e:
+                self.show_status(f"Cannot start: {e}")
+                return
 
             print(
                 f"Game started with {len(self.game.player_list)} players, {self.game.nb_round} rounds, dim={selected_dim}"
@@ -232,7 +299,7 @@ class GameMasterGUI:
             players_data = []
             for p in self.game.player_list:
                 pos_str = self.game.player_positions.get(p.id, "")
-                score = self.game.leaderboard.player_function_scores[p.id][self.game.current_round]
+                score = self.game.leaderboard.function_score(p, self.game.current_round)
                 if score is None or score == float("inf") or not pos_str:
                     continue
                 if dim == 1:
@@ -247,11 +314,6 @@ class GameMasterGUI:
         self._open_reveal_window(func, domain, dim, current_round, players_data)
 
     def _open_reveal_window(self, func, domain, dim, current_round, players_data):
-        PLAYER_COLORS = [
-            "#e74c3c", "#e67e22", "#27ae60", "#8e44ad",
-            "#16a085", "#f39c12", "#124ef3", "#1df312",
-        ]
-
         c_width, c_height = 800, 600
         min_x, max_x = domain
 
@@ -260,6 +322,11 @@ class GameMasterGUI:
         canvas = tk.Canvas(win, width=c_width, height=c_height, bg="white")
         canvas.pack()
 
+        # The function is drawn coarse first and refined in the background;
+        # polled from the main window, which outlives this one
+        render = progressive.ProgressiveRenderer(self.root)
+        win.bind("<Destroy>", lambda event: render.cancel())
+
         if dim == 1:
             # Compute adaptive Y scaling from full function range
             xs_full = np.linspace(min_x, max_x, 600)
@@ -271,11 +338,22 @@ class GameMasterGUI:
             mid_y = int(margin + f_max * scale_y)
             scale_x = c_width / (max_x - min_x)
 
-            # Draw full function curve
-            xs_plot = np.linspace(min_x, max_x, c_width)
-            ys_plot = func._raw_eval(xs_plot)
-            pts = [(i, int(mid_y - ys_plot[i] * scale_y)) for i in range(c_width)]
-            canvas.create_line(pts, fill="royalblue", width=2)
+            # Full function curve, refined in place
+            curve = None
+
+            def show_curve(coords):
+                nonlocal curve
+                if curve is None:
+                    curve = canvas.create_line(*coords, fill="royalblue", width=2)
+                else:
+                    canvas.coords(curve, *coords)
+
+            render.start(
+                lambda cancel: progressive.curve_levels(
+                    func, domain, c_width, lambda ys: mid_y - ys * scale_y, cancel
+                ),
+                show_curve,
+            )
 
             # True minimum star
             m = func._true_minimum
@@ -301,24 +379,22 @@ class GameMasterGUI:
             scale_x = c_width / (max_x - min_x)
             scale_y = c_height / (y_max - y_min)
 
-            # Build full heatmap
-            n = 200
-            xs = np.linspace(min_x, max_x, n)
-            ys = np.linspace(y_min, y_max, n)
-            X, Y = np.meshgrid(xs, ys)
-            Z = func._raw_eval((X, Y))
-
-            Z_min, Z_max = Z.min(), Z.max()
-            Z_norm = (Z - Z_min) / max(Z_max - Z_min, 1e-10)
+            # Full heatmap, enlarged to the canvas by Tk until the last level
+            image = None
 
-            R = (Z_norm * 255).astype(np.uint8)
-            G = np.zeros_like(R)
-            B = (255 - R).astype(np.uint8)
-            img_arr = np.flipud(np.stack([R, G, B], axis=2))
-            img = Image.fromarray(img_arr, "RGB").resize((c_width, c_height), Image.NEAREST)
+            def show_heatmap(level):
+                nonlocal image
+                ppm, zoom = level
+                win._reveal_img = heatmap.ppm_photo(ppm, zoom)
+                if image is None:
+                    image = canvas.create_image(0, 0, anchor="nw", image=win._reveal_img)
+                else:
+                    canvas.itemconfig(image, image=win._reveal_img)
 
-            win._reveal_img = ImageTk.PhotoImage(img)
-            canvas.create_image(0, 0, anchor="nw", image=win._reveal_img)
+            render.start(
+                lambda cancel: progressive.heatmap_levels(func, domain, c_width, c_height, cancel),
+                show_heatmap,
+            )
 
             # True minimum star
             m = func._true_minimum
@@ -358,9 +434,7 @@ class GameMasterGUI:
                 return
 
             # Force-submit every player who hasn't submitted yet (worst score)
-            for p in self.game.player_list:
-                if not self.game.submissions.get(p.id, False):
-                    self.game.compute_score(p, float("inf"))
+            self.game.force_finish()
 
             print("Round force finished")
             self.show_status("Round force finished")
@@ -401,17 +475,18 @@ class GameMasterGUI:
 
             # Round status indicator + button states
             if self.game.started and self.game.waiting_for_next_round:
-                self.label_round_status.config(
-                    text="✅ Tous les joueurs ont terminé le round !",
-                    foreground="green",
-                )
+                text = "✅ Tous les joueurs ont terminé le round !"
+                if self.game.flagged_scores:
+                    text += f" ({len(self.game.flagged_scores)} score(s) corrigé(s))"
+                self.label_round_status.config(text=text, foreground="green")
                 self.button_reveal.config(state="normal")
                 self.button_next_round.config(state="normal")
             elif self.game.started:
-                self.label_round_status.config(
-                    text=f"⏳ En cours... ({n_done}/{n_total} soumissions)",
-                    foreground="orange",
-                )
+                text = f"⏳ En cours... ({n_done}/{n_total} soumissions)"
+                if self.game.deadline_at is not None:
+                    remaining = max(self.game.deadline_at - self.game.scheduler.clock(), 0)
+                    text += f" — fin dans {remaining:.0f} s"
+                self.label_round_status.config(text=text, foreground="orange")
                 self.button_reveal.config(state="disabled")
                 self.button_next_round.config(state="disabled")
             else:
@@ -422,12 +497,127 @@ class GameMasterGUI:
             # Update leaderboard
             if self.game.leaderboard:
                 leaderboard_text = {
-                    p.username: self.game.leaderboard.player_scores.get(p.id, [])
+                    p.username: self.game.leaderboard.player_points(p)
                     for p in self.game.player_list
                 }
             else:
                 leaderboard_text = "N/A"
             self.label_leaderboard.config(text=f"Leaderboard: {leaderboard_text}")
 
+        self.update_stats()
+
         # Refresh every 1 second
         self.root.after(1000, self.update_gui)
+
+    def update_stats(self):
+        """Refresh the per-message-type latency panel (no game lock needed)."""
+        lines = []
+        # Shown even before any message: refusals matter most on a full server
+        admission = self.game.admission
+        if admission is not None:
+            lines.append(
+                f"connexions {admission.active}/{admission.max_sessions} "
+                f"(pic {admission.peak}), refusées {admission.rejected_sessions}, "
+                f"joueurs refusés {admission.rejected_players}"
+            )
+        rows = self.stats.summary() if self.stats else []
+        if rows:
+            lines.append(
+                f"{'type':<10}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+                f"{'lock p99':>10}{'dropped':>9}"
+            )
+        for code, count, p50, p99, mx, lock99, dropped in rows:
+            lines.append(
+                f"{code:<10}{count:>8}{p50 * 1e3:>10.3f}{p99 * 1e3:>10.3f}"
+                f"{mx * 1e3:>10.3f}{lock99 * 1e3:>10.3f}{dropped:>9}"
+            )
+        if lines:
+            self.label_stats.config(text="\n".join(lines))
+
+
+class LiveMapWindow:
+    """
+    Live positions of the players during the round, from the MOVE messages.
+
+    Every tick takes a snapshot of ``game.live_positions`` and redraws only if
+    something moved. Markers are pooled: one oval per player row, created once,
+    then only moved or hidden, never deleted and recreated; only the markers
+    whose position changed are touched.
+    """
+
+    size = 500
+    margin = 20
+
+    def __init__(self, root, game):
+        self.game = game
+        self.win = tk.Toplevel(root)
+        self.win.title("Live Map")
+        self.canvas = tk.Canvas(self.win, width=self.size, height=self.size, bg="white")
+        self.canvas.pack()
+        self.label = ttk.Label(self.win, text="")
+        self.label.pack(anchor="w", padx=10, pady=5)
+
+        self.markers = []  # canvas ovals, one per row of live_positions
+        self.boxes = np.zeros((0, 4))  # their drawn coordinates (NaN: hidden)
+        self.version = None
+        self.after_id = None
+        self.win.bind("<Destroy>", self._on_destroy)
+        self.tick()
+
+    def _on_destroy(self, event):
+        if event.widget is self.win and self.after_id is not None:
+            self.win.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        version, ids, positions = self.game.live_positions.snapshot()
+        if version != self.version:
+            self.version = version
+            self.draw(positions)
+        self.after_id = self.win.after(LIVE_MAP_TICK_MS, self.tick)
+
+    def marker_boxes(self, positions, domain):
+        """Canvas bounding boxes ``(n, 4)`` of the markers at *positions*."""
+        lo, hi = domain
+        scale = (self.size - 2 * self.margin) / (hi - lo)
+        x = self.margin + (positions[:, 0] - lo) * scale
+        if positions.shape[1] == 1:
+            # 1D: one lane per player, so that the turtles do not overlap
+            lane = (self.size - 2 * self.margin) / LIVE_MAP_LANES
+            y = self.margin + (np.arange(len(positions)) % LIVE_MAP_LANES + 0.5) * lane
+        else:
+            y = self.size - self.margin - (positions[:, 1] - lo) * scale
+        r = LIVE_MARKER_RADIUS
+        return np.column_stack([x - r, y - r, x + r, y + r])
+
+    def draw(self, positions):
+        generator = self.game.function_generator
+        domain = generator._domain if generator is not None else (-6, 6)
+        n = len(positions)
+
+        # Grow the pool
+        while len(self.markers) < n:
+            color = PLAYER_COLORS[len(self.markers) % len(PLAYER_COLORS)]
+            self.markers.append(
+                self.canvas.create_oval(0, 0, 0, 0, fill=color, outline="black", state="hidden")
+            )
+        if len(self.boxes) < len(self.markers):
+            grown = np.full((len(self.markers), 4), np.nan)
+            grown[: len(self.boxes)] = self.boxes
+            self.boxes = grown
+
+        boxes = np.full((len(self.markers), 4), np.nan)
+        boxes[:n] = self.marker_boxes(positions, domain)
+        visible = ~np.isnan(boxes[:, 0])
+        was_visible = ~np.isnan(self.boxes[:, 0])
+
+        moved = visible & ~(boxes == self.boxes).all(axis=1)
+        for i in np.flatnonzero(moved).tolist():
+            self.canvas.coords(self.markers[i], *boxes[i].tolist())
+        for i in np.flatnonzero(visible & ~was_visible).tolist():
+            self.canvas.itemconfigure(self.markers[i], state="normal")
+        for i in np.flatnonzero(~visible & was_visible).tolist():
+            self.canvas.itemconfigure(self.markers[i], state="hidden")
+        self.boxes = boxes
+
+        self.label.config(text=f"{int(visible.sum())} joueurs sur la carte")
@@ -1,67 +1,165 @@
 from .player import Player
+from ..shared.lazy_import import lazy_import
+
+# Only needed once a game starts
+np = lazy_import("numpy")
 
 
 class Leaderboard:
     """
     Allow to follow the ranking of a game
+
+    Scores are kept in players x rounds NumPy arrays: :attr:`function_scores`
+    holds the submitted values (NaN until a player submits) and
+    :attr:`points` the points won. Rows follow the order in which players
+    were added; :attr:`ids` gives the player id of each row. The arrays grow
+    when players are added beyond their capacity.
     """
 
+    INITIAL_CAPACITY = 8
+
     def __init__(self, player_list: list[Player], nb_round: int):
-        self.player_list = player_list
-        self.nb_round = nb_round
         self.frozen = False
         self.frozen_snapshot = []
+        self._reset(player_list, nb_round)
 
-        self.player_function_scores = {
-            player.id: [None] * nb_round for player in player_list
-        }
-
-        self.player_scores = {player.id: [0] * nb_round for player in player_list}
+    def _reset(self, player_list, nb_round):
+        self.player_list = player_list
+        self.nb_round = nb_round
+        self.size = 0
+        self._rows = {}  # player id -> row
+        capacity = max(self.INITIAL_CAPACITY, len(player_list))
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._function_scores = np.full((capacity, nb_round), np.nan)
+        self._points = np.zeros((capacity, nb_round), dtype=np.int64)
+        for player in player_list:
+            self.add_player(player)
 
     def __str__(self):
         return (
-            f"Function scores: {self.player_function_scores}\n"
-            f"Player scores: {self.player_scores}"
+            f"Function scores: {dict(zip(self.ids.tolist(), self.function_scores.tolist()))}\n"
+            f"Player scores: {dict(zip(self.ids.tolist(), self.points.tolist()))}"
         )
 
+    # -- views ---------------------------------------------------------------
+
+    @property
+    def ids(self):
+        return self._ids[: self.size]
+
+    @property
+    def function_scores(self):
+        return self._function_scores[: self.size]
+
+    @property
+    def points(self):
+        return self._points[: self.size]
+
+    def row(self, player: Player):
+        """Row of *player*, or None if it is not on the leaderboard."""
+        return self._rows.get(player.id)
+
+    def function_score(self, player: Player, current_round: int):
+        """Submitted value of *player* for the round, or None."""
+        row = self._rows.get(player.id)
+        if row is None:
+            return None
+        score = self._function_scores[row, current_round]
+        return None if np.isnan(score) else float(score)
+
+    def player_points(self, player: Player) -> list:
+        """Points of *player* in every round ([] if not on the leaderboard)."""
+        row = self._rows.get(player.id)
+        return [] if row is None else self._points[row].tolist()
+
+    def totals(self):
+        """Total points of every row."""
+        return self.points.sum(axis=1)
+
+    def standings(self) -> list:
+        """(player id, total points) pairs, best first (ties keep the join order)."""
+        totals = self.totals()
+        order = np.argsort(-totals, kind="stable")
+        return list(zip(self.ids[order].tolist(), totals[order].tolist()))
+
+    def round_complete(self, current_round: int) -> bool:
+        """Whether every player submitted a value for the round."""
+        return not np.isnan(self.function_scores[:, current_round]).any()
+
+    # -- players -------------------------------------------------------------
+
+    def add_player(self, player: Player) -> int:
+        """Give *player* a row (if it has none yet) and return it."""
+        row = self._rows.get(player.id)
+        if row is not None:
+            return row
+        if self.size == len(self._ids):
+            self._grow(2 * len(self._ids))
+        row = self.size
+        self._ids[row] = player.id
+        self._function_scores[row] = np.nan
+        self._points[row] = 0
+        self._rows[player.id] = row
+        self.size += 1
+        return row
+
+    def _grow(self, capacity):
+        ids = np.zeros(capacity, dtype=np.int64)
+        function_scores = np.full((capacity, self.nb_round), np.nan)
+        points = np.zeros((capacity, self.nb_round), dtype=np.int64)
+        ids[: self.size] = self.ids
+        function_scores[: self.size] = self.function_scores
+        points[: self.size] = self.points
+        self._ids, self._function_scores, self._points = ids, function_scores, points
+
+    def remove_player(self, player: Player):
+        """Drop the row of *player*; the rows after it move up one place."""
+        row = self._rows.pop(player.id, None)
+        if row is None:
+            return
+        end = self.size
+        for array in (self._ids, self._function_scores, self._points):
+            array[row : end - 1] = array[row + 1 : end]
+        self.size -= 1
+        for moved, pid in enumerate(self._ids[row : self.size].tolist(), start=row):
+            self._rows[pid] = moved
+
+    # -- scoring -------------------------------------------------------------
+
     def freeze(self):
         if self.frozen:
             return
 
-        snapshot = []
-        for pid, scores in self.player_scores.items():
-            total = sum(score or 0 for score in scores)
-            snapshot.append((pid, total))
-
-        self.frozen_snapshot = snapshot
+        self.frozen_snapshot = list(zip(self.ids.tolist(), self.totals().tolist()))
         self.frozen = True
 
     def unfreeze(self, player_list, nb_round):
         self.frozen = False
         self.frozen_snapshot = []
-
-        self.nb_round = nb_round
-        self.player_list = player_list
-
-        self.player_function_scores = {p.id: [None] * nb_round for p in player_list}
-        self.player_scores = {p.id: [0] * nb_round for p in player_list}
+        self._reset(player_list, nb_round)
 
     def update_function_score(self, player: Player, current_round: int, score: float):
-        self.player_function_scores[player.id][current_round] = score
+        row = self.add_player(player)
+        self._function_scores[row, current_round] = score
+
+    def set_round_scores(self, current_round: int, scores):
+        """Replace the submitted values of the round, one per row."""
+        self.function_scores[:, current_round] = scores
 
     def update_player_scores(self, current_round: int):
         """
         Compute the score for each player at the end of the round.
         Scoring: nb_players - position
         """
-        nb_players = len(self.player_list)
-
-        ranked_players = sorted(
-            self.player_list,
-            key=lambda p: self.player_function_scores[p.id][current_round],
-            reverse=False,
-        )
-
-        for idx, player in enumerate(ranked_players):
-            points = nb_players - idx + 1
-            self.player_scores[player.id][current_round] = points
+        nb_players = self.size
+
+        # Lowest value first; missing values (NaN) last, ties in join order
+        order = np.argsort(self.function_scores[:, current_round], kind="stable")
+        self._points[order, current_round] = nb_players - np.arange(nb_players) + 1
+
+    def rank_in_round(self, player: Player, current_round: int) -> int:
+        """1-based position of *player* by decreasing value in the round."""
+        row = self._rows[player.id]
+        scores = self.function_scores[:, current_round]
+        score = scores[row]
+        return int((scores > score).sum() + (scores[:row] == score).sum()) + 1
@@ -54,27 +54,7 @@ class LeaderboardDisplay:
         self.root.after(1000, self.update_leaderboard)
         
     def _collect_scores(self):
-        # Frozen state → show snapshot
-        if self.game.leaderboard and self.game.leaderboard.frozen:
-            data = []
-            for pid, score in self.game.leaderboard.frozen_snapshot:
-                name = f"id{pid}"
-                for p in self.game.leaderboard.player_list:
-                    if p.id == pid:
-                        name = p.username
-                data.append((name, score))
-            return sorted(data, key=lambda x: x[1], reverse=True)
-
-        # Live game
-        data = []
-        for player in self.game.player_list:
-            total_score = 0
-            if self.game.leaderboard:
-                scores = self.game.leaderboard.player_scores.get(player.id, [])
-                total_score = sum(score or 0 for score in scores)
-            data.append((player.username or f"id{player.id}", total_score))
-
-        return sorted(data, key=lambda x: x[1], reverse=True)
+        return self.game.named_standings()
 
     def _render(self, data):
         # Clear rows
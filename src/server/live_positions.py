@@ -0,0 +1,82 @@
+import threading
+
+from ..shared.lazy_import import lazy_import
+
+# Only needed once a game starts
+np = lazy_import("numpy")
+
+
+class LivePositions:
+    """
+    Latest position of every player in the current round, from the ``MOVE``
+    messages the clients stream at each step.
+
+    Positions are kept in one ``(players, dim)`` array, one row per player
+    (NaN until its first move), written in place under a lock of its own so
+    that a move never waits for the game lock. Readers take a copy with
+    :meth:`snapshot` once per tick; :attr:`version` tells whether anything
+    moved since the previous one.
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, dim: int = 1):
+        self._lock = threading.Lock()
+        self.version = 0
+        self.reset(dim)
+
+    def reset(self, dim: int = None):
+        """Forget all positions (at the start of a round)."""
+        with self._lock:
+            if dim is not None:
+                self.dim = dim
+            self.size = 0
+            self._rows = {}  # player id -> row
+            self._ids = None  # arrays allocated on the first move
+            self._positions = None
+            self.version += 1
+
+    def update(self, player_id: int, coords):
+        """Record the position *coords* (dim floats) of *player_id*."""
+        with self._lock:
+            row = self._rows.get(player_id)
+            if row is None:
+                row = self._add(player_id)
+            self._positions[row] = coords
+            self.version += 1
+
+    def _add(self, player_id):
+        if self._positions is None:
+            self._ids = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)
+            self._positions = np.full((self.INITIAL_CAPACITY, self.dim), np.nan)
+        elif self.size == len(self._ids):
+            capacity = 2 * len(self._ids)
+            ids = np.zeros(capacity, dtype=np.int64)
+            positions = np.full((capacity, self.dim), np.nan)
+            ids[: self.size] = self._ids
+            positions[: self.size] = self._positions
+            self._ids, self._positions = ids, positions
+        row = self.size
+        self._ids[row] = player_id
+        self._rows[player_id] = row
+        self.size += 1
+        return row
+
+    def remove(self, player_id: int):
+        """Hide *player_id* (its row is kept, so the others do not move)."""
+        with self._lock:
+            row = self._rows.get(player_id)
+            if row is not None:
+                self._positions[row] = np.nan
+                self.version += 1
+
+    def snapshot(self):
+        """``(version, ids, positions)``, copies of the rows in use."""
+        with self._lock:
+            if self._positions is None:
+                return self.version, np.zeros(0, dtype=np.int64), np.zeros((0, self.dim))
+            return (
+                self.version,
+                self._ids[: self.size].copy(),
+                self._positions[: self.size].copy(),
+            )
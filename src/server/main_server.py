@@ -1,15 +1,45 @@
+from ..shared.lazy_import import StartupProfile, prefetch
+
+import argparse
 import socket
 import threading
 import traceback
-import sys
+from .admission import MAX_PLAYERS, MAX_SESSIONS, AdmissionController, reject
 from .client_handler import ClientHandler
-from .game import Game
-from .game_master import GameMasterGUI  
+from .game import Game, generator_module
+from .game_master import GameMasterGUI
 from .leaderboard_display import LeaderboardDisplay
+from .metrics import Metrics, start_metrics_server
+from .rate_limit import RateLimiter
+from .scheduler import TimerScheduler
+from .sessions import HEARTBEAT_INTERVAL, HEARTBEAT_TIMEOUT, RESUME_GRACE, SessionRegistry
+from .spectators import SPECTATOR_FPS, SpectatorHub
+from .stats import MessageStats
 
-def handle_client(connection_id, client_socket, addr, game, lock):
+def handle_client(
+    connection_id,
+    client_socket,
+    addr,
+    game,
+    lock,
+    stats,
+    metrics,
+    sessions=None,
+    rate_limit=True,
+    admission=None,
+):
     try:
-        handler = ClientHandler(connection_id, client_socket, addr, game, lock)
+        handler = ClientHandler(
+            connection_id,
+            client_socket,
+            addr,
+            game,
+            lock,
+            stats,
+            metrics,
+            sessions,
+            RateLimiter() if rate_limit else None,
+        )
         handler.run()
 
     except Exception as e:
@@ -19,9 +49,21 @@ def handle_client(connection_id, client_socket, addr, game, lock):
 
     finally:
         client_socket.close()
+        if admission is not None:
+            admission.release_connection()
 
 
-def server_loop(port, max_connection, game, lock):
+def server_loop(
+    port,
+    max_connection,
+    game,
+    lock,
+    stats,
+    metrics=None,
+    sessions=None,
+    rate_limit=True,
+    admission=None,
+):
     """
     Accept connections in a separate thread
     """
@@ -29,18 +71,33 @@ def server_loop(port, max_connection, game, lock):
     server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server_socket.bind(("", port))
     server_socket.listen(max_connection)
-    print(f"Server listening on port {port} (max {max_connection})")
+    print(f"Server listening on port {port} (backlog {max_connection})")
 
     connection_id = 0
 
     try:
         while True:
             client_socket, addr = server_socket.accept()
+            if admission is not None and not admission.admit_connection():
+                print("Server full, refusing connection from", addr)
+                reject(client_socket)
+                continue
             print("Got connection from", addr)
 
             threading.Thread(
                 target=handle_client,
-                args=(connection_id, client_socket, addr, game, lock),
+                args=(
+                    connection_id,
+                    client_socket,
+                    addr,
+                    game,
+                    lock,
+                    stats,
+                    metrics,
+                    sessions,
+                    rate_limit,
+                    admission,
+                ),
                 daemon=True
             ).start()
 
@@ -53,30 +110,225 @@ def server_loop(port, max_connection, game, lock):
         server_socket.close()
 
 
-def main(port: int, max_connection: int):
+def main(
+    port: int,
+    max_connection: int,
+    metrics_port: int = None,
+    profile=None,
+    hardness_band=None,
+    hardness_table=None,
+    hardness_settings=None,
+    function_bank_dir=None,
+    round_deadline=None,
+    quorum=1.0,
+    quorum_grace=10.0,
+    heartbeat_interval=HEARTBEAT_INTERVAL,
+    heartbeat_timeout=HEARTBEAT_TIMEOUT,
+    resume_grace=RESUME_GRACE,
+    spectator_fps=SPECTATOR_FPS,
+    rate_limit=True,
+    max_sessions=MAX_SESSIONS,
+    max_players=MAX_PLAYERS,
+):
+    if profile is None:
+        profile = StartupProfile(False)
     game_lock = threading.Lock()
-    game = Game(dim=1, player_list=[], nb_round=1)
+    stats = MessageStats()
+    metrics = Metrics() if metrics_port else None
+    # One timer thread for the deadlines of every game
+    scheduler = TimerScheduler().start()
+    # Pings the clients and drops the silent connections, on the same thread
+    sessions = SessionRegistry(
+        heartbeat_interval, heartbeat_timeout, metrics=metrics, resume_grace=resume_grace
+    ).start(scheduler)
+    game = Game(
+        dim=1,
+        player_list=[],
+        nb_round=1,
+        metrics=metrics,
+        hardness_band=hardness_band,
+        hardness_table=hardness_table,
+        hardness_settings=hardness_settings,
+        function_bank_dir=function_bank_dir,
+        scheduler=scheduler,
+        lock=game_lock,
+        round_deadline=round_deadline,
+        quorum=quorum,
+        quorum_grace=quorum_grace,
+    )
+
+    # Read-only spectators, sent coalesced STATE frames
+    game.spectators = SpectatorHub(game, game_lock, scheduler, spectator_fps, metrics)
+
+    # Caps on the live connections and on the players of the game
+    game.admission = AdmissionController(max_sessions, max_players, metrics)
+
+    if metrics:
+        start_metrics_server(metrics_port, metrics, stats, game)
 
     # Start the server accept loop in a background thread
     threading.Thread(
         target=server_loop,
-        args=(port, max_connection, game, game_lock),
+        args=(
+            port,
+            max_connection,
+            game,
+            game_lock,
+            stats,
+            metrics,
+            sessions,
+            rate_limit,
+            game.admission,
+        ),
         daemon=True
     ).start()
 
     # Tkinter MUST run in the main thread — single Tk root, leaderboard as Toplevel
-    gui = GameMasterGUI(game, game_lock)
+    gui = GameMasterGUI(game, game_lock, stats)
     leaderboard = LeaderboardDisplay(game, game_lock)
+    gui.root.update_idletasks()
+    profile.mark("game master window shown")
+
+    # Generating the first functions must not wait for NumPy to load
+    thread = prefetch(generator_module)
+    if profile.enabled:
+        thread.join()
+        profile.mark("function generator prefetched")
+        profile.report(budget_mark="game master window shown")
     gui.root.mainloop()
 
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python main_server.py <port> [max_connection]")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Direct search for turtles game server")
+    parser.add_argument("port", type=int, help="Port to listen on for players")
+    parser.add_argument(
+        "max_connection",
+        type=int,
+        nargs="?",
+        default=20,
+        help="Backlog of pending connections (default: 20)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this port at /metrics (disabled by default)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print import and initialisation timings at startup",
+    )
+    parser.add_argument(
+        "--hardness-band",
+        type=float,
+        nargs=2,
+        metavar=("LOW", "HIGH"),
+        default=None,
+        help="Only draw functions whose calibrated hardness is in [LOW, HIGH]",
+    )
+    parser.add_argument(
+        "--hardness-table",
+        default=None,
+        help="Hardness table from src.shared.calibration to draw the seeds from "
+        "(default: calibrate candidate seeds when drawn)",
+    )
+    parser.add_argument(
+        "--function-bank",
+        default=None,
+        help="Directory of function banks (src.shared.function_bank) to draw functions from",
+    )
+    parser.add_argument(
+        "--round-deadline",
+        type=float,
+        default=None,
+        help="Force-finish every round after this many seconds (default: no deadline)",
+    )
+    parser.add_argument(
+        "--quorum",
+        type=float,
+        default=1.0,
+        help="Fraction of the players after whose submission the others get --grace "
+        "seconds left (default: 1, wait for everybody)",
+    )
+    parser.add_argument(
+        "--grace",
+        type=float,
+        default=10.0,
+        help="Seconds left to the other players once the quorum is reached (default: 10)",
+    )
+    parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        default=HEARTBEAT_INTERVAL,
+        help="Seconds between heartbeat pings to quiet clients, 0 to disable (default: 5)",
+    )
+    parser.add_argument(
+        "--heartbeat-timeout",
+        type=float,
+        default=HEARTBEAT_TIMEOUT,
+        help="Seconds of silence after which a client is disconnected (default: 20)",
+    )
+    parser.add_argument(
+        "--resume-grace",
+        type=float,
+        default=RESUME_GRACE,
+        help="Seconds a disconnected player keeps its place, waiting to reconnect (default: 60)",
+    )
+    parser.add_argument(
+        "--spectator-fps",
+        type=float,
+        default=SPECTATOR_FPS,
+        help="Maximum STATE frames per second sent to spectators (default: 4)",
+    )
+    parser.add_argument(
+        "--no-rate-limit",
+        action="store_true",
+        help="Do not limit the message rate of the connections",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=MAX_SESSIONS,
+        help="Connections handled at once, the others get SERVER full (default: 200)",
+    )
+    parser.add_argument(
+        "--max-players",
+        type=int,
+        default=MAX_PLAYERS,
+        help="Players in the game, the others get GAME full (default: 100)",
+    )
+    args = parser.parse_args()
+    if args.hardness_band and not (args.hardness_table or args.function_bank):
+        parser.error("--hardness-band needs --hardness-table or --function-bank")
+    profile = StartupProfile(args.profile_startup)
+    profile.mark("modules imported")
+
+    hardness_table, hardness_settings = None, None
+    if args.hardness_table:
+        from ..shared.calibration import load_table
 
-    port = int(sys.argv[1])
-    max_connection = int(sys.argv[2]) if len(sys.argv) >= 3 else 20
+        # Settings checked against those of the game at every start
+        hardness_table, hardness_settings = load_table(args.hardness_table)
 
-    main(port, max_connection)
+    main(
+        args.port,
+        args.max_connection,
+        args.metrics_port,
+        profile,
+        hardness_band=tuple(args.hardness_band) if args.hardness_band else None,
+        hardness_table=hardness_table,
+        hardness_settings=hardness_settings,
+        function_bank_dir=args.function_bank,
+        round_deadline=args.round_deadline,
+        quorum=args.quorum,
+        quorum_grace=args.grace,
+        heartbeat_interval=args.heartbeat_interval,
+        heartbeat_timeout=args.heartbeat_timeout,
+        resume_grace=args.resume_grace,
+        spectator_fps=args.spectator_fps,
+        rate_limit=not args.no_rate_limit,
+        max_sessions=args.max_sessions,
+        max_players=args.max_players,
+    )
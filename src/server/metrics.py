@@ -0,0 +1,219 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .stats import LatencyHistogram
+
+# Upper bounds (seconds) of the exported Prometheus histogram buckets
+EXPORT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+PREFIX = "turtles_"
+
+
+class Metrics:
+    """
+    Low-overhead counters and duration histograms for the server.
+
+    Like :class:`MessageStats`, every thread writes to its own shard without
+    locking, and the shards are merged only when the metrics are scraped.
+    Keys are ``(name, labels)`` where ``labels`` is a tuple of (key, value).
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = ({}, {})
+        self._registry_lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = ({}, {})  # counters, histograms
+            self._local.shard = shard
+            with self._registry_lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1):
+        counters = self._shard()[0]
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, labels: tuple = ()):
+        histograms = self._shard()[1]
+        key = (name, labels)
+        hist = histograms.get(key)
+        if hist is None:
+            hist = histograms[key] = LatencyHistogram()
+        hist.record(seconds)
+
+    def timer(self, name: str, labels: tuple = ()):
+        """Context manager observing the duration of its block."""
+        return _Timer(self, name, labels)
+
+    def retire_thread(self):
+        """
+        Fold the calling thread's shard into the retired totals.
+        Called when a connection thread ends so shards don't pile up.
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            return
+        with self._registry_lock:
+            self._shards = [s for s in self._shards if s is not shard]
+            self._merge_into(self._retired, shard)
+        self._local.shard = None
+
+    @staticmethod
+    def _merge_into(target, shard):
+        counters, histograms = target
+        shard_counters, shard_histograms = shard
+        for key, value in list(shard_counters.items()):
+            counters[key] = counters.get(key, 0) + value
+        for key, hist in list(shard_histograms.items()):
+            if key not in histograms:
+                histograms[key] = LatencyHistogram()
+            histograms[key].merge(hist)
+
+    def snapshot(self):
+        """Return merged ({key: value}, {key: LatencyHistogram}) over all threads."""
+        merged = ({}, {})
+        with self._registry_lock:
+            self._merge_into(merged, self._retired)
+            for shard in self._shards:
+                self._merge_into(merged, shard)
+        return merged
+
+
+class _Timer:
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start, self.labels)
+
+
+# -------------------------
+# Prometheus text format
+# -------------------------
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _render_histogram(lines, name, labels, hist):
+    """Append a Prometheus histogram built from a LatencyHistogram."""
+    bounds = [LatencyHistogram.bucket_bounds(i)[1] * 1e-6 for i in range(len(hist.counts))]
+    cumulative = 0
+    index = 0
+    for le in EXPORT_BUCKETS:
+        while index < len(hist.counts) and bounds[index] <= le:
+            cumulative += hist.counts[index]
+            index += 1
+        lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {hist.count}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {hist.total:.9f}")
+    lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+
+
+def render(metrics, stats=None, game=None) -> str:
+    """Render all server metrics in the Prometheus text exposition format."""
+    counters, histograms = metrics.snapshot()
+    lines = []
+
+    # Counters, grouped by name
+    by_name = {}
+    for (name, labels), value in counters.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    opened = sum(v for _, v in by_name.pop("connections_opened", []))
+    closed = sum(v for _, v in by_name.pop("connections_closed", []))
+    lines.append(f"# TYPE {PREFIX}connected_sockets gauge")
+    lines.append(f"{PREFIX}connected_sockets {opened - closed}")
+    lines.append(f"# TYPE {PREFIX}connections_total counter")
+    lines.append(f"{PREFIX}connections_total {opened}")
+
+    for name in sorted(by_name):
+        lines.append(f"# TYPE {PREFIX}{name}_total counter")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{PREFIX}{name}_total{_format_labels(labels)} {value}")
+
+    if game is not None:
+        lines.append(f"# TYPE {PREFIX}game_players gauge")
+        lines.append(f'{PREFIX}game_players{{game="0"}} {len(game.player_list)}')
+        lines.append(f"# TYPE {PREFIX}game_started gauge")
+        lines.append(f'{PREFIX}game_started{{game="0"}} {int(game.started)}')
+        if game.admission is not None:
+            lines.append(f"# TYPE {PREFIX}sessions_active gauge")
+            lines.append(f"{PREFIX}sessions_active {game.admission.active}")
+            lines.append(f"# TYPE {PREFIX}sessions_peak gauge")
+            lines.append(f"{PREFIX}sessions_peak {game.admission.peak}")
+
+    # Histograms recorded through Metrics.observe
+    hist_by_name = {}
+    for (name, labels), hist in histograms.items():
+        hist_by_name.setdefault(name, []).append((labels, hist))
+    for name in sorted(hist_by_name):
+        lines.append(f"# TYPE {PREFIX}{name}_seconds histogram")
+        for labels, hist in sorted(hist_by_name[name], key=lambda item: item[0]):
+            _render_histogram(lines, f"{PREFIX}{name}_seconds", labels, hist)
+
+    # Incoming messages, handling latency and lock wait from MessageStats
+    if stats is not None:
+        snapshot = sorted(stats.snapshot().items())
+        lines.append(f"# TYPE {PREFIX}messages_in_total counter")
+        for code, (latency, _, _) in snapshot:
+            lines.append(f'{PREFIX}messages_in_total{{type="{code}"}} {latency.count}')
+        lines.append(f"# TYPE {PREFIX}message_duration_seconds histogram")
+        for code, (latency, _, _) in snapshot:
+            _render_histogram(lines, f"{PREFIX}message_duration_seconds", (("type", code),), latency)
+        lines.append(f"# TYPE {PREFIX}lock_wait_seconds histogram")
+        for code, (_, lock_wait, _) in snapshot:
+            _render_histogram(lines, f"{PREFIX}lock_wait_seconds", (("type", code),), lock_wait)
+
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------
+# HTTP listener
+# -------------------------
+def start_metrics_server(port, metrics, stats=None, game=None, host=""):
+    """
+    Serve ``GET /metrics`` on a background daemon thread and return the server.
+    Rendering reads the game without taking the game lock: the values are a
+    best-effort snapshot, and scrapes never delay message handling.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render(metrics, stats, game).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # scrapes would flood the server console
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Metrics available on http://{host or '0.0.0.0'}:{port}/metrics")
+    return server
@@ -0,0 +1,82 @@
+import time
+
+# (messages per second, burst) allowed per connection and message type
+RATE_LIMITS = {
+    "USERNAME": (1.0, 5),
+    "GAME": (1.0, 5),
+    "SCORE": (1.0, 5),
+    "RESUME": (1.0, 3),
+    "SPECTATE": (1.0, 3),
+    "COMPRESS": (1.0, 3),
+    "STATS": (5.0, 10),
+    "MOVE": (30.0, 60),
+    "PONG": (2.0, 5),
+}
+
+# Limit of the message types not listed above
+DEFAULT_RATE_LIMIT = (2.0, 5)
+
+# Limit of all the messages of a connection together
+CONNECTION_RATE_LIMIT = (50.0, 100)
+
+
+class TokenBucket:
+    """
+    Allows *rate* events per second on average, and bursts of up to *burst*
+    events. The bucket is refilled lazily when an event is checked, so an idle
+    bucket costs nothing.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "last", "clock")
+
+    def __init__(self, rate: float, burst: float, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.clock = clock
+        self.last = clock()
+
+    def allow(self) -> bool:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class RateLimiter:
+    """
+    Token buckets of one connection: one per message type (created on its
+    first message) and one for the connection as a whole. Only used by the
+    connection's own thread, so it takes no lock.
+    """
+
+    def __init__(
+        self,
+        limits=None,
+        default=DEFAULT_RATE_LIMIT,
+        connection=CONNECTION_RATE_LIMIT,
+        clock=time.monotonic,
+    ):
+        self.limits = RATE_LIMITS if limits is None else limits
+        self.default = default
+        self.clock = clock
+        self.connection = TokenBucket(*connection, clock=clock)
+        self.buckets = {}
+        self.dropped = 0
+
+    def allow(self, code: str) -> bool:
+        """Whether a message of type *code* may be handled now."""
+        # Unlisted types share one bucket, so random codes cannot add buckets
+        key = code if code in self.limits else None
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            rate, burst = self.limits.get(key, self.default)
+            bucket = self.buckets[key] = TokenBucket(rate, burst, self.clock)
+        # The type's bucket first: a flood of one type keeps the others going
+        if bucket.allow() and self.connection.allow():
+            return True
+        self.dropped += 1
+        return False
@@ -0,0 +1,113 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class Timer:
+    """Handle of a scheduled call, returned by :meth:`TimerScheduler.call_at`."""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the call if it has not run yet (it stays in the heap until due)."""
+        self.cancelled = True
+
+
+class TimerScheduler:
+    """
+    Run callbacks at given times on one background thread.
+
+    Timers are kept in a heap ordered by deadline, so scheduling and
+    cancelling cost O(log n) and O(1) whatever the number of pending timers,
+    and the thread sleeps until the earliest deadline. One scheduler is shared
+    by all the games of the server. Callbacks run on the scheduler thread and
+    must be short: take the game lock, act, return.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap = []
+        self._counter = itertools.count()  # ties: first scheduled, first run
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def __len__(self):
+        with self._cond:
+            return sum(not entry[2].cancelled for entry in self._heap)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="timers", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def call_at(self, deadline: float, callback, *args) -> Timer:
+        """Run ``callback(*args)`` at *deadline* (a time of :attr:`clock`)."""
+        timer = Timer(deadline, callback, args)
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), timer))
+            # Wake the thread only if its sleep must now end earlier
+            if self._heap[0][2] is timer:
+                self._cond.notify()
+        return timer
+
+    def call_later(self, delay: float, callback, *args) -> Timer:
+        """Run ``callback(*args)`` in *delay* seconds."""
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def run_due(self) -> int:
+        """Run the callbacks that are due now, in this thread; return how many ran."""
+        ran = 0
+        for timer in self._pop_due():
+            self._call(timer)
+            ran += 1
+        return ran
+
+    def _pop_due(self):
+        due = []
+        with self._cond:
+            now = self.clock()
+            while self._heap and self._heap[0][0] <= now:
+                timer = heapq.heappop(self._heap)[2]
+                if not timer.cancelled:
+                    due.append(timer)
+        return due
+
+    def _call(self, timer):
+        if timer.cancelled:
+            return
+        try:
+            timer.callback(*timer.args)
+        except Exception as e:
+            print(f"Timer callback {timer.callback!r} failed: {e!r}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    # Discard cancelled timers at the top instead of waking for them
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - self.clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+            self.run_due()
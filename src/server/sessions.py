@@ -0,0 +1,142 @@
+import secrets
+import threading
+import time
+
+# Seconds between two heartbeat passes, and of silence before a session is dropped
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 20.0
+
+# Seconds a disconnected player keeps its place in the game, waiting for a RESUME
+RESUME_GRACE = 60.0
+
+
+class SessionRegistry:
+    """
+    The open client connections, kept alive by heartbeats.
+
+    A single reaper timer on the shared :class:`TimerScheduler` runs every
+    *interval* seconds: it sends ``PING`` to the logged-in sessions that have
+    been quiet for an interval, and closes the sessions that have been silent
+    for *timeout* seconds (clients answer ``PONG``, so only dead or
+    half-open connections stay silent that long). Closing the socket ends the
+    handler's receive loop.
+
+    Every logged-in player also gets a session token. When its connection
+    drops, the player stays in the game for *resume_grace* seconds, during
+    which a new connection can take it over with ``RESUME <token>``;
+    otherwise it is removed.
+    """
+
+    def __init__(
+        self,
+        interval=HEARTBEAT_INTERVAL,
+        timeout=HEARTBEAT_TIMEOUT,
+        clock=time.monotonic,
+        metrics=None,
+        resume_grace=RESUME_GRACE,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.clock = clock
+        self.metrics = metrics
+        self.resume_grace = resume_grace
+        self._handlers = {}  # connection id -> handler
+        self._players = {}  # session token -> player
+        self._detached = {}  # session token -> expiry timer, while disconnected
+        self._lock = threading.Lock()
+        self._scheduler = None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._handlers)
+
+    def handlers(self):
+        with self._lock:
+            return list(self._handlers.values())
+
+    def register(self, handler):
+        with self._lock:
+            self._handlers[handler.id] = handler
+
+    def unregister(self, handler):
+        with self._lock:
+            self._handlers.pop(handler.id, None)
+
+    def start(self, scheduler):
+        """Run the reaper on *scheduler* every interval (not if interval is 0)."""
+        self._scheduler = scheduler
+        if self.interval:
+            scheduler.call_later(self.interval, self._tick)
+        return self
+
+    def _tick(self):
+        try:
+            self.heartbeat()
+        finally:
+            self._scheduler.call_later(self.interval, self._tick)
+
+    def heartbeat(self):
+        """Ping the quiet sessions and close the silent ones; return the closed ones."""
+        now = self.clock()
+        reaped = []
+        for handler in self.handlers():
+            idle = now - handler.last_seen
+            if idle >= self.timeout:
+                print(f"Player {handler.id} silent for {idle:.0f} s, closing the connection")
+                handler.close()
+                reaped.append(handler)
+            elif idle >= self.interval and (handler.player.username or handler.spectating):
+                handler.send("PING")
+        if reaped and self.metrics:
+            self.metrics.inc("connections_reaped", (), len(reaped))
+        return reaped
+
+    # -- session tokens ------------------------------------------------------
+
+    def issue(self, player) -> str:
+        """A new session token for *player*."""
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._players[token] = player
+        return token
+
+    def forget(self, token):
+        with self._lock:
+            self._players.pop(token, None)
+            timer = self._detached.pop(token, None)
+        if timer is not None:
+            timer.cancel()
+
+    def detach(self, token, on_expire) -> bool:
+        """
+        Keep the session of *token* for the grace period after its connection
+        dropped; ``on_expire()`` runs if it is not resumed by then. Returns
+        False (and keeps nothing) when resuming is disabled.
+        """
+        if not self.resume_grace or self._scheduler is None:
+            return False
+        with self._lock:
+            if token not in self._players:
+                return False
+            self._detached[token] = self._scheduler.call_later(
+                self.resume_grace, self._expire, token, on_expire
+            )
+        return True
+
+    def resume(self, token):
+        """The player of *token*, now attached again, or None if the session is gone."""
+        with self._lock:
+            timer = self._detached.pop(token, None)
+            player = self._players.get(token)
+        if timer is not None:
+            timer.cancel()
+        if player is not None and self.metrics:
+            self.metrics.inc("sessions_resumed")
+        return player
+
+    def _expire(self, token, on_expire):
+        with self._lock:
+            if self._detached.pop(token, None) is None:
+                return  # resumed in the meantime
+            self._players.pop(token, None)
+        on_expire()
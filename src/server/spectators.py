@@ -0,0 +1,139 @@
+import threading
+import time
+
+# Frames per second sent to spectators, at most
+SPECTATOR_FPS = 4
+
+
+class SpectatorFeed:
+    """
+    The frames of one spectator, sent by its own thread.
+
+    Only the latest frame waits to be sent: a spectator that reads slower than
+    the frames come skips the intermediate states instead of slowing down the
+    server or the other spectators.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.pending = None
+        self.sent = 0
+        self.dropped = 0
+        self.closed = False
+        self._cond = threading.Condition()
+        self.thread = threading.Thread(
+            target=self._run, name=f"spectator-{handler.id}", daemon=True
+        )
+        self.thread.start()
+
+    def offer(self, frame: str):
+        with self._cond:
+            if self.pending is not None:
+                self.dropped += 1
+            self.pending = frame
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self.pending is None and not self.closed:
+                    self._cond.wait()
+                if self.closed:
+                    return
+                frame, self.pending = self.pending, None
+            if not self.handler.send(frame):
+                return
+            self.sent += 1
+
+
+class SpectatorHub:
+    """
+    Read-only spectators of a game, sent the round state and the standings.
+
+    The game calls :meth:`mark_dirty` on every change. Changes are coalesced:
+    a flush is scheduled on the shared :class:`TimerScheduler` at most
+    *max_fps* times per second, builds one ``STATE`` frame under the game
+    lock and hands the same string to every spectator's feed. A burst of
+    submissions thus costs one frame, whatever the number of spectators.
+    """
+
+    def __init__(self, game, lock, scheduler, max_fps=SPECTATOR_FPS, metrics=None):
+        self.game = game
+        self.lock = lock
+        self.scheduler = scheduler
+        self.max_fps = max_fps
+        self.metrics = metrics
+        self.frames = 0
+        self._feeds = {}  # connection id -> feed
+        self._lock = threading.Lock()
+        self._flush_timer = None
+        self._last_flush = float("-inf")
+
+    def __len__(self):
+        with self._lock:
+            return len(self._feeds)
+
+    def subscribe(self, handler):
+        """Add *handler* as a spectator (under the game lock) and send it the current state."""
+        feed = SpectatorFeed(handler)
+        with self._lock:
+            self._feeds[handler.id] = feed
+        feed.offer(self.frame())
+        return feed
+
+    def unsubscribe(self, handler):
+        with self._lock:
+            feed = self._feeds.pop(handler.id, None)
+        if feed is not None:
+            feed.close()
+
+    def mark_dirty(self):
+        """The game changed: schedule a frame, unless one is already due."""
+        with self._lock:
+            if self._flush_timer is not None or not self._feeds:
+                return
+            at = max(self.scheduler.clock(), self._last_flush + 1 / self.max_fps)
+            self._flush_timer = self.scheduler.call_at(at, self._flush)
+
+    def _flush(self):
+        with self._lock:
+            self._flush_timer = None
+            self._last_flush = self.scheduler.clock()
+        start = time.perf_counter()
+        with self.lock:
+            frame = self.frame()
+        with self._lock:
+            feeds = list(self._feeds.values())
+        for feed in feeds:
+            feed.offer(frame)
+        self.frames += 1
+        if self.metrics:
+            self.metrics.observe("spectator_frame", time.perf_counter() - start)
+            self.metrics.inc("spectator_frames_out", (), len(feeds))
+
+    def frame(self) -> str:
+        """
+        The ``STATE`` message of the game (to call under the game lock):
+        ``STATE <status> <round> <nb_round> <submitted> <players> <name|points|done> ...``
+        """
+        game = self.game
+        if not game.started:
+            status, current_round = "lobby", 0
+        elif game.waiting_for_next_round:
+            status, current_round = "round_over", game.current_round + 1
+        else:
+            status, current_round = "playing", game.current_round + 1
+
+        done = {p.username for p in game.player_list if game.submissions.get(p.id, False)}
+        parts = [
+            f"{name}|{points}|{int(name in done)}" for name, points in game.named_standings()
+        ]
+        return (
+            f"STATE {status} {current_round} {game.nb_round} {len(done)} "
+            f"{len(game.player_list)} " + " ".join(parts)
+        ).rstrip()
@@ -0,0 +1,179 @@
+import threading
+import time
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram.
+
+    Values are recorded in microseconds into log-linear buckets: 16 linear
+    sub-buckets per power of two, i.e. a relative error below ~6%, from 1 us
+    up to ~15 minutes. Recording is a couple of integer operations and a list
+    increment, with no lock: each histogram is meant to be written by one
+    thread only and merged for reading.
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    MAX_EXPONENT = 26
+    NB_BUCKETS = (MAX_EXPONENT + 2) * SUB_BUCKETS
+
+    def __init__(self):
+        self.counts = [0] * self.NB_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @classmethod
+    def bucket_index(cls, us: int) -> int:
+        if us < 2 * cls.SUB_BUCKETS:
+            return us
+        exponent = us.bit_length() - cls.SUB_BUCKET_BITS - 1
+        if exponent > cls.MAX_EXPONENT:
+            return cls.NB_BUCKETS - 1
+        return (exponent + 1) * cls.SUB_BUCKETS + (us >> exponent) - cls.SUB_BUCKETS
+
+    @classmethod
+    def bucket_bounds(cls, index: int):
+        """(lower, upper) bounds of a bucket, in microseconds."""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index, index + 1
+        exponent = index // cls.SUB_BUCKETS - 1
+        mantissa = index % cls.SUB_BUCKETS + cls.SUB_BUCKETS
+        return mantissa << exponent, (mantissa + 1) << exponent
+
+    def record(self, seconds: float):
+        us = int(seconds * 1e6)
+        self.counts[self.bucket_index(us)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other):
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100) in seconds (bucket midpoint)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(q / 100 * self.count)))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                lower, upper = self.bucket_bounds(i)
+                return min((lower + upper) / 2 * 1e-6, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MessageStats:
+    """
+    Per-message-type counts and latency histograms.
+
+    Every thread accumulates into its own shard (created on first use and
+    registered once), so recording never takes a lock. Readers merge all
+    shards into a snapshot; the numbers of a shard being written while it is
+    merged can be off by one sample, which is fine for monitoring.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = {}
+        self._registry_lock = threading.Lock()
+        self.started_at = time.monotonic()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            with self._registry_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _entry(self, code):
+        shard = self._shard()
+        entry = shard.get(code)
+        if entry is None:
+            # latency, lock wait, messages dropped by the rate limiter
+            entry = shard[code] = [LatencyHistogram(), LatencyHistogram(), 0]
+        return entry
+
+    def record(self, code: str, latency: float, lock_wait: float = 0.0):
+        entry = self._entry(code)
+        entry[0].record(latency)
+        entry[1].record(lock_wait)
+
+    def record_dropped(self, code: str):
+        """Count a message of type *code* dropped by the rate limiter."""
+        self._entry(code)[2] += 1
+
+    def retire_thread(self):
+        """
+        Fold the calling thread's shard into the retired totals.
+        Called when a connection thread ends so shards don't pile up.
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            return
+        with self._registry_lock:
+            # dicts compare by value: remove this exact shard, not an equal one
+            self._shards = [s for s in self._shards if s is not shard]
+            self._merge_into(self._retired, shard)
+        self._local.shard = None
+
+    @staticmethod
+    def _merge_into(target, shard):
+        for code, (latency, lock_wait, dropped) in list(shard.items()):
+            if code not in target:
+                target[code] = [LatencyHistogram(), LatencyHistogram(), 0]
+            target[code][0].merge(latency)
+            target[code][1].merge(lock_wait)
+            target[code][2] += dropped
+
+    def snapshot(self):
+        """Return {code: [latency histogram, lock wait histogram, dropped]} over all threads."""
+        merged = {}
+        with self._registry_lock:
+            self._merge_into(merged, self._retired)
+            for shard in self._shards:
+                self._merge_into(merged, shard)
+        return merged
+
+    def summary(self):
+        """
+        Return a list of (code, count, p50, p99, max, lock wait p99, dropped),
+        latencies in seconds, sorted by message type.
+        """
+        rows = []
+        for code, (latency, lock_wait, dropped) in sorted(self.snapshot().items()):
+            rows.append(
+                (
+                    code,
+                    latency.count,
+                    latency.percentile(50),
+                    latency.percentile(99),
+                    latency.max,
+                    lock_wait.percentile(99),
+                    dropped,
+                )
+            )
+        return rows
+
+    def format_protocol(self) -> str:
+        """Body of the ``STATS`` reply: ``<type>|<count>|<p50>|<p99>|<max>|<lock p99>`` in ms."""
+        return " ".join(
+            f"{code}|{count}|{p50 * 1e3:.3f}|{p99 * 1e3:.3f}|{mx * 1e3:.3f}|{lock99 * 1e3:.3f}"
+            for code, count, p50, p99, mx, lock99, _ in self.summary()
+        )
@@ -0,0 +1,83 @@
+"""Server-side verification of the scores submitted by the players.
+
+A client computes its score itself and sends ``SCORE <value> <pos>``. At the
+end of a round the server recomputes every submitted value from its final
+position, with one vectorised evaluation of the round's function over all
+the positions at once, so checking hundreds of players costs about as much
+as checking one.
+"""
+
+import math
+
+from ..shared.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# Tolerance between a submitted value and the recomputed one: the client's
+# scalar evaluation and the server's vectorised one may differ in the last bits
+SCORE_RTOL = 1e-9
+SCORE_ATOL = 1e-9
+
+# Reasons a submission is flagged
+NO_POSITION = "no_position"
+BAD_POSITION = "bad_position"
+OUT_OF_DOMAIN = "out_of_domain"
+MISMATCH = "mismatch"
+
+
+def parse_position(pos_str: str, dim: int):
+    """Coordinates of a ``x`` / ``x,y`` position string, or None if invalid."""
+    try:
+        coords = [float(c) for c in pos_str.split(",")]
+    except ValueError:
+        return None
+    if len(coords) != dim or not all(map(math.isfinite, coords)):
+        return None
+    return coords
+
+
+def verify_scores(function, claimed, positions):
+    """
+    Check the *claimed* values against *function* at *positions* (position
+    strings, None or "" when missing), aligned with *claimed*.
+
+    Returns ``(verified, flags)``: the values to rank the players with, and
+    ``{index: reason}`` for every flagged submission. A mismatching value is
+    replaced by the recomputed one; a submission whose position is missing,
+    invalid or outside the domain gets the worst score (inf). Missing (NaN)
+    and force-finished (inf) values are left as they are.
+    """
+    claimed = np.asarray(claimed, dtype=float)
+    verified = claimed.copy()
+    flags = {}
+
+    X = np.empty((len(claimed), function.dim))
+    checked = np.zeros(len(claimed), dtype=bool)
+    for i, (value, pos_str) in enumerate(zip(claimed.tolist(), positions)):
+        if value != value or value == float("inf"):
+            continue
+        if not pos_str:
+            flags[i] = NO_POSITION
+            continue
+        coords = parse_position(pos_str, function.dim)
+        if coords is None:
+            flags[i] = BAD_POSITION
+            continue
+        X[i] = coords
+        checked[i] = True
+
+    lo, hi = function.domain
+    outside = checked & ((X < lo) | (X > hi)).any(axis=1)
+    for i in np.flatnonzero(outside).tolist():
+        flags[i] = OUT_OF_DOMAIN
+    verified[list(flags)] = np.inf
+
+    rows = np.flatnonzero(checked & ~outside)
+    if len(rows):
+        values = function._eval_points(X[rows])
+        wrong = ~np.isclose(claimed[rows], values, rtol=SCORE_RTOL, atol=SCORE_ATOL)
+        verified[rows[wrong]] = values[wrong]
+        for i in rows[wrong].tolist():
+            flags[i] = MISMATCH
+
+    return verified, flags
@@ -0,0 +1,228 @@
+"""Empirical hardness of function seeds, from simulated plays.
+
+The difficulty presets only control how a landscape is drawn, so two seeds
+of the same difficulty can be very unequal in play. Here, every seed is
+played many times by simulated players (the strategies of
+:mod:`direct_search` making random moves now and then) with the game's step
+budget and reveal radius, and its hardness is the players' mean regret
+relative to the regret of a blind guess: about 0 when everybody finds the
+minimum, about 1 when playing is no better than picking a random point.
+
+Seeds are calibrated in chunks on a process pool. The random draws of a seed
+depend on that seed only, so its score does not depend on the chunking or
+on the number of workers.
+
+Usage::
+
+    python -m src.shared.calibration --dim 2 --difficulty medium --count 2000 --out hardness.json
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .direct_search import BatchGame, CompassSearch, FunctionBatch, Strategy, WindowDescent, play
+from .function_generator_claude import Difficulty, HiddenFunction
+
+# Game settings used when none are given (the server's defaults)
+NB_STEP = 10
+REVEAL_RADIUS = 0.5
+
+# Simulated players: (strategy, probability of a random move at each step)
+PLAYERS = (
+    (CompassSearch, 0.1),
+    (CompassSearch, 0.4),
+    (WindowDescent, 0.1),
+    (WindowDescent, 0.4),
+)
+
+# Plays of each simulated player per seed
+N_PLAYS = 16
+
+# Uniform points per seed estimating the regret of a blind guess
+BLIND_SAMPLES = 256
+
+# Mixed into the seed of the random draws of every calibrated seed
+CALIBRATION_SEED = 20_251
+
+
+class NoisyPlayer(Strategy):
+    """Plays *strategy*, except that with probability *epsilon* a move goes
+    in a random direction instead. *draws* holds the uniform numbers used
+    for that: ``(n, nb_step, 2)``, one pair per game and turn."""
+
+    def __init__(self, strategy, epsilon, draws):
+        self.strategy = strategy
+        self.epsilon = epsilon
+        self.draws = draws
+        self.name = f"{strategy.name}~{epsilon:g}"
+
+    def reset(self, game):
+        self.strategy.reset(game)
+        self.turn = 0
+
+    def choose(self, game):
+        direction = self.strategy.choose(game)
+        u = self.draws[:, self.turn]
+        self.turn += 1
+        random_direction = (u[:, 1] * 2 * game.dim).astype(int)
+        return np.where(u[:, 0] < self.epsilon, random_direction, direction)
+
+    def observe(self, game):
+        self.strategy.observe(game)
+
+
+def hardness(functions, nb_step=NB_STEP, reveal_radius=REVEAL_RADIUS, n_plays=N_PLAYS):
+    """Hardness of each of *functions* (sharing dim and domain), in process."""
+    functions = list(functions)
+    dim = functions[0].dim
+    lo, hi = functions[0].domain
+    n = len(functions)
+
+    # Per-seed draws: the players' random moves, then the blind guesses
+    draws = np.empty((n, len(PLAYERS), n_plays, nb_step, 2))
+    blind = np.empty((n, BLIND_SAMPLES, dim))
+    for i, f in enumerate(functions):
+        rng = np.random.default_rng([CALIBRATION_SEED, f.seed])
+        draws[i] = rng.random(draws.shape[1:])
+        blind[i] = rng.uniform(lo, hi, (BLIND_SAMPLES, dim))
+
+    batch = FunctionBatch(functions)
+    blind_regret = (batch.evaluate(blind) - batch.true_minimum[:, None]).mean(axis=1)
+
+    plays = FunctionBatch([f for f in functions for _ in range(n_plays)])
+    regret = np.zeros(n)
+    for p, (strategy, epsilon) in enumerate(PLAYERS):
+        player = NoisyPlayer(strategy(), epsilon, draws[:, p].reshape(n * n_plays, nb_step, 2))
+        game = play(player, BatchGame(plays, nb_step=nb_step, reveal_radius=reveal_radius))
+        regret += game.regret.reshape(n, n_plays).mean(axis=1)
+    regret /= len(PLAYERS)
+
+    return regret / np.maximum(blind_regret, 1e-12)
+
+
+def _calibrate_chunk(seeds, dim, difficulty, domain, nb_step, reveal_radius, n_plays):
+    functions = [HiddenFunction(s, dim=dim, difficulty=difficulty, domain=domain) for s in seeds]
+    return hardness(functions, nb_step, reveal_radius, n_plays)
+
+
+def calibrate(
+    seeds,
+    dim=1,
+    difficulty=Difficulty.MEDIUM,
+    domain=(-6, 6),
+    nb_step=NB_STEP,
+    reveal_radius=REVEAL_RADIUS,
+    n_plays=N_PLAYS,
+    workers=None,
+    chunk_size=50,
+):
+    """
+    Hardness of every seed of *seeds*, computed on *workers* processes (all
+    CPUs by default; 1 calibrates in this process). Returns an array aligned
+    with *seeds*.
+    """
+    args = (dim, difficulty, domain, nb_step, reveal_radius, n_plays)
+    results = map_seed_chunks(_calibrate_chunk, seeds, args, workers, chunk_size)
+    return np.concatenate(results) if results else np.empty(0)
+
+
+def map_seed_chunks(func, seeds, args=(), workers=None, chunk_size=50):
+    """
+    Return ``[func(chunk, *args) for chunk in chunks of seeds]``, computed on
+    *workers* processes (all CPUs by default; 1 runs in this process).
+    *func* must be a module-level function, for the pool to pickle it.
+    """
+    seeds = [int(s) for s in seeds]
+    chunks = [seeds[i : i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(chunks) <= 1:
+        return [func(chunk, *args) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, chunks, *([a] * len(chunks) for a in args)))
+
+
+# ---------------------------------------------------------------------------
+# Hardness tables
+# ---------------------------------------------------------------------------
+
+
+def save_table(path, seeds, scores, **settings):
+    """Write ``{seed: hardness}`` and the calibration *settings* as JSON."""
+    table = {
+        "settings": settings,
+        "hardness": {str(s): round(float(h), 6) for s, h in zip(seeds, scores)},
+    }
+    with open(path, "w") as f:
+        json.dump(table, f, indent=1)
+
+
+def load_table(path):
+    """Read a table written by :func:`save_table`: ``({seed: hardness}, settings)``."""
+    with open(path) as f:
+        table = json.load(f)
+    return {int(s): h for s, h in table["hardness"].items()}, table["settings"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry-point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Calibrate the hardness of function seeds")
+    parser.add_argument("--dim", type=int, default=1, help="Spatial dimension (default: 1)")
+    parser.add_argument(
+        "--difficulty",
+        default="medium",
+        choices=[d.value for d in Difficulty],
+        help="Difficulty preset (default: medium)",
+    )
+    parser.add_argument("--start", type=int, default=0, help="First seed (default: 0)")
+    parser.add_argument("--count", type=int, default=1000, help="Number of seeds (default: 1000)")
+    parser.add_argument("--steps", type=int, default=NB_STEP, help="Step budget (default: 10)")
+    parser.add_argument(
+        "--reveal-radius", type=float, default=REVEAL_RADIUS, help="Reveal radius (default: 0.5)"
+    )
+    parser.add_argument(
+        "--plays", type=int, default=N_PLAYS, help="Plays per simulated player and seed (default: 16)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all CPUs)")
+    parser.add_argument("--out", help="Write the hardness table to this JSON file")
+    args = parser.parse_args()
+
+    seeds = range(args.start, args.start + args.count)
+    start = time.perf_counter()
+    scores = calibrate(
+        seeds,
+        dim=args.dim,
+        difficulty=Difficulty(args.difficulty),
+        nb_step=args.steps,
+        reveal_radius=args.reveal_radius,
+        n_plays=args.plays,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+
+    n_games = len(scores) * args.plays * len(PLAYERS)
+    print(f"{len(scores)} seeds, {n_games} simulated games in {elapsed:.1f} s")
+    quantiles = np.quantile(scores, [0.1, 0.25, 0.5, 0.75, 0.9])
+    print("Hardness quantiles 10/25/50/75/90%: " + " ".join(f"{q:.3f}" for q in quantiles))
+
+    if args.out:
+        save_table(
+            args.out,
+            seeds,
+            scores,
+            dim=args.dim,
+            difficulty=args.difficulty,
+            nb_step=args.steps,
+            reveal_radius=args.reveal_radius,
+            n_plays=args.plays,
+        )
+        print(f"Table written to {args.out}")
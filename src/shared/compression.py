@@ -0,0 +1,46 @@
+"""Compression of large protocol messages, negotiated per connection.
+
+Messages are text lines. After ``COMPRESS zlib`` was agreed on, the server
+sends every message of at least :data:`THRESHOLD` bytes as the line
+``Z <base64 of the zlib-compressed message>``. The zlib stream is primed with
+:data:`ZDICT`, a dictionary of what the messages are made of, so that even
+short messages compress well. Broadcasts send the same message to every
+player, so the compressed line is cached and computed once per message.
+"""
+
+import base64
+import functools
+import zlib
+
+MODE = "zlib"
+
+# Messages shorter than this are sent as they are
+THRESHOLD = 512
+
+# Prefix of a compressed line
+PREFIX = "Z "
+
+# Shared dictionary: the most frequent strings last
+ZDICT = (
+    b"GAME start easy medium hard (-6, 6) FUNC SCORE "
+    b"STATE lobby playing round_over REVEAL "
+    b"0123456789 -0. 0. 1. 2. 3. 4. 5. -1. -2. -3. -4. -5. "
+    b"|0|0 |0|1 |1|0 |1|1 |0.|1.|-0.|-1.|2.|-2.|3.|-3.|4.|-4.|5.|-5."
+)
+
+
+@functools.lru_cache(maxsize=16)
+def compressed_line(message: str) -> bytes:
+    """The wire line (quoted, newline-terminated) of *message*, compressed."""
+    compressor = zlib.compressobj(level=6, zdict=ZDICT)
+    payload = compressor.compress(message.encode()) + compressor.flush()
+    return f'"{PREFIX}{base64.b64encode(payload).decode()}"\n'.encode()
+
+
+def decode(msg: str) -> str:
+    """*msg* as received, decompressed if it is a compressed line."""
+    if not msg.startswith(PREFIX):
+        return msg
+    decompressor = zlib.decompressobj(zdict=ZDICT)
+    data = decompressor.decompress(base64.b64decode(msg[len(PREFIX) :]))
+    return (data + decompressor.flush()).decode()
@@ -0,0 +1,315 @@
+"""Direct-search strategies played under the game's rules, over many seeds at once.
+
+:class:`FunctionBatch` stacks the terms of several :class:`HiddenFunction`
+objects into padded arrays, so that one NumPy expression evaluates every
+function of the batch. :class:`BatchGame` holds one game per function and
+applies the rules of the client: moves along an axis cost one step, the step
+size changes by x1.3 / x0.7 (rounded to 2 decimals, for free), positions are
+clamped to the domain, and the function is visible in a window of
+``reveal_radius`` around every visited position. The strategies below choose
+a move per game and turn, the way a bot or a student could.
+
+Example::
+
+    batch = FunctionBatch([HiddenFunction(s, dim=2) for s in range(1000)])
+    game = play(CompassSearch(), BatchGame(batch, nb_step=10))
+    print(game.regret.mean())
+"""
+
+import numpy as np
+
+
+# ---------------------------------------------------------------------------
+# Batched evaluation
+# ---------------------------------------------------------------------------
+
+
+class FunctionBatch:
+    """The functions of a list of :class:`HiddenFunction`, evaluated together.
+
+    All functions must share their dimension and domain. Missing terms are
+    padded with zeros: polynomials get leading zero coefficients, noise terms
+    and bumps a zero amplitude (bumps a unit width).
+    """
+
+    def __init__(self, functions):
+        functions = list(functions)
+        if not functions:
+            raise ValueError("A FunctionBatch needs at least one function")
+        dim, domain = functions[0].dim, tuple(functions[0].domain)
+        for f in functions:
+            if f.dim != dim or tuple(f.domain) != domain:
+                raise ValueError("All functions of a batch must share dim and domain")
+
+        self.functions = functions
+        self.dim = dim
+        self.domain = domain
+        n = len(functions)
+
+        degree = max(len(c) for f in functions for c in f._poly_list) - 1
+        self._poly = np.zeros((n, dim, degree + 1))
+        for i, f in enumerate(functions):
+            for k, coeffs in enumerate(f._poly_list):
+                self._poly[i, k, degree + 1 - len(coeffs) :] = coeffs
+
+        n_noise = max(len(f._noise_arr) for f in functions)
+        self._noise = np.zeros((n, n_noise, 1 + 2 * dim))
+        n_bumps = max(len(f._bumps_arr) for f in functions)
+        self._bumps = np.zeros((n, n_bumps, 2 + dim))
+        self._bumps[:, :, -1] = 1.0
+        for i, f in enumerate(functions):
+            self._noise[i, : len(f._noise_arr)] = f._noise_arr
+            self._bumps[i, : len(f._bumps_arr)] = f._bumps_arr
+
+        self.shift = np.array([f._shift for f in functions])
+        self.true_minimum = np.array([f.true_minimum["y"] for f in functions])
+
+    def __len__(self):
+        return len(self.functions)
+
+    def evaluate(self, X):
+        """Shifted values at *X*, of shape ``(n, dim)`` or ``(n, m, dim)``:
+        row ``i`` is evaluated with function ``i``. No tracking is done."""
+        X = np.asarray(X, dtype=float)
+        single = X.ndim == 2
+        if single:
+            X = X[:, None, :]
+        dim = self.dim
+
+        # Horner's scheme on every axis polynomial at once
+        P = np.zeros(X.shape)
+        for j in range(self._poly.shape[-1]):
+            P = P * X + self._poly[:, None, :, j]
+        z = P.sum(axis=-1)
+
+        noise = self._noise[:, None]  # (n, 1, K, 1 + 2 dim)
+        cos = np.cos(X[:, :, None, :] * noise[..., 1 : 1 + dim] + noise[..., 1 + dim :])
+        z += (noise[..., 0] * cos.prod(axis=-1)).sum(axis=-1)
+
+        bumps = self._bumps[:, None]  # (n, 1, B, 2 + dim)
+        d2 = ((X[:, :, None, :] - bumps[..., 1 : 1 + dim]) ** 2).sum(axis=-1)
+        z += (bumps[..., 0] * np.exp(-d2 / (2 * bumps[..., -1] ** 2))).sum(axis=-1)
+
+        z += self.shift[:, None]
+        return z[:, 0] if single else z
+
+
+# ---------------------------------------------------------------------------
+# Game rules
+# ---------------------------------------------------------------------------
+
+
+def grow_step(step):
+    """The client's ``increase_step``, elementwise."""
+    return np.where(step > 0.01, np.round(step * 1.3, 2), 0.02)
+
+
+def shrink_step(step):
+    """The client's ``decrease_step``, elementwise."""
+    return np.round(np.maximum(step * 0.7, 0), 2)
+
+
+# Smallest step size reachable with decrease_step
+MIN_STEP = 0.01
+
+# Gap kept to the border by a 1D move that would reach it (as in the client)
+BORDER_GAP_1D = 0.02
+
+
+class BatchGame:
+    """One round per function of a :class:`FunctionBatch`, played in lockstep.
+
+    Directions are integers: ``2 * k`` moves up along axis ``k`` and
+    ``2 * k + 1`` moves down (in 2D: 0 right, 1 left, 2 up, 3 down).
+    Positions start at the centre of the domain with a step size of 1.
+    """
+
+    def __init__(self, batch, nb_step=10, reveal_radius=0.5, step=1.0):
+        self.batch = batch
+        self.n = len(batch)
+        self.dim = batch.dim
+        self.domain = batch.domain
+        self.nb_step = nb_step
+        self.reveal_radius = reveal_radius
+
+        lo, hi = self.domain
+        self.pos = np.full((self.n, self.dim), (lo + hi) / 2)
+        self.step = np.full(self.n, float(step))
+        self.steps_left = nb_step
+        self.value = batch.evaluate(self.pos)
+        self.best_value = self.value.copy()
+        self.best_pos = self.pos.copy()
+
+    def grow_step(self, mask=None):
+        """Apply :func:`grow_step` to the games of *mask* (all by default)."""
+        self.step = np.where(True if mask is None else mask, grow_step(self.step), self.step)
+
+    def shrink_step(self, mask=None):
+        """Apply :func:`shrink_step` to the games of *mask* (all by default)."""
+        self.step = np.where(True if mask is None else mask, shrink_step(self.step), self.step)
+
+    def shrink_to_min(self, mask=None):
+        """Shrink the step as far as the client allows (:data:`MIN_STEP`)."""
+        while True:
+            before = self.step
+            self.shrink_step(mask)
+            if np.array_equal(before, self.step):
+                return
+
+    def look(self):
+        """Values at ``pos +/- reveal_radius`` along each axis, clamped to the
+        domain: ``(n, 2 * dim)``, indexed by direction. These points are in
+        the revealed window, so looking costs no step."""
+        lo, hi = self.domain
+        offsets = np.zeros((2 * self.dim, self.dim))
+        for k in range(self.dim):
+            offsets[2 * k, k] = self.reveal_radius
+            offsets[2 * k + 1, k] = -self.reveal_radius
+        X = np.clip(self.pos[:, None, :] + offsets, lo, hi)
+        return self.batch.evaluate(X)
+
+    def move(self, direction):
+        """Move every game one step in its *direction* (``(n,)`` integers)."""
+        if self.steps_left <= 0:
+            raise RuntimeError("No step left in this round")
+        direction = np.asarray(direction)
+        axis = direction // 2
+        sign = np.where(direction % 2 == 0, 1.0, -1.0)
+        rows = np.arange(self.n)
+        lo, hi = self.domain
+
+        target = self.pos[rows, axis] + sign * self.step
+        if self.dim == 1:
+            # The 1D client stops just short of a border it would reach
+            target = np.where(target >= hi, hi - BORDER_GAP_1D, target)
+            target = np.where(target <= lo, lo + BORDER_GAP_1D, target)
+        self.pos[rows, axis] = np.clip(target, lo, hi)
+
+        self.steps_left -= 1
+        self.value = self.batch.evaluate(self.pos)
+        improved = self.value < self.best_value
+        self.best_value = np.where(improved, self.value, self.best_value)
+        self.best_pos[improved] = self.pos[improved]
+
+    @property
+    def score(self):
+        """The submitted scores: the values at the current positions."""
+        return self.value
+
+    @property
+    def regret(self):
+        return self.value - self.batch.true_minimum
+
+
+def play(strategy, game):
+    """Let *strategy* play every remaining step of *game*, and return it."""
+    strategy.reset(game)
+    while game.steps_left > 0:
+        game.move(strategy.choose(game))
+        strategy.observe(game)
+    return game
+
+
+# ---------------------------------------------------------------------------
+# Strategies
+# ---------------------------------------------------------------------------
+
+
+class Strategy:
+    """Base class: :meth:`choose` returns the directions of the next move
+    (and may change the step size), :meth:`observe` sees its outcome."""
+
+    name = "strategy"
+
+    def reset(self, game):
+        pass
+
+    def choose(self, game):
+        raise NotImplementedError
+
+    def observe(self, game):
+        pass
+
+
+class RandomSearch(Strategy):
+    """Random directions at a constant step size: the baseline."""
+
+    name = "random"
+
+    def __init__(self, seed=None):
+        self.seed = seed
+
+    def reset(self, game):
+        self.rng = np.random.default_rng(self.seed)
+
+    def choose(self, game):
+        return self.rng.integers(0, 2 * game.dim, game.n)
+
+
+class CompassSearch(Strategy):
+    """Compass (coordinate) search with moves as the only probes.
+
+    A direction is kept while it improves on the anchor value, growing the
+    step. A move that does not improve is undone by the opposite move, and
+    the next direction is tried; once all of them failed around an anchor,
+    the step shrinks.
+    """
+
+    name = "compass"
+
+    def reset(self, game):
+        self.anchor = game.value.copy()
+        self.direction = np.zeros(game.n, dtype=int)
+        self.failures = np.zeros(game.n, dtype=int)
+        self.returning = np.zeros(game.n, dtype=bool)
+
+    def choose(self, game):
+        # Undoing a move means moving in the opposite direction (d ^ 1)
+        return np.where(self.returning, self.direction ^ 1, self.direction)
+
+    def observe(self, game):
+        returned = self.returning
+        improved = ~returned & (game.value < self.anchor)
+        failed = ~returned & ~improved
+
+        self.anchor = np.where(improved | returned, game.value, self.anchor)
+        game.grow_step(improved)
+        self.failures = np.where(improved, 0, self.failures)
+
+        # Back at the anchor: try the next direction, shrink after a full turn
+        self.direction = np.where(returned, (self.direction + 1) % (2 * game.dim), self.direction)
+        self.failures = self.failures + failed
+        exhausted = failed & (self.failures >= 2 * game.dim)
+        game.shrink_step(exhausted)
+        self.failures = np.where(exhausted, 0, self.failures)
+        self.returning = failed
+
+
+class WindowDescent(Strategy):
+    """Descent along the lowest point visible at the edge of the window.
+
+    Each move goes towards the lowest of the ``2 * dim`` revealed points at
+    ``reveal_radius`` from the turtle. The step grows after an improving
+    move and shrinks after a worsening one, and the last move is made with
+    the smallest step so that it cannot spoil the final position.
+    """
+
+    name = "window"
+
+    def reset(self, game):
+        self.previous = game.value.copy()
+
+    def choose(self, game):
+        around = game.look()
+        direction = around.argmin(axis=1)
+        if game.steps_left == 1:
+            game.shrink_to_min()
+        return direction
+
+    def observe(self, game):
+        game.grow_step(game.value < self.previous)
+        game.shrink_step(game.value > self.previous)
+        self.previous = game.value.copy()
+
+
+STRATEGIES = {s.name: s for s in (RandomSearch, CompassSearch, WindowDescent)}
@@ -0,0 +1,233 @@
+"""Banks of pre-vetted functions, stored as memory-mapped NPY files.
+
+Building a :class:`HiddenFunction` means drawing its terms and locating its
+true minimum, which costs milliseconds per function (more for hard ones and
+in 2D). A bank holds, for one (dim, difficulty, domain), the ready-made
+functions of many seeds: one fixed-size record per seed, with the padded
+landscape terms, the shift, the true minimum and hardness features. The file
+is opened with ``np.load(mmap_mode="r")``, so loading a bank costs the same
+whatever its size, and a function is rebuilt from its record by
+:meth:`HiddenFunction.from_record` in microseconds.
+
+Build a bank offline::
+
+    python -m src.shared.function_bank --dim 2 --difficulty medium --count 5000 --out-dir banks
+
+then start the server and the clients with ``--function-bank banks``.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from .calibration import NB_STEP, REVEAL_RADIUS, hardness, map_seed_chunks
+from .function_generator_claude import DIFFICULTY_CONFIGS, Difficulty, HiddenFunction
+
+# Padded sizes of the term arrays, large enough for every difficulty preset
+MAX_POLY = max(cfg["degree_range"][1] for cfg in DIFFICULTY_CONFIGS.values()) + 1
+MAX_NOISE = max(cfg["noise_count_range"][1] for cfg in DIFFICULTY_CONFIGS.values())
+MAX_BUMPS = max(cfg["bump_count_range"][1] for cfg in DIFFICULTY_CONFIGS.values())
+
+# Vetting: the true minimum must be this far inside the domain
+BORDER_MARGIN = 0.1
+
+
+def bank_dtype(dim):
+    """The structured dtype of the records of a bank of *dim*-dimensional functions."""
+    return np.dtype(
+        [
+            ("seed", "<i8"),
+            ("difficulty", "U6"),
+            ("domain", "<f8", (2,)),
+            # Landscape terms, padded: polynomial k is poly[k, :poly_len[k]]
+            ("poly_len", "<i4", (dim,)),
+            ("poly", "<f8", (dim, MAX_POLY)),
+            ("n_noise", "<i4"),
+            ("noise", "<f8", (MAX_NOISE, 1 + 2 * dim)),
+            ("n_bumps", "<i4"),
+            ("bumps", "<f8", (MAX_BUMPS, 2 + dim)),
+            # Shift and true minimum (minimum_gap is NaN unless certified)
+            ("shift", "<f8"),
+            ("min_x", "<f8", (dim,)),
+            ("min_y", "<f8"),
+            ("minimum_gap", "<f8"),
+            # Hardness features
+            ("hardness", "<f8"),
+            ("value_range", "<f8"),
+        ]
+    )
+
+
+def bank_path(directory, dim, difficulty, domain=(-6, 6)):
+    """Standard file name of the bank of (dim, difficulty, domain) in *directory*."""
+    lo, hi = domain
+    return os.path.join(directory, f"functions_{dim}d_{Difficulty(difficulty).value}_{lo:g}_{hi:g}.npy")
+
+
+def fill_record(record, function, hardness_score=np.nan):
+    """Write *function* and its hardness into the bank record *record*."""
+    record["seed"] = function.seed
+    record["difficulty"] = function._difficulty.value
+    record["domain"] = function.domain
+    for k, coeffs in enumerate(function._poly_list):
+        record["poly_len"][k] = len(coeffs)
+        record["poly"][k, : len(coeffs)] = coeffs
+    record["n_noise"] = len(function._noise_arr)
+    record["noise"][: len(function._noise_arr)] = function._noise_arr
+    record["n_bumps"] = len(function._bumps_arr)
+    record["bumps"][: len(function._bumps_arr)] = function._bumps_arr
+    record["shift"] = function._shift
+    record["min_x"] = np.atleast_1d(function.true_minimum["x"])
+    record["min_y"] = function.true_minimum["y"]
+    record["minimum_gap"] = np.nan if function.minimum_gap is None else function.minimum_gap
+    record["hardness"] = hardness_score
+
+    lo, hi = function.domain
+    samples = np.random.default_rng(function.seed).uniform(lo, hi, (1000, function.dim))
+    record["value_range"] = function._eval_points(samples).max() - record["min_y"]
+
+
+def _vetted(function):
+    lo, hi = function.domain
+    min_x = np.atleast_1d(function.true_minimum["x"])
+    return bool(((min_x - lo >= BORDER_MARGIN) & (hi - min_x >= BORDER_MARGIN)).all())
+
+
+def _build_chunk(seeds, dim, difficulty, domain, minimum_method, nb_step, reveal_radius):
+    functions = [
+        HiddenFunction(s, dim=dim, difficulty=difficulty, domain=domain, minimum_method=minimum_method)
+        for s in seeds
+    ]
+    functions = [f for f in functions if _vetted(f)]
+    records = np.zeros(len(functions), dtype=bank_dtype(dim))
+    if functions:
+        scores = hardness(functions, nb_step, reveal_radius)
+        for record, function, score in zip(records, functions, scores):
+            fill_record(record, function, score)
+    return records
+
+
+def build_bank(
+    seeds,
+    dim=1,
+    difficulty=Difficulty.MEDIUM,
+    domain=(-6, 6),
+    minimum_method=None,
+    nb_step=NB_STEP,
+    reveal_radius=REVEAL_RADIUS,
+    workers=None,
+    chunk_size=50,
+):
+    """
+    Build the records of the vetted functions of *seeds*, sorted by seed.
+    Functions whose minimum lies on the border of the domain are left out.
+    The minimum is certified by branch-and-bound up to 2D unless
+    *minimum_method* says otherwise.
+    """
+    if minimum_method is None:
+        minimum_method = "bnb" if dim <= 2 else "grid"
+    args = (dim, difficulty, tuple(domain), minimum_method, nb_step, reveal_radius)
+    chunks = map_seed_chunks(_build_chunk, seeds, args, workers, chunk_size)
+    records = np.concatenate(chunks) if chunks else np.zeros(0, dtype=bank_dtype(dim))
+    return np.sort(records, order="seed")
+
+
+def save_bank(path, records):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.save(path, records, allow_pickle=False)
+
+
+class FunctionBank:
+    """A bank file, memory-mapped: records are only read when accessed."""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = np.load(path, mmap_mode="r", allow_pickle=False)
+        if len(self.records) == 0:
+            raise ValueError(f"Empty function bank {path}")
+        first = self.records[0]
+        self.dim = len(first["poly_len"])
+        self.difficulty = Difficulty(str(first["difficulty"]))
+        self.domain = tuple(float(x) for x in first["domain"])
+        self._seeds = None
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def seeds(self):
+        # Copied on first use: a strided read of the whole file otherwise
+        if self._seeds is None:
+            self._seeds = np.array(self.records["seed"])
+        return self._seeds
+
+    def function(self, index):
+        """The function of the record at *index*."""
+        return HiddenFunction.from_record(self.records[index], self.difficulty, self.domain)
+
+    def index_of(self, seed):
+        """Index of the record of *seed*, or None if the bank does not hold it."""
+        index = int(np.searchsorted(self.seeds, seed))
+        if index < len(self.records) and self.seeds[index] == seed:
+            return index
+        return None
+
+    def indices_in_band(self, band):
+        """Indices of the records whose hardness lies in ``band = (low, high)``."""
+        lo, hi = band
+        h = self.records["hardness"]
+        return np.flatnonzero((h >= lo) & (h <= hi))
+
+
+def open_bank(directory, dim, difficulty, domain=(-6, 6)):
+    """The bank of (dim, difficulty, domain) in *directory*, or None if there is none."""
+    if directory is None:
+        return None
+    path = bank_path(directory, dim, difficulty, domain)
+    if not os.path.exists(path):
+        print(f"No function bank {path}, functions will be generated")
+        return None
+    return FunctionBank(path)
+
+
+# ---------------------------------------------------------------------------
+# CLI entry-point
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a bank of vetted functions")
+    parser.add_argument("--dim", type=int, default=1, help="Spatial dimension (default: 1)")
+    parser.add_argument(
+        "--difficulty",
+        default="medium",
+        choices=[d.value for d in Difficulty],
+        help="Difficulty preset (default: medium)",
+    )
+    parser.add_argument(
+        "--domain", type=float, nargs=2, default=(-6, 6), help="Domain bounds (default: -6 6)"
+    )
+    parser.add_argument("--start", type=int, default=0, help="First seed (default: 0)")
+    parser.add_argument("--count", type=int, default=1000, help="Number of seeds (default: 1000)")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all CPUs)")
+    parser.add_argument("--out-dir", default="banks", help="Bank directory (default: banks)")
+    args = parser.parse_args()
+
+    domain = tuple(args.domain)
+    difficulty = Difficulty(args.difficulty)
+    start = time.perf_counter()
+    records = build_bank(
+        range(args.start, args.start + args.count),
+        dim=args.dim,
+        difficulty=difficulty,
+        domain=domain,
+        workers=args.workers,
+    )
+    path = bank_path(args.out_dir, args.dim, difficulty, domain)
+    save_bank(path, records)
+    print(
+        f"{len(records)} of {args.count} seeds vetted in {time.perf_counter() - start:.1f} s, "
+        f"{records.itemsize} bytes per record, written to {path}"
+    )
@@ -65,28 +65,54 @@ class HiddenFunction:
     seed : int
         Deterministic seed for reproducible function generation.
     dim : int
-        Spatial dimension (1 or 2).
+        Spatial dimension (any positive integer; the game uses 1 or 2).
     difficulty : Difficulty
         Controls complexity of the generated landscape.
     domain : tuple[float, float]
         The (min, max) interval on which the function is defined (same for each axis).
+    minimum_method : str
+        How the true minimum is found: ``"grid"`` (dense grid scan plus local
+        refinement) or ``"bnb"`` (branch-and-bound, certified to within
+        ``minimum_tol``; see :attr:`minimum_gap`).
+    minimum_tol : float
+        Certified tolerance of the ``"bnb"`` method.
     """
 
-    def __init__(self, seed, dim=1, difficulty=Difficulty.MEDIUM, domain=(-6, 6)):
+    MINIMUM_METHODS = ("grid", "bnb")
+
+    def __init__(
+        self,
+        seed,
+        dim=1,
+        difficulty=Difficulty.MEDIUM,
+        domain=(-6, 6),
+        minimum_method="grid",
+        minimum_tol=1e-3,
+    ):
+        if minimum_method not in self.MINIMUM_METHODS:
+            raise ValueError(
+                f"minimum_method must be one of {self.MINIMUM_METHODS}, got {minimum_method!r}"
+            )
+        if int(dim) != dim or dim < 1:
+            raise ValueError(f"dim must be a positive integer, got {dim!r}")
         self.seed = seed
-        self.dim = dim
+        self.dim = dim = int(dim)
         self._difficulty = difficulty
         self._domain = domain
+        self._minimum_method = minimum_method
+        self._minimum_tol = minimum_tol
+        self._minimum_gap = None
+        self._minimum_evals = None
 
         rng = np.random.default_rng(seed)
-        if dim == 1:
-            self._poly_coeffs, self._noise_terms, self._bumps = self._build(rng)
-        else:
-            self._poly_coeffs_x, self._poly_coeffs_y, self._noise_terms, self._bumps = self._build_2d(rng)
+        self._set_terms(*self._build(rng))
 
         # Compute raw minimum, then shift so the function is strictly positive (min = 0.01)
         self._shift = 0.0
-        raw_minimum = self._compute_true_minimum()
+        if minimum_method == "bnb":
+            raw_minimum = self._branch_and_bound_minimum(minimum_tol)
+        else:
+            raw_minimum = self._compute_true_minimum()
         self._shift = max(0.0, -raw_minimum["y"] + 0.01)
         self._true_minimum = {
             "x": raw_minimum["x"],
@@ -98,94 +124,55 @@ class HiddenFunction:
     # -- construction -------------------------------------------------------
 
     def _build(self, rng):
-        cfg = DIFFICULTY_CONFIGS[self._difficulty]
-        lo, hi = self._domain
+        """Draw the landscape terms from *rng*.
 
-        # Even-degree polynomial from random roots
-        degree_lo, degree_hi = cfg["degree_range"]
-        # Pick an even degree in [degree_lo, degree_hi]
-        possible_degrees = list(range(degree_lo, degree_hi + 1, 2))
-        degree = rng.choice(possible_degrees)
-        roots = rng.uniform(lo, hi, degree)
-        poly_coeffs = np.poly(roots)  # leading-coeff = 1, highest degree first
-
-        # Normalize so the range over the domain is ~10, then scale down
-        xs = np.linspace(lo, hi, 1000)
-        ys = np.polyval(poly_coeffs, xs)
-        value_range = ys.max() - ys.min()
-        if value_range > 0:
-            poly_coeffs = poly_coeffs * (10.0 / value_range)
-        poly_coeffs = poly_coeffs / cfg["poly_scale"]
-
-        # Sinusoidal noise terms
-        n_noise = rng.integers(
-            cfg["noise_count_range"][0], cfg["noise_count_range"][1] + 1
-        )
-        noise_terms = []
-        for _ in range(n_noise):
-            amp = rng.uniform(*cfg["noise_amplitude_range"])
-            freq = rng.uniform(
-                cfg["noise_frequency_range"][0], cfg["noise_frequency_range"][1]
-            )
-            phase = rng.uniform(0, 2 * np.pi)
-            noise_terms.append((amp, freq, phase))
-
-        # Gaussian bumps (negative = pit / extra local min, positive = hill)
-        n_bumps = rng.integers(
-            cfg["bump_count_range"][0], cfg["bump_count_range"][1] + 1
-        )
-        bumps = []
-        for _ in range(n_bumps):
-            amp = rng.uniform(*cfg["bump_amplitude_range"])
-            sign = rng.choice([-1, 1])
-            center = rng.uniform(lo, hi)
-            width = rng.uniform(0.3, 1.5)
-            bumps.append((sign * amp, center, width))
-
-        return poly_coeffs, noise_terms, bumps
-
-    def _build_2d(self, rng):
+        The draws happen in a fixed order (axis polynomials, then noise terms,
+        then bumps, coordinates axis by axis), so a seed gives the same
+        function for a given dimension whatever code path evaluates it.
+        """
         cfg = DIFFICULTY_CONFIGS[self._difficulty]
         lo, hi = self._domain
+        dim = self.dim
 
-        # Two independent 1D polynomials: p_x(x) + p_y(y) forms the base
+        # One even-degree polynomial per axis, from random roots:
+        # p_1(x_1) + ... + p_N(x_N) forms the base
         degree_lo, degree_hi = cfg["degree_range"]
         possible_degrees = list(range(degree_lo, degree_hi + 1, 2))
 
-        poly_coeffs_list = []
-        for _ in range(2):
+        poly_list = []
+        for _ in range(dim):
             degree = rng.choice(possible_degrees)
             roots = rng.uniform(lo, hi, degree)
-            coeffs = np.poly(roots)
+            coeffs = np.poly(roots)  # leading-coeff = 1, highest degree first
+
+            # Normalize so the range over the domain is ~10, then scale down
             xs = np.linspace(lo, hi, 1000)
             ys = np.polyval(coeffs, xs)
             value_range = ys.max() - ys.min()
             if value_range > 0:
                 coeffs = coeffs * (10.0 / value_range)
             coeffs = coeffs / cfg["poly_scale"]
-            poly_coeffs_list.append(coeffs)
-
-        poly_coeffs_x, poly_coeffs_y = poly_coeffs_list
+            poly_list.append(coeffs)
 
-        # 2D sinusoidal noise: amp * cos(freq_x * x + phase_x) * cos(freq_y * y + phase_y)
-        # Product form creates an egg-carton pattern with well-defined local minima
+        # Sinusoidal noise: amp * prod_k cos(freq_k * x_k + phase_k)
+        # In 2D the product form creates an egg-carton pattern with
+        # well-defined local minima
         n_noise = rng.integers(
             cfg["noise_count_range"][0], cfg["noise_count_range"][1] + 1
         )
         noise_terms = []
         for _ in range(n_noise):
             amp = rng.uniform(*cfg["noise_amplitude_range"])
-            freq_x = rng.uniform(
-                cfg["noise_frequency_range"][0], cfg["noise_frequency_range"][1]
-            )
-            freq_y = rng.uniform(
-                cfg["noise_frequency_range"][0], cfg["noise_frequency_range"][1]
-            )
-            phase_x = rng.uniform(0, 2 * np.pi)
-            phase_y = rng.uniform(0, 2 * np.pi)
-            noise_terms.append((amp, freq_x, freq_y, phase_x, phase_y))
+            freqs = [
+                rng.uniform(
+                    cfg["noise_frequency_range"][0], cfg["noise_frequency_range"][1]
+                )
+                for _ in range(dim)
+            ]
+            phases = [rng.uniform(0, 2 * np.pi) for _ in range(dim)]
+            noise_terms.append((amp, *freqs, *phases))
 
-        # 2D Gaussian bumps
+        # Isotropic Gaussian bumps (negative = pit / extra local min, positive = hill)
         n_bumps = rng.integers(
             cfg["bump_count_range"][0], cfg["bump_count_range"][1] + 1
         )
@@ -193,18 +180,68 @@ class HiddenFunction:
         for _ in range(n_bumps):
             amp = rng.uniform(*cfg["bump_amplitude_range"])
             sign = rng.choice([-1, 1])
-            center_x = rng.uniform(lo, hi)
-            center_y = rng.uniform(lo, hi)
+            center = [rng.uniform(lo, hi) for _ in range(dim)]
             width = rng.uniform(0.3, 1.5)
-            bumps.append((sign * amp, center_x, center_y, width))
+            bumps.append((sign * amp, *center, width))
 
-        return poly_coeffs_x, poly_coeffs_y, noise_terms, bumps
+        return poly_list, noise_terms, bumps
+
+    def _set_terms(self, poly_list, noise_terms, bumps):
+        """Install the landscape terms and their derived arrays."""
+        dim = self.dim
+        self._poly_list, self._noise_terms, self._bumps = poly_list, noise_terms, bumps
+        if dim == 1:
+            self._poly_coeffs = poly_list[0]
+        elif dim == 2:
+            self._poly_coeffs_x, self._poly_coeffs_y = poly_list
+        # Term parameters as arrays: noise rows are (amp, freqs..., phases...),
+        # bump rows are (amp, centers..., width)
+        self._noise_arr = np.array(noise_terms, dtype=float).reshape(-1, 1 + 2 * dim)
+        self._bumps_arr = np.array(bumps, dtype=float).reshape(-1, 2 + dim)
+        # First and second derivatives of the per-axis polynomials
+        self._poly_derivs = [(np.polyder(c), np.polyder(c, 2)) for c in poly_list]
+
+    @classmethod
+    def from_record(cls, record, difficulty, domain):
+        """Rebuild a function from a row of a function bank.
+
+        The terms, shift and true minimum are read from the record (see
+        :mod:`function_bank` for its fields), so nothing is recomputed.
+        """
+        self = cls.__new__(cls)
+        dim = len(record["poly_len"])
+        self.seed = int(record["seed"])
+        self.dim = dim
+        self._difficulty = difficulty
+        self._domain = domain
+        gap = float(record["minimum_gap"])
+        self._minimum_method = "grid" if np.isnan(gap) else "bnb"
+        self._minimum_tol = None
+        self._minimum_gap = None if np.isnan(gap) else gap
+        self._minimum_evals = None
+
+        poly_list = [
+            np.array(record["poly"][k, : record["poly_len"][k]]) for k in range(dim)
+        ]
+        noise_terms = [tuple(map(float, row)) for row in record["noise"][: record["n_noise"]]]
+        bumps = [tuple(map(float, row)) for row in record["bumps"][: record["n_bumps"]]]
+        self._set_terms(poly_list, noise_terms, bumps)
+
+        self._shift = float(record["shift"])
+        min_x = record["min_x"]
+        self._true_minimum = {
+            "x": float(min_x[0]) if dim == 1 else tuple(float(c) for c in min_x),
+            "y": float(record["min_y"]),
+        }
+        self.reset()
+        return self
 
     def _raw_eval(self, x):
         """Evaluate the function without tracking.
 
         For dim=1, x is a scalar (or 1-D array).
-        For dim=2, x is a tuple/list/array of (x1, x2), or two arrays for vectorised calls.
+        For dim>=2, x is a tuple/list/array of the dim coordinates, each a
+        scalar or an array (broadcast together) for vectorised calls.
         """
         if self.dim == 1:
             y = np.polyval(self._poly_coeffs, x)
@@ -213,8 +250,10 @@ class HiddenFunction:
             for amp, center, width in self._bumps:
                 y = y + amp * np.exp(-((x - center) ** 2) / (2 * width**2))
             return y + self._shift
-        else:
+        elif self.dim == 2:
             return self._raw_eval_2d(x) + self._shift
+        else:
+            return self._eval_array(self._stack(x)) + self._shift
 
     def _raw_eval_2d(self, pos):
         """Evaluate the 2D function.
@@ -231,55 +270,441 @@ class HiddenFunction:
             z = z + amp * np.exp(-(((x - cx) ** 2) + ((y - cy) ** 2)) / (2 * width**2))
         return z
 
-    def _compute_true_minimum(self):
-        lo, hi = self._domain
+    def _eval_array(self, X):
+        """Unshifted values at *X* of shape ``(..., dim)``, any dimension.
+
+        All terms of a kind are evaluated together along extra trailing axes.
+        Agrees with the dim 1 and 2 loops of :meth:`_raw_eval` up to rounding.
+        """
+        z = np.zeros(X.shape[:-1])
+        for k, coeffs in enumerate(self._poly_list):
+            z = z + np.polyval(coeffs, X[..., k])
+
+        dim = self.dim
+        amp = self._noise_arr[:, 0]
+        freqs = self._noise_arr[:, 1 : 1 + dim]
+        phases = self._noise_arr[:, 1 + dim :]
+        cos = np.cos(X[..., None, :] * freqs + phases)  # (..., K, dim)
+        z = z + (amp * cos.prod(axis=-1)).sum(axis=-1)
+
+        amp = self._bumps_arr[:, 0]
+        width2 = self._bumps_arr[:, -1] ** 2
+        deltas = X[..., None, :] - self._bumps_arr[:, 1 : 1 + dim]  # (..., B, dim)
+        z = z + (amp * np.exp(-(deltas**2).sum(axis=-1) / (2 * width2))).sum(axis=-1)
+        return z
 
+    def _stack(self, x):
+        """Turn an input of :meth:`_raw_eval` into a ``(..., dim)`` array."""
         if self.dim == 1:
-            from scipy.optimize import minimize_scalar
+            return np.asarray(x, dtype=float)[..., None]
+        coords = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in x))
+        return np.stack(coords, axis=-1)
+
+    def _derivatives(self, X, hessian=False):
+        """Value, gradient and optionally Hessian from closed-form derivatives.
+
+        *X* has shape ``(..., dim)``. Returns ``(f, grad, hess)`` with shapes
+        ``(...)``, ``(..., dim)`` and ``(..., dim, dim)`` (``hess`` is ``None``
+        unless requested). All terms of a kind are evaluated together along
+        extra trailing axes, so ``f`` agrees with :meth:`_raw_eval` up to
+        rounding.
+        """
+        dim = self.dim
+        shape = X.shape[:-1]
+
+        f = np.zeros(shape)
+        grad = np.zeros(shape + (dim,))
+        hess = np.zeros(shape + (dim, dim)) if hessian else None
+
+        # Polynomials: one per axis, no cross terms
+        for k, (coeffs, (d1, d2)) in enumerate(zip(self._poly_list, self._poly_derivs)):
+            f = f + np.polyval(coeffs, X[..., k])
+            grad[..., k] = np.polyval(d1, X[..., k])
+            if hessian:
+                hess[..., k, k] = np.polyval(d2, X[..., k])
+
+        # Noise: amp * prod_k cos(freq_k * x_k + phase_k)
+        amp = self._noise_arr[:, 0]
+        freqs = self._noise_arr[:, 1 : 1 + dim]
+        args = X[..., None, :] * freqs + self._noise_arr[:, 1 + dim :]  # (..., K, dim)
+        cos, sin = np.cos(args), np.sin(args)
+        # amp times the product of the cosines of all *other* axes
+        if dim == 1:
+            others = np.broadcast_to(amp[:, None], cos.shape)
+        elif dim == 2:
+            others = amp[:, None] * cos[..., ::-1]
+        else:
+            ones = np.ones(cos.shape[:-1] + (1,))
+            before = np.cumprod(np.concatenate([ones, cos[..., :-1]], axis=-1), axis=-1)
+            after = np.cumprod(np.concatenate([ones, cos[..., :0:-1]], axis=-1), axis=-1)
+            others = amp[:, None] * before * after[..., ::-1]  # (..., K, dim)
+        prod = others[..., 0] * cos[..., 0]  # amp * prod_k cos_k
+        f = f + prod.sum(axis=-1)
+        grad -= (others * freqs * sin).sum(axis=-2)
+        if hessian:
+            for k in range(dim):
+                hess[..., k, k] -= (prod * freqs[:, k] ** 2).sum(axis=-1)
+                for j in range(k + 1, dim):
+                    cross = amp * freqs[:, k] * freqs[:, j] * sin[..., k] * sin[..., j]
+                    for i in range(dim):
+                        if i != k and i != j:
+                            cross = cross * cos[..., i]
+                    hess[..., k, j] += cross.sum(axis=-1)
+                    hess[..., j, k] = hess[..., k, j]
+
+        # Gaussian bumps: amp * exp(-|x - c|^2 / (2 w^2))
+        amp = self._bumps_arr[:, 0]
+        width2 = self._bumps_arr[:, -1] ** 2
+        deltas = X[..., None, :] - self._bumps_arr[:, 1 : 1 + dim]  # (..., B, dim)
+        bump = amp * np.exp(-(deltas**2).sum(axis=-1) / (2 * width2))  # (..., B)
+        scaled = bump / width2
+        f = f + bump.sum(axis=-1)
+        grad -= (scaled[..., None] * deltas).sum(axis=-2)
+        if hessian:
+            hess += np.einsum(
+                "...b,...bk,...bj->...kj", scaled / width2, deltas, deltas
+            )
+            diag = scaled.sum(axis=-1)
+            for k in range(dim):
+                hess[..., k, k] -= diag
 
-            xs = np.linspace(lo, hi, 10_000)
-            ys = self._raw_eval(xs)
+        return f + self._shift, grad, hess
 
-            best_x, best_y = xs[np.argmin(ys)], ys.min()
-            top_indices = np.argsort(ys)[:20]
-            for idx in top_indices:
-                result = minimize_scalar(
-                    self._raw_eval,
-                    bounds=(max(lo, xs[idx] - 0.1), min(hi, xs[idx] + 0.1)),
-                    method="bounded",
-                )
-                if result.fun < best_y:
-                    best_x, best_y = result.x, result.fun
+    def _value_and_grad(self, points):
+        """Value and gradient at a batch of points of shape ``(K, dim)``.
 
-            return {"x": float(best_x), "y": float(best_y)}
-        else:
-            from scipy.optimize import minimize
+        Returns ``(f, grad)`` with shapes ``(K,)`` and ``(K, dim)``.
+        """
+        f, grad, _ = self._derivatives(points)
+        return f, grad
+
+    def _refine_minima(self, starts, max_iter=100, gtol=1e-10, xtol=1e-12):
+        """Projected gradient descent run on all *starts* at once.
 
+        *starts* has shape ``(K, dim)``. Every candidate keeps its own
+        Barzilai-Borwein step length, safeguarded by an Armijo test, and stops
+        once its projected gradient is below *gtol* or its moves fall below
+        *xtol* (the values no longer change in floating point).
+        Returns ``(points, values)``.
+        """
+        lo, hi = self._domain
+        x = np.clip(np.asarray(starts, dtype=float), lo, hi)
+        f, g = self._value_and_grad(x)
+        step = np.full(len(x), 1e-3)
+        converged = np.zeros(len(x), dtype=bool)
+
+        for _ in range(max_iter):
+            # Projected gradient: zero on active bounds pushing outwards
+            proj = x - np.clip(x - g, lo, hi)
+            converged |= np.abs(proj).max(axis=1) <= gtol
+            if converged.all():
+                break
+            active = ~converged
+
+            x_new = np.clip(x - step[:, None] * g, lo, hi)
+            s_vec = x_new - x
+            f_new, g_new = self._value_and_grad(x_new)
+            decrease = np.sum(g * s_vec, axis=1)
+            accepted = active & (f_new <= f + 1e-4 * decrease)
+            converged |= active & (np.abs(s_vec).max(axis=1) <= xtol)
+
+            s_y = np.sum(s_vec * (g_new - g), axis=1)
+            s_s = np.sum(s_vec * s_vec, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                bb = np.where(s_y > 0, s_s / s_y, step * 4)
+            step = np.where(accepted, np.clip(bb, 1e-12, 1e3), step)
+            step = np.where(active & ~accepted, step * 0.25, step)
+
+            x = np.where(accepted[:, None], x_new, x)
+            f = np.where(accepted, f_new, f)
+            g = np.where(accepted[:, None], g_new, g)
+
+        return x, f
+
+    @staticmethod
+    def _grid_local_minima(values, n_best):
+        """Flat indices of the *n_best* lowest discrete local minima of a grid.
+
+        A grid point is a local minimum when no axis neighbour is lower.
+        """
+        is_min = np.ones(values.shape, dtype=bool)
+        for axis in range(values.ndim):
+            diff = np.diff(values, axis=axis)
+            lower = [slice(None)] * values.ndim
+            upper = [slice(None)] * values.ndim
+            lower[axis] = slice(0, -1)
+            upper[axis] = slice(1, None)
+            is_min[tuple(lower)] &= diff >= 0  # next neighbour not lower
+            is_min[tuple(upper)] &= diff <= 0  # previous neighbour not lower
+        candidates = np.flatnonzero(is_min)
+        order = np.argsort(values.ravel()[candidates])[:n_best]
+        return candidates[order]
+
+    def _grid_2d(self, xs, ys):
+        """Unshifted values on the grid ``xs`` x ``ys`` (rows follow *ys*).
+
+        Every term is separable, so it is evaluated on the axes and combined
+        with outer operations: only additions and multiplications are done on
+        the full grid. Agrees with :meth:`_raw_eval` up to rounding.
+        """
+        z = np.polyval(self._poly_coeffs_y, ys)[:, None] + np.polyval(self._poly_coeffs_x, xs)
+        for amp, freq_x, freq_y, phase_x, phase_y in self._noise_terms:
+            z += np.outer(amp * np.cos(freq_y * ys + phase_y), np.cos(freq_x * xs + phase_x))
+        for amp, cx, cy, width in self._bumps:
+            z += np.outer(
+                amp * np.exp(-((ys - cy) ** 2) / (2 * width**2)),
+                np.exp(-((xs - cx) ** 2) / (2 * width**2)),
+            )
+        return z
+
+    def _compute_true_minimum(self):
+        if self.dim > 2:
+            return self._sampled_true_minimum()
+        lo, hi = self._domain
+
+        # Dense grid, then refine the 20 lowest grid local minima with an
+        # exact-gradient descent run on all candidates at once. The descent
+        # never increases a value, so the grid minimum is always improved on.
+        # In 1D, 2 000 points still give ~70 points per period of the fastest
+        # oscillation, enough to catch every basin.
+        if self.dim == 1:
+            xs = np.linspace(lo, hi, 2_000)
+            ys = self._raw_eval(xs)
+            starts = xs[self._grid_local_minima(ys, 20)][:, None]
+        else:
             n_grid = 200
             xs = np.linspace(lo, hi, n_grid)
-            ys = np.linspace(lo, hi, n_grid)
-            X, Y = np.meshgrid(xs, ys)
-            Z = self._raw_eval((X, Y))
+            Z = self._grid_2d(xs, xs)
+            rows, cols = np.unravel_index(self._grid_local_minima(Z, 20), Z.shape)
+            starts = np.stack([xs[cols], xs[rows]], axis=1)
+
+        points, values = self._refine_minima(starts)
+        best = np.argmin(values)
+        best_pos, best_val = points[best], values[best]
+
+        if self.dim == 1:
+            return {"x": float(best_pos[0]), "y": float(best_val)}
+        return {"x": (float(best_pos[0]), float(best_pos[1])), "y": float(best_val)}
+
+    def _sampled_true_minimum(self, n_samples=None, n_starts=2_000):
+        """Minimum search for dim > 2, where a dense grid is out of reach.
+
+        Evaluates a seeded uniform sample of the domain (``25 000 * dim``
+        points by default) and refines the *n_starts* lowest samples with the
+        batched descent of :meth:`_compute_true_minimum`, so the cost grows
+        linearly with the dimension. This is a best effort: in high
+        dimension a narrow basin can be missed, ``minimum_method="bnb"``
+        gives a certified value (within its budget).
+        """
+        lo, hi = self._domain
+        dim = self.dim
+        if n_samples is None:
+            n_samples = 25_000 * dim
+
+        # Own generator: the landscape must not depend on this search
+        rng = np.random.default_rng([self.seed, dim])
+        samples = rng.uniform(lo, hi, size=(n_samples, dim))
+        values = self._eval_array(samples)
+        n_starts = min(n_starts, n_samples)
+        starts = samples[np.argpartition(values, n_starts - 1)[:n_starts]]
+
+        points, refined = self._refine_minima(starts, max_iter=200)
+        best = np.argmin(refined)
+        return {"x": tuple(float(v) for v in points[best]), "y": float(refined[best])}
+
+    # -- certified minimum (branch-and-bound) --------------------------------
 
-            # Find top-20 grid candidates and refine
-            flat = Z.ravel()
-            top_indices = np.argsort(flat)[:20]
-            best_pos = None
-            best_val = np.inf
-            for idx in top_indices:
-                r, c = divmod(idx, n_grid)
-                x0 = [X[r, c], Y[r, c]]
-                result = minimize(
-                    lambda p: float(self._raw_eval((p[0], p[1]))),
-                    x0,
-                    bounds=[(lo, hi), (lo, hi)],
-                    method="L-BFGS-B",
+    def _eval_points(self, points):
+        """Evaluate at a ``(..., dim)`` array of points, without tracking."""
+        if self.dim == 1:
+            return self._raw_eval(points[..., 0])
+        return self._raw_eval(np.moveaxis(points, -1, 0))
+
+    def _poly_critical_points(self):
+        """Real critical points of each axis polynomial inside the domain."""
+        lo, hi = self._domain
+        crit = []
+        for d1, _ in self._poly_derivs:
+            roots = np.roots(d1) if len(d1) > 1 else np.array([])
+            real = roots[np.abs(roots.imag) < 1e-7].real
+            crit.append(real[(real >= lo) & (real <= hi)])
+        return crit
+
+    @staticmethod
+    def _cos_range(s, t):
+        """Elementwise (min, max) of cos over the intervals [s, t]."""
+        two_pi = 2 * np.pi
+        full = (t - s) >= two_pi
+        has_min = np.ceil((s - np.pi) / two_pi) <= np.floor((t - np.pi) / two_pi)
+        has_max = np.ceil(s / two_pi) <= np.floor(t / two_pi)
+        cos_s, cos_t = np.cos(s), np.cos(t)
+        cmin = np.where(full | has_min, -1.0, np.minimum(cos_s, cos_t))
+        cmax = np.where(full | has_max, 1.0, np.maximum(cos_s, cos_t))
+        return cmin, cmax
+
+    def _hessian_bound(self):
+        """Matrix ``B`` with ``|H_kj(x)| <= B_kj`` everywhere on the domain."""
+        lo, hi = self._domain
+        dim = self.dim
+        bound = np.zeros((dim, dim))
+
+        # Polynomials: the extremes of p'' are at the ends or where p''' = 0
+        for k, (_, d2) in enumerate(self._poly_derivs):
+            d3 = np.polyder(d2)
+            roots = np.roots(d3) if len(d3) > 1 else np.array([])
+            real = roots[np.abs(roots.imag) < 1e-7].real
+            xs = np.concatenate([[lo, hi], real[(real >= lo) & (real <= hi)]])
+            bound[k, k] += np.abs(np.polyval(d2, xs)).max()
+
+        # Cosine products: |d2/dxk dxj| <= amp * freq_k * freq_j
+        amp = np.abs(self._noise_arr[:, 0])
+        freqs = self._noise_arr[:, 1 : 1 + dim]
+        bound += np.einsum("t,tk,tj->kj", amp, freqs, freqs)
+
+        # Gaussians: |(u^2 - 1) e^(-u^2/2)| <= 1 and |u v e^(-(u^2+v^2)/2)| <= 1/e
+        amp = np.abs(self._bumps_arr[:, 0])
+        width2 = self._bumps_arr[:, -1] ** 2
+        scale = (amp / width2).sum()
+        bound += np.where(np.eye(dim, dtype=bool), scale, scale / np.e)
+        return bound
+
+    def _lower_bounds(self, lo, hi, crit):
+        """Lower bound of the function on each box ``[lo, hi]`` (``(M, dim)`` arrays).
+
+        The bound is the sum of the exact minimum of every term on the box:
+        polynomials via their critical points, cosine products via the range
+        of each cosine factor, Gaussians via the nearest/farthest box point.
+        """
+        dim = self.dim
+        bound = np.zeros(len(lo))
+
+        for k, coeffs in enumerate(self._poly_list):
+            a, b = lo[:, k], hi[:, k]
+            best = np.minimum(np.polyval(coeffs, a), np.polyval(coeffs, b))
+            for c in crit[k]:
+                inside = (a <= c) & (c <= b)
+                best = np.where(inside, np.minimum(best, np.polyval(coeffs, c)), best)
+            bound += best
+
+        if len(self._noise_arr):
+            amp = self._noise_arr[:, 0]
+            freqs = self._noise_arr[:, 1 : 1 + dim]
+            phases = self._noise_arr[:, 1 + dim :]
+            # Frequencies are positive, so lo maps to the start of the interval
+            cmin, cmax = self._cos_range(
+                lo[:, None, :] * freqs + phases, hi[:, None, :] * freqs + phases
+            )
+            pmin, pmax = cmin[..., 0], cmax[..., 0]
+            for k in range(1, dim):
+                corners = np.stack(
+                    [pmin * cmin[..., k], pmin * cmax[..., k],
+                     pmax * cmin[..., k], pmax * cmax[..., k]]
                 )
-                if result.fun < best_val:
-                    best_pos = result.x
-                    best_val = result.fun
+                pmin, pmax = corners.min(axis=0), corners.max(axis=0)
+            bound += np.where(amp > 0, amp * pmin, amp * pmax).sum(axis=-1)
+
+        if len(self._bumps_arr):
+            amp = self._bumps_arr[:, 0]
+            centers = self._bumps_arr[:, 1 : 1 + dim]
+            width2 = self._bumps_arr[:, -1] ** 2
+            to_lo = lo[:, None, :] - centers
+            to_hi = hi[:, None, :] - centers
+            nearest = np.maximum(to_lo, 0) + np.maximum(-to_hi, 0)
+            dist2_min = (nearest**2).sum(axis=-1)
+            dist2_max = np.maximum(to_lo**2, to_hi**2).sum(axis=-1)
+            # Hills are lowest far from their center, pits at their center
+            dist2 = np.where(amp > 0, dist2_max, dist2_min)
+            bound += (amp * np.exp(-dist2 / (2 * width2))).sum(axis=-1)
+
+        return bound + self._shift
+
+    def _branch_and_bound_minimum(self, tol=1e-3, max_boxes=50_000, max_evals=1_000_000):
+        """Global minimum certified to within *tol* by branch-and-bound.
+
+        Each box gets the better of two lower bounds: the per-term bound of
+        :meth:`_lower_bounds`, tight on large boxes, and a second-order Taylor
+        bound around the box centre using :meth:`_hessian_bound`, tight on
+        small ones. Boxes that cannot beat the best value found by more than
+        *tol* are discarded, the others are bisected along their widest side.
+        When more than *max_boxes* remain, only the ones with the lowest
+        bounds are bisected, and the search stops after *max_evals* points:
+        the result is then a best effort, with an honest (larger) gap.
+        The best box centres are polished with :meth:`_refine_minima`. Sets
+        ``_minimum_gap`` (best value minus the certified lower bound) and
+        ``_minimum_evals`` (number of points evaluated).
+        """
+        lo, hi = self._domain
+        dim = self.dim
+        crit = self._poly_critical_points()
+        hess_bound = self._hessian_bound()
+
+        # Initial partition: 64 cells in 1D, 8 x 8 in 2D, ...
+        n_cells = max(2, int(round(64 ** (1 / dim))))
+        edges = np.linspace(lo, hi, n_cells + 1)
+        cells = np.stack(np.meshgrid(*([np.arange(n_cells)] * dim), indexing="ij"), axis=-1)
+        cells = cells.reshape(-1, dim)
+        box_lo, box_hi = edges[cells], edges[cells + 1]
+
+        centers = (box_lo + box_hi) / 2
+        values, grads = self._value_and_grad(centers)
+        n_evals = len(centers)
+        order = np.argsort(values)[:10]
+        points, refined = self._refine_minima(centers[order])
+        best = np.argmin(refined)
+        best_x, best_y = points[best], refined[best]
+        if dim > 2:
+            # A good incumbent from the start prunes far more boxes
+            sampled = self._sampled_true_minimum()
+            if sampled["y"] + self._shift < best_y:
+                best_x, best_y = np.array(sampled["x"]), sampled["y"] + self._shift
+
+        discarded_bound = np.inf
+        while True:
+            half = (box_hi - box_lo) / 2
+            taylor = (
+                values
+                - (np.abs(grads) * half).sum(axis=1)
+                - 0.5 * np.einsum("mk,kj,mj->m", half, hess_bound, half)
+            )
+            bounds = np.maximum(self._lower_bounds(box_lo, box_hi, crit), taylor)
+            keep = bounds < best_y - tol
+            if keep.sum() > max_boxes:
+                # Over budget: set the boxes with the highest bounds aside,
+                # they still count in the certified bound
+                kept = np.flatnonzero(keep)
+                keep[kept[np.argsort(bounds[kept])[max_boxes:]]] = False
+            if (~keep).any():
+                discarded_bound = min(discarded_bound, bounds[~keep].min())
+            if not keep.any() or n_evals >= max_evals:
+                break
+            box_lo, box_hi = box_lo[keep], box_hi[keep]
+
+            # Bisect every remaining box along its widest side
+            axis = np.argmax(box_hi - box_lo, axis=1)
+            rows = np.arange(len(box_lo))
+            mid = (box_lo[rows, axis] + box_hi[rows, axis]) / 2
+            left_hi, right_lo = box_hi.copy(), box_lo.copy()
+            left_hi[rows, axis] = mid
+            right_lo[rows, axis] = mid
+            box_lo = np.concatenate([box_lo, right_lo])
+            box_hi = np.concatenate([left_hi, box_hi])
+
+            centers = (box_lo + box_hi) / 2
+            values, grads = self._value_and_grad(centers)
+            n_evals += len(centers)
+            i = np.argmin(values)
+            if values[i] < best_y:
+                # The descent never increases the value of its start point
+                points, refined = self._refine_minima(centers[i : i + 1])
+                best_x, best_y = points[0], refined[0]
+
+        remaining_bound = bounds[keep].min() if keep.any() else np.inf
+        self._minimum_gap = float(best_y - min(discarded_bound, remaining_bound, best_y))
+        self._minimum_evals = n_evals
 
-            return {"x": (float(best_pos[0]), float(best_pos[1])), "y": float(best_val)}
+        if dim == 1:
+            return {"x": float(best_x[0]), "y": float(best_y)}
+        return {"x": tuple(float(v) for v in best_x), "y": float(best_y)}
 
     # -- public API ---------------------------------------------------------
 
@@ -288,9 +713,9 @@ class HiddenFunction:
 
         Parameters
         ----------
-        x : float or tuple[float, float]
+        x : float or tuple[float, ...]
             For dim=1: a scalar within the domain.
-            For dim=2: a tuple (x1, x2), both within the domain.
+            For dim>=2: a tuple (x1, ..., xN), all within the domain.
 
         Returns
         -------
@@ -301,8 +726,9 @@ class HiddenFunction:
             if x < lo or x > hi:
                 raise ValueError(f"x={x} is outside the domain [{lo}, {hi}]")
         else:
-            x1, x2 = x
-            if x1 < lo or x1 > hi or x2 < lo or x2 > hi:
+            if len(x) != self.dim:
+                raise ValueError(f"x={x} must have {self.dim} coordinates")
+            if any(c < lo or c > hi for c in x):
                 raise ValueError(f"x={x} is outside the domain [{lo}, {hi}]")
         y = float(self._raw_eval(x))
         self._eval_count += 1
@@ -312,6 +738,82 @@ class HiddenFunction:
             self._best_value = y
         return y
 
+    def evaluate_batch(self, points):
+        """Evaluate the function at many points at once, with tracking.
+
+        Parameters
+        ----------
+        points : array_like
+            Array of shape ``(..., dim)`` (for dim=1, ``(...)`` is accepted
+            too), every coordinate within the domain.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values, with shape ``(...)``. Each point counts as one
+            evaluation and is appended to the history in C order.
+        """
+        points = np.asarray(points, dtype=float)
+        if self.dim == 1 and (points.ndim == 0 or points.shape[-1] != 1):
+            points = points[..., None]
+        if points.shape[-1] != self.dim:
+            raise ValueError(
+                f"points must have shape (..., {self.dim}), got {points.shape}"
+            )
+        lo, hi = self._domain
+        if points.size and (points.min() < lo or points.max() > hi):
+            raise ValueError(f"some points are outside the domain [{lo}, {hi}]")
+
+        values = np.asarray(self._eval_points(points), dtype=float)
+        flat_points = points.reshape(-1, self.dim)
+        flat_values = values.ravel()
+        if len(flat_values) == 0:
+            return values
+
+        self._eval_count += len(flat_values)
+        if self.dim == 1:
+            coords = [float(p[0]) for p in flat_points]
+        else:
+            coords = [tuple(float(c) for c in p) for p in flat_points]
+        self._history.extend(zip(coords, flat_values.tolist()))
+        best = int(np.argmin(flat_values))
+        if self._best_value is None or flat_values[best] < self._best_value:
+            self._best_x = coords[best]
+            self._best_value = float(flat_values[best])
+        return values
+
+    def gradient(self, x):
+        """Exact gradient of the function at *x*, without tracking.
+
+        Parameters
+        ----------
+        x : float, array, or tuple of floats/arrays
+            Same conventions as :meth:`_raw_eval`: for dim=1 a scalar or an
+            array of positions, otherwise the dim coordinates, scalars or
+            broadcastable arrays.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            For dim=1, f'(x) with the shape of *x*. Otherwise, an array of
+            shape ``(dim, ...)`` holding the partial derivatives.
+        """
+        _, grad, _ = self._derivatives(self._stack(x))
+        if self.dim == 1:
+            return float(grad[..., 0]) if grad.ndim == 1 else grad[..., 0]
+        return np.moveaxis(grad, -1, 0)
+
+    def hessian(self, x):
+        """Exact Hessian of the function at *x*, without tracking.
+
+        Same input conventions as :meth:`gradient`. For dim=1, returns f''(x)
+        with the shape of *x*; otherwise an array of shape ``(dim, dim, ...)``.
+        """
+        _, _, hess = self._derivatives(self._stack(x), hessian=True)
+        if self.dim == 1:
+            return float(hess[..., 0, 0]) if hess.ndim == 2 else hess[..., 0, 0]
+        return np.moveaxis(hess, (-2, -1), (0, 1))
+
     def reset(self):
         """Clear tracking state (for a new player)."""
         self._eval_count = 0
@@ -320,7 +822,9 @@ class HiddenFunction:
         self._history = []
 
     def plot(self, show_minimum=False):
-        """Visualize the function (game-master view)."""
+        """Visualize the function (game-master view, dim 1 or 2 only)."""
+        if self.dim > 2:
+            raise ValueError(f"plot() supports dim 1 and 2, not {self.dim}")
         import matplotlib.pyplot as plt
 
         lo, hi = self._domain
@@ -404,6 +908,14 @@ class HiddenFunction:
     def true_minimum(self):
         return self._true_minimum
 
+    @property
+    def minimum_gap(self):
+        """Certified bound on ``true_minimum["y"]`` minus the real minimum.
+
+        Only set with ``minimum_method="bnb"`` (``None`` otherwise).
+        """
+        return self._minimum_gap
+
     @property
     def domain(self):
         return self._domain
@@ -424,31 +936,124 @@ class FunctionGenerator:
     Parameters
     ----------
     dim : int
-        Spatial dimension (currently only ``1`` is supported).
+        Spatial dimension of the generated functions.
     difficulty : Difficulty
         Difficulty preset for generated functions.
     base_seed : int | None
         If given, used to seed the internal RNG for reproducible sequences.
     domain : tuple[float, float]
         Domain passed through to each :class:`HiddenFunction`.
+    minimum_method : str
+        How each function locates its true minimum (``"grid"`` or ``"bnb"``).
+    hardness_band : tuple[float, float] | None
+        If given, only seeds whose empirical hardness (see
+        :mod:`calibration`) lies in this band are drawn.
+    hardness_table : dict[int, float] | None
+        Precomputed ``{seed: hardness}`` to draw the seeds from. Without it,
+        candidate seeds are calibrated as they are drawn.
+    nb_step, reveal_radius : int, float
+        Game settings under which candidate seeds are calibrated.
+    bank : FunctionBank | None
+        Bank of pre-built functions (see :mod:`function_bank`) matching
+        ``dim``, ``difficulty`` and ``domain``. Seeds are then drawn from the
+        bank, within ``hardness_band`` if given, and seeds held by the bank
+        are not rebuilt.
     """
 
+    # Candidate seeds calibrated before giving up on the hardness band
+    MAX_BAND_TRIES = 200
+
     def __init__(
-        self, dim, difficulty=Difficulty.MEDIUM, base_seed=None, domain=(-6, 6)
+        self,
+        dim,
+        difficulty=Difficulty.MEDIUM,
+        base_seed=None,
+        domain=(-6, 6),
+        minimum_method="grid",
+        hardness_band=None,
+        hardness_table=None,
+        nb_step=10,
+        reveal_radius=0.5,
+        bank=None,
     ):
         self.dim = dim
         self._difficulty = difficulty
         self._domain = domain
+        self._minimum_method = minimum_method
         self._rng = np.random.default_rng(base_seed)
+        self.hardness_band = hardness_band
+        self._nb_step = nb_step
+        self._reveal_radius = reveal_radius
+
+        self._bank = bank
+        self._bank_indices = None
+        if bank is not None:
+            settings = (bank.dim, bank.difficulty, tuple(bank.domain))
+            if settings != (dim, difficulty, tuple(map(float, domain))):
+                raise ValueError(
+                    f"Bank of (dim, difficulty, domain) {settings} for a generator of "
+                    f"{(dim, difficulty, tuple(domain))}"
+                )
+            if hardness_band is not None:
+                self._bank_indices = bank.indices_in_band(hardness_band)
+                if len(self._bank_indices) == 0:
+                    raise ValueError(f"No function of the bank in the hardness band {hardness_band}")
+
+        self._band_seeds = None
+        if bank is None and hardness_band is not None and hardness_table is not None:
+            lo, hi = hardness_band
+            self._band_seeds = sorted(s for s, h in hardness_table.items() if lo <= h <= hi)
+            if not self._band_seeds:
+                raise ValueError(f"No seed of the hardness table in the band {hardness_band}")
 
     def generate(self, seed=None):
         """Return a new :class:`HiddenFunction` with a derived seed."""
+        if self._bank is not None:
+            if seed is None:
+                if self._bank_indices is not None:
+                    return self._bank.function(int(self._rng.choice(self._bank_indices)))
+                return self._bank.function(int(self._rng.integers(len(self._bank))))
+            index = self._bank.index_of(seed)
+            if index is not None:
+                return self._bank.function(index)
         if seed is None:
-            seed = int(self._rng.integers(0, 2**31))
+            if self._band_seeds is not None:
+                seed = int(self._rng.choice(self._band_seeds))
+            elif self.hardness_band is not None:
+                return self._generate_in_band()
+            else:
+                seed = int(self._rng.integers(0, 2**31))
         return HiddenFunction(
-            seed=seed, dim=self.dim, difficulty=self._difficulty, domain=self._domain
+            seed=seed,
+            dim=self.dim,
+            difficulty=self._difficulty,
+            domain=self._domain,
+            minimum_method=self._minimum_method,
         )
 
+    def _generate_in_band(self):
+        """Draw and calibrate seeds until one falls in the hardness band.
+
+        After :attr:`MAX_BAND_TRIES` candidates, the closest one is returned.
+        """
+        from .calibration import hardness  # imports this module
+
+        lo, hi = self.hardness_band
+        closest, closest_distance = None, np.inf
+        for _ in range(self.MAX_BAND_TRIES):
+            function = self.generate(int(self._rng.integers(0, 2**31)))
+            h = hardness([function], self._nb_step, self._reveal_radius)[0]
+            distance = max(lo - h, h - hi, 0.0)
+            if distance == 0.0:
+                return function
+            if distance < closest_distance:
+                closest, closest_distance = function, distance
+        print(
+            f"No seed found in the hardness band {self.hardness_band}, "
+            f"using one {closest_distance:.3f} away from it"
+        )
+        return closest
+
 
 # ---------------------------------------------------------------------------
 # CLI entry-point
@@ -482,8 +1087,7 @@ if __name__ == "__main__":
         "--dim",
         type=int,
         default=1,
-        choices=[1, 2],
-        help="Spatial dimension (default: 1)",
+        help="Spatial dimension; only 1 and 2 can be plotted (default: 1)",
     )
 
     args = parser.parse_args()
@@ -495,10 +1099,15 @@ if __name__ == "__main__":
             f"True minimum: x={hf.true_minimum['x']:.6f}, "
             f"y={hf.true_minimum['y']:.6f}"
         )
-    else:
+    elif args.dim == 2:
         m = hf.true_minimum
         print(
             f"True minimum: (x, y)=({m['x'][0]:.6f}, {m['x'][1]:.6f}), "
             f"f={m['y']:.6f}"
         )
-    hf.plot(show_minimum=args.show_minimum)
+    else:
+        m = hf.true_minimum
+        coords = ", ".join(f"{c:.6f}" for c in m["x"])
+        print(f"True minimum: x=({coords}), f={m['y']:.6f}")
+    if args.dim <= 2:
+        hf.plot(show_minimum=args.show_minimum)
@@ -0,0 +1,144 @@
+"""Heatmap rasterizer shared by the 2D views of the client and game master.
+
+Values are quantized in place to 8-bit colormap indices, and the RGB pixels
+are gathered from a 256-entry lookup table straight into a reusable PPM
+buffer. ``tk.PhotoImage(data=...)`` reads that buffer directly, with no PIL
+round-trip, and function grids are drawn at their own resolution and
+enlarged by Tk (``PhotoImage.zoom``) rather than resized in NumPy or PIL.
+"""
+
+import numpy as np
+
+# Colormaps as evenly spaced RGB anchors, linearly interpolated to 256 colors
+COLORMAPS = {
+    # The game's historical look: blue for low values, red for high ones
+    "redblue": [(0, 0, 255), (255, 0, 0)],
+    "viridis": [(68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)],
+    "gray": [(0, 0, 0), (255, 255, 255)],
+}
+
+DEFAULT_COLORMAP = "redblue"
+
+# Unexplored areas
+BACKGROUND = (30, 30, 30)
+
+_luts = {}
+
+
+def colormap_lut(name: str) -> np.ndarray:
+    """The ``(256, 3)`` uint8 lookup table of a colormap of :data:`COLORMAPS`."""
+    lut = _luts.get(name)
+    if lut is None:
+        if name not in COLORMAPS:
+            raise ValueError(f"Unknown colormap {name!r}, expected one of {sorted(COLORMAPS)}")
+        anchors = np.array(COLORMAPS[name], dtype=float)
+        stops = np.linspace(0, 255, len(anchors))
+        levels = np.arange(256)
+        lut = np.stack(
+            [np.interp(levels, stops, anchors[:, c]) for c in range(3)], axis=1
+        )
+        lut = _luts[name] = np.round(lut).astype(np.uint8)
+    return lut
+
+
+class HeatmapRasterizer:
+    """
+    A reusable ``width`` x ``height`` RGB image painted from value grids.
+
+    :meth:`render_grid` draws a whole function grid of the image's size;
+    :meth:`clear` and :meth:`paint` draw rectangles of values (revealed
+    regions). :meth:`ppm` and :meth:`photo` hand the image over to Tk.
+    """
+
+    def __init__(self, width: int, height: int, colormap: str = DEFAULT_COLORMAP):
+        self.width = width
+        self.height = height
+        self.lut = colormap_lut(colormap)
+
+        header = f"P6 {width} {height} 255\n".encode()
+        self._header_size = len(header)
+        self._ppm = bytearray(header) + bytearray(width * height * 3)
+        # Pixels live inside the PPM buffer: no copy before handing it to Tk
+        self.pixels = np.frombuffer(
+            self._ppm, dtype=np.uint8, offset=self._header_size
+        ).reshape(height, width, 3)
+
+        self._index = np.empty((height, width), dtype=np.uint8)
+        self._scratch = np.empty((height, width))
+        self._fills = {}  # color -> whole-image byte pattern
+
+    def set_colormap(self, colormap: str):
+        self.lut = colormap_lut(colormap)
+
+    # -- quantization --------------------------------------------------------
+
+    @staticmethod
+    def quantize(Z, z_min, z_max, out, scratch=None):
+        """
+        Write the colormap indices of *Z* over ``[z_min, z_max]`` into *out*
+        (uint8), using the float array *scratch* (allocated if not given).
+        """
+        if scratch is None:
+            scratch = np.empty(Z.shape)
+        np.subtract(Z, z_min, out=scratch)
+        np.multiply(scratch, 255.0 / max(z_max - z_min, 1e-10), out=scratch)
+        np.clip(scratch, 0, 255, out=scratch)
+        # Truncation, like the former astype(np.uint8) path
+        np.copyto(out, scratch, casting="unsafe")
+        return out
+
+    # -- drawing -------------------------------------------------------------
+
+    def render_grid(self, Z, z_range=None, flip=True):
+        """
+        Draw the ``(height, width)`` value grid *Z* over the whole image.
+        Row 0 of *Z* is the bottom of the image when *flip* is set (grids
+        indexed by increasing y). *z_range* defaults to the range of *Z*.
+        Returns :attr:`pixels`.
+        """
+        if Z.shape != self._index.shape:
+            raise ValueError(f"Grid of shape {Z.shape} for an image of shape {self._index.shape}")
+        z_min, z_max = z_range if z_range is not None else (Z.min(), Z.max())
+        self.quantize(Z[::-1] if flip else Z, z_min, z_max, self._index, self._scratch)
+        np.take(self.lut, self._index, axis=0, out=self.pixels)
+        return self.pixels
+
+    def clear(self, color=BACKGROUND):
+        # Copying a prebuilt pattern is far faster than broadcasting the RGB triple
+        fill = self._fills.get(color)
+        if fill is None:
+            fill = self._fills[color] = bytes(color) * (self.width * self.height)
+        self._ppm[self._header_size :] = fill
+
+    def paint(self, Z, x0, y0, z_min, z_max):
+        """Draw *Z* pixel for pixel with its top-left corner at ``(x0, y0)``."""
+        h, w = Z.shape
+        index = self._index[:h, :w]
+        self.quantize(Z, z_min, z_max, index)
+        self.pixels[y0 : y0 + h, x0 : x0 + w] = self.lut[index]
+
+    # -- output --------------------------------------------------------------
+
+    def ppm(self) -> bytes:
+        """The image as binary PPM data."""
+        return bytes(self._ppm)
+
+    def photo(self, zoom=(1, 1)):
+        """
+        Return the image as a new ``tk.PhotoImage``, enlarged by the integer
+        factors *zoom* ``(x, y)``. Needs a Tk root.
+        """
+        return ppm_photo(self.ppm(), zoom)
+
+
+def ppm_photo(ppm: bytes, zoom=(1, 1)):
+    """
+    Return the PPM data *ppm* as a new ``tk.PhotoImage``, enlarged by the
+    integer factors *zoom* ``(x, y)``. Needs a Tk root.
+    """
+    import tkinter as tk
+
+    photo = tk.PhotoImage(data=ppm, format="PPM")
+    if zoom != (1, 1):
+        photo = photo.zoom(*zoom)
+    return photo
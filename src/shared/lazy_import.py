@@ -0,0 +1,134 @@
+"""Deferred imports and startup timing for the client and server entry points.
+
+NumPy, PIL and the function generator take most of the launch time on slow
+(network) file systems, yet none of them is needed to show the first window.
+:func:`lazy_import` returns a placeholder module that performs the real import
+on first attribute access, and :func:`prefetch` warms such modules on a
+background thread while the user is still typing.
+"""
+
+import importlib
+import sys
+import threading
+import time
+import types
+
+# Origin of the startup timings: entry points import this module first
+_STARTED_AT = time.perf_counter()
+
+# (module name, seconds, thread name) of every deferred import performed
+import_timings = []
+
+# Time to the first interactive window above which --profile-startup warns
+STARTUP_BUDGET_S = 0.5
+
+
+class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Once loaded, the real module's attributes are copied into the stand-in,
+    so later lookups are plain module attribute lookups with no overhead.
+    """
+
+    def __init__(self, name, package=None):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = (name, package)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                name, package = self.__dict__["_lazy_target"]
+                start = time.perf_counter()
+                module = importlib.import_module(name, package)
+                import_timings.append(
+                    (module.__name__, time.perf_counter() - start, threading.current_thread().name)
+                )
+                self.__dict__.update(
+                    {k: v for k, v in module.__dict__.items() if k not in ("__name__", "__spec__")}
+                )
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        # Only called for attributes missing from the stand-in
+        return getattr(self._load(), attr)
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+
+def lazy_import(name: str, package: str = None) -> LazyModule:
+    """
+    Return *name* as a :class:`LazyModule` (relative names need *package*).
+    If the module is already imported, it is returned directly.
+    """
+    if not name.startswith("."):
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+    return LazyModule(name, package)
+
+
+def prefetch(*modules):
+    """Load the given lazy modules on a daemon thread and return the thread."""
+
+    def load_all():
+        for module in modules:
+            if isinstance(module, LazyModule):
+                module._load()
+
+    thread = threading.Thread(target=load_all, name="prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+class StartupProfile:
+    """
+    Records named checkpoints and prints them, together with the deferred
+    imports, for ``--profile-startup``. Times count from the import of this
+    module, i.e. they exclude the interpreter start-up itself. Disabled
+    profiles record nothing.
+    """
+
+    def __init__(self, enabled: bool, budget: float = STARTUP_BUDGET_S):
+        self.enabled = enabled
+        self.budget = budget
+        self.marks = []
+
+    def mark(self, label: str):
+        if self.enabled:
+            self.marks.append((label, time.perf_counter() - _STARTED_AT))
+
+    def report(self, budget_mark: str = None):
+        """
+        Print the checkpoints and deferred imports. When *budget_mark* is
+        given, the time of that checkpoint is checked against the budget.
+        Returns True if the budget is met (or not checked).
+        """
+        if not self.enabled:
+            return True
+        print("--- Startup profile ---")
+        for label, elapsed in self.marks:
+            print(f"{elapsed * 1e3:9.1f} ms  {label}")
+        for name, seconds, thread in import_timings:
+            print(f"{seconds * 1e3:9.1f} ms  import {name} ({thread})")
+
+        within = True
+        if budget_mark is not None:
+            elapsed = dict(self.marks).get(budget_mark)
+            if elapsed is not None:
+                within = elapsed <= self.budget
+                status = "ok" if within else "OVER BUDGET"
+                print(
+                    f"'{budget_mark}' after {elapsed * 1e3:.1f} ms "
+                    f"(budget {self.budget * 1e3:.0f} ms): {status}"
+                )
+        return within
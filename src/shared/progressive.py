@@ -0,0 +1,131 @@
+"""Progressive level-of-detail rendering of the revealed function.
+
+A render is a generator of successive levels, from a coarse preview to the
+full canvas resolution. The first level is computed right away on the Tk
+thread, so something is on screen immediately; the others are computed on a
+worker thread, in chunks between which a cancel flag is checked, and the Tk
+thread picks up the latest finished level by polling with ``after``.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from .heatmap import HeatmapRasterizer
+
+# Canvas pixels per grid point of each level, coarse to full resolution
+HEATMAP_DIVISORS = (8, 4, 2, 1)
+CURVE_DIVISORS = (8, 1)
+
+# Rows of the heatmap grid evaluated between two checks of the cancel flag
+CHUNK_ROWS = 64
+
+_DONE = object()
+
+
+def heatmap_levels(function, domain, width, height, cancel, divisors=HEATMAP_DIVISORS):
+    """
+    Yield ``(ppm, zoom)`` for a 2D function: the PPM data of a heatmap of
+    ``width / d`` x ``height / d`` points for each divisor ``d``, and the
+    integer zoom ``(d, d)`` bringing it to the canvas size. Stops early once
+    *cancel* (a ``threading.Event``) is set.
+    """
+    lo, hi = domain
+    for d in divisors:
+        n_cols, n_rows = width // d, height // d
+        xs = np.linspace(lo, hi, n_cols)
+        ys = np.linspace(lo, hi, n_rows)
+        Z = np.empty((n_rows, n_cols))
+        for start in range(0, n_rows, CHUNK_ROWS):
+            if cancel.is_set():
+                return
+            stop = min(start + CHUNK_ROWS, n_rows)
+            Z[start:stop] = function._raw_eval(np.meshgrid(xs, ys[start:stop]))
+        raster = HeatmapRasterizer(n_cols, n_rows)
+        raster.render_grid(Z)
+        yield raster.ppm(), (d, d)
+
+
+def curve_levels(function, domain, width, to_canvas_y, cancel, divisors=CURVE_DIVISORS):
+    """
+    Yield the flat canvas coordinates ``[x0, y0, x1, y1, ...]`` of a 1D
+    function's curve, with one point every ``d`` pixels for each divisor.
+    *to_canvas_y* maps an array of function values to canvas y coordinates.
+    """
+    lo, hi = domain
+    for d in divisors:
+        if cancel.is_set():
+            return
+        # Every d-th pixel column, always ending on the last one
+        pxs = np.unique(np.append(np.arange(0, width, d), width - 1))
+        ys = to_canvas_y(function._raw_eval(lo + pxs * (hi - lo) / (width - 1)))
+        yield np.column_stack([pxs, ys]).ravel().tolist()
+
+
+class ProgressiveRenderer:
+    """
+    Runs one progressive render at a time for a Tk widget.
+
+    :meth:`start` cancels the render in progress, if any. The Tk callbacks
+    stop as soon as a render is cancelled, so a late level of an old round
+    is never drawn.
+    """
+
+    def __init__(self, root, poll_ms: int = 15):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._cancel = None
+
+    def start(self, levels, on_level):
+        """
+        Render *levels*, a callable taking a cancel ``threading.Event`` and
+        returning an iterator of levels. ``on_level(level)`` is called on the
+        Tk thread: at once for the first level, then for the latest level
+        finished by the worker at each poll.
+        """
+        self.cancel()
+        cancel = self._cancel = threading.Event()
+        iterator = iter(levels(cancel))
+
+        first = next(iterator, _DONE)
+        if first is _DONE:
+            return
+        on_level(first)
+
+        results = queue.Queue()
+
+        def work():
+            try:
+                for level in iterator:
+                    if cancel.is_set():
+                        break
+                    results.put(level)
+            finally:
+                results.put(_DONE)
+
+        threading.Thread(target=work, name="progressive-render", daemon=True).start()
+        self.root.after(self.poll_ms, self._poll, results, cancel, on_level)
+
+    def _poll(self, results, cancel, on_level):
+        if cancel.is_set():
+            return
+        latest, done = _DONE, False
+        try:
+            while True:
+                item = results.get_nowait()
+                if item is _DONE:
+                    done = True
+                else:
+                    latest = item
+        except queue.Empty:
+            pass
+        if latest is not _DONE:
+            on_level(latest)
+        if not done:
+            self.root.after(self.poll_ms, self._poll, results, cancel, on_level)
+
+    def cancel(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
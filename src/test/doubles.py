@@ -0,0 +1,28 @@
+"""Test doubles shared by the server tests."""
+
+
+class FakeClock:
+    """A clock that only moves when a test sets ``now``."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class NullConnection:
+    """A socket that keeps what is sent to it in ``sent``."""
+
+    def __init__(self):
+        self.sent = []
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+
+class SilentHandler:
+    """A client handler that ignores every message."""
+
+    def send(self, message):
+        pass
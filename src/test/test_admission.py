@@ -0,0 +1,82 @@
+import socket
+import threading
+
+from src.server.admission import AdmissionController, reject
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.game_master import GameMasterGUI
+from src.server.main_server import handle_client
+from src.server.stats import MessageStats
+from src.test.doubles import NullConnection
+
+
+def test_connections_are_capped_until_one_leaves():
+    admission = AdmissionController(max_sessions=2)
+    assert admission.admit_connection()
+    assert admission.admit_connection()
+    assert not admission.admit_connection()
+
+    admission.release_connection()
+    assert admission.admit_connection()
+    assert (admission.active, admission.peak, admission.rejected_sessions) == (2, 2, 1)
+
+
+def test_refused_connection_is_told_the_server_is_full():
+    client_end, server_end = socket.socketpair()
+    reject(server_end)
+    assert client_end.recv(100) == b'"SERVER full"\n'
+    assert client_end.recv(100) == b""  # closed
+    client_end.close()
+
+
+def test_handler_thread_releases_its_connection():
+    admission = AdmissionController(max_sessions=1)
+    assert admission.admit_connection()
+    client_end, server_end = socket.socketpair()
+    client_end.close()  # the client leaves at once
+    handle_client(0, server_end, ("127.0.0.1", 0), None, None, None, None, admission=admission)
+    assert admission.active == 0
+
+
+def test_players_beyond_the_cap_get_game_full():
+    game = Game(dim=1, player_list=[], nb_round=1)
+    game.admission = AdmissionController(max_players=2)
+    lock = threading.Lock()
+
+    handlers = []
+    for i in range(3):
+        handler = ClientHandler(i, NullConnection(), ("127.0.0.1", 0), game, lock)
+        handler.handle_message("GAME")
+        handlers.append(handler)
+
+    assert [h.connection.sent[-1] for h in handlers] == [
+        b'"GAME ok"\n',
+        b'"GAME ok"\n',
+        b'"GAME full"\n',
+    ]
+    assert len(game.player_list) == 2
+    assert game.admission.rejected_players == 1
+
+    # A player already in the game may ask again
+    handlers[0].handle_message("GAME")
+    assert handlers[0].connection.sent[-1] == b'"GAME ok"\n'
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = None
+
+    def config(self, text):
+        self.text = text
+
+
+def test_refusals_are_shown_before_any_message():
+    gui = GameMasterGUI.__new__(GameMasterGUI)
+    gui.game = Game(dim=1, player_list=[], nb_round=1)
+    gui.game.admission = AdmissionController(max_sessions=0)
+    gui.game.admission.admit_connection()
+    gui.stats = MessageStats()
+    gui.label_stats = FakeLabel()
+
+    gui.update_stats()
+    assert "refusées 1" in gui.label_stats.text
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from src.server.game import Game
+from src.shared.calibration import calibrate, hardness, load_table, save_table
+from src.shared.function_generator_claude import Difficulty, FunctionGenerator, HiddenFunction
+
+
+def test_scores_do_not_depend_on_chunking_or_workers():
+    seeds = range(100, 124)
+    single = calibrate(seeds, workers=1, chunk_size=5)
+
+    assert np.array_equal(single, calibrate(seeds, workers=1, chunk_size=24))
+    assert np.array_equal(single, calibrate(seeds, workers=2, chunk_size=12))
+    assert np.array_equal(single[3:4], hardness([HiddenFunction(103)]))
+
+
+def test_easy_seeds_are_easier_than_hard_ones():
+    easy = calibrate(range(30), difficulty=Difficulty.EASY, workers=1)
+    hard = calibrate(range(30), difficulty=Difficulty.HARD, workers=1)
+
+    assert np.isfinite(easy).all() and (easy >= 0).all()
+    assert easy.mean() < hard.mean()
+
+
+def test_table_round_trip(tmp_path):
+    path = tmp_path / "hardness.json"
+    save_table(path, [3, 7], np.array([0.25, 0.75]), dim=1, difficulty="medium")
+
+    table, settings = load_table(path)
+
+    assert table == {3: 0.25, 7: 0.75}
+    assert settings == {"dim": 1, "difficulty": "medium"}
+
+
+def test_generator_draws_seeds_of_the_band_from_a_table():
+    table = {seed: seed / 10 for seed in range(10)}
+    generator = FunctionGenerator(1, base_seed=0, hardness_band=(0.3, 0.5), hardness_table=table)
+
+    assert {generator.generate().seed for _ in range(20)} <= {3, 4, 5}
+    with pytest.raises(ValueError):
+        FunctionGenerator(1, hardness_band=(2.0, 3.0), hardness_table=table)
+
+
+def test_generator_calibrates_candidates_without_a_table():
+    generator = FunctionGenerator(1, base_seed=0, hardness_band=(0.0, 0.6))
+
+    function = generator.generate()
+
+    assert 0.0 <= hardness([function])[0] <= 0.6
+
+
+def test_game_needs_a_table_for_a_hardness_band():
+    game = Game(dim=1, player_list=[], nb_round=3, hardness_band=(0.3, 0.5))
+    with pytest.raises(ValueError, match="hardness table"):
+        game.start()
+    assert not game.started and game.function_list is None
+
+    game.hardness_table = {11: 0.4, 12: 0.9}
+    game.start()
+    assert [f.seed for f in game.function_list] == [11, 11, 11]
+
+
+def test_game_rejects_a_table_of_other_settings():
+    settings = {"dim": 1, "difficulty": "medium", "nb_step": 10, "reveal_radius": 0.5}
+    game = Game(
+        dim=2,
+        player_list=[],
+        nb_round=1,
+        difficulty="hard",
+        hardness_band=(0.0, 1.0),
+        hardness_table={11: 0.4},
+        hardness_settings=settings,
+    )
+    with pytest.raises(ValueError, match="dim 1 instead of 2, difficulty medium instead of hard"):
+        game.start()
+    assert not game.started
+
+    game.difficulty = "medium"
+    game.start(dim=1)
+    assert game.started
+
+
+def test_band_seeds_are_played_at_the_game_difficulty():
+    # The band is calibrated on the functions the clients play: same difficulty
+    game = Game(
+        dim=1,
+        player_list=[],
+        nb_round=2,
+        difficulty="hard",
+        hardness_band=(0.0, 1.0),
+        hardness_table={11: 0.4},
+    )
+    game.start()
+    assert game.function_generator._difficulty is Difficulty.HARD
+    assert all(f._difficulty is Difficulty.HARD for f in game.function_list)
+    assert game.function_list[0].evaluate(0.3) == HiddenFunction(
+        11, dim=1, difficulty=Difficulty.HARD
+    ).evaluate(0.3)
@@ -0,0 +1,145 @@
+import queue
+import socket
+
+from src.client import main_client
+
+
+def test_reader_prepares_messages_off_the_ui_thread(monkeypatch):
+    client_end, server_end = socket.socketpair()
+    monkeypatch.setattr(main_client, "sock", client_end)
+    monkeypatch.setattr(main_client, "buffer", "")
+    inbox = queue.Queue()
+    main_client.MessageReader(inbox).start()
+
+    server_end.sendall(
+        b'"GAME ok"\n"GAME start 2 1 hard 10 0.5 (-6.0, 6.0)"\n"FUNC 42"\n'
+    )
+    server_end.close()
+
+    assert inbox.get(timeout=5) == ("GAME ok", None)
+
+    msg, (settings, generator) = inbox.get(timeout=5)
+    assert msg.startswith("GAME start")
+    assert settings["nb_round"] == 2 and settings["dim"] == 1
+    assert settings["difficulty"] is main_client.generator_module.Difficulty.HARD
+    assert settings["steps"] == 10 and settings["domain"] == (-6.0, 6.0)
+
+    msg, (function, (f_min, f_max)) = inbox.get(timeout=5)
+    assert msg == "FUNC 42"
+    assert function.seed == 42 and generator.dim == function.dim == 1
+    assert f_min < f_max
+
+    msg, error = inbox.get(timeout=5)
+    assert msg is None and isinstance(error, ConnectionError)
+
+
+def test_reader_answers_pings_itself(monkeypatch):
+    client_end, server_end = socket.socketpair()
+    monkeypatch.setattr(main_client, "sock", client_end)
+    monkeypatch.setattr(main_client, "buffer", "")
+    inbox = queue.Queue()
+    main_client.MessageReader(inbox).start()
+
+    server_end.sendall(b'"PING"\n"GAME ok"\n')
+
+    assert inbox.get(timeout=5) == ("GAME ok", None)
+    assert server_end.recv(64) == b"PONG\n"
+    server_end.close()
+    assert inbox.get(timeout=5)[0] is None
+
+
+def test_reader_resumes_a_dropped_session(monkeypatch):
+    client_end, server_end = socket.socketpair()
+    listener = socket.create_server(("127.0.0.1", 0))
+    monkeypatch.setattr(main_client, "sock", client_end)
+    monkeypatch.setattr(main_client, "buffer", "")
+    monkeypatch.setattr(main_client, "session_token", "tok")
+    monkeypatch.setattr(main_client, "server_address", listener.getsockname())
+    monkeypatch.setattr(main_client, "RESUME_DELAY", 0)
+    inbox = queue.Queue()
+    main_client.MessageReader(inbox).start()
+
+    server_end.close()
+    connection, _ = listener.accept()
+    assert connection.recv(64) == b"RESUME tok\n"
+    connection.sendall(b'"RESUME ok"\n"GAME ok"\n')
+
+    assert inbox.get(timeout=5) == ("GAME ok", None)
+
+    # Once the server is gone for good, the reader gives up
+    listener.close()
+    connection.close()
+    assert inbox.get(timeout=5)[0] is None
+
+
+def test_reader_skips_malformed_messages(monkeypatch):
+    client_end, server_end = socket.socketpair()
+    monkeypatch.setattr(main_client, "sock", client_end)
+    monkeypatch.setattr(main_client, "buffer", "")
+    inbox = queue.Queue()
+    main_client.MessageReader(inbox).start()
+
+    server_end.sendall(b'"GAME start 2"\n"GAME ok"\n')
+    server_end.close()
+
+    assert inbox.get(timeout=5) == ("GAME ok", None)
+    assert inbox.get(timeout=5)[0] is None
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = 0
+        self.destroyed = False
+
+    def after(self, delay, callback):
+        self.scheduled += 1
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def _window(*messages):
+    window = main_client.GameWindow.__new__(main_client.GameWindow)
+    window.root = FakeRoot()
+    window.closed = False
+    window.inbox = queue.Queue()
+    for msg in messages:
+        window.inbox.put(msg)
+    return window
+
+
+def test_failed_dispatch_does_not_stop_the_polling():
+    window = _window(("BAD", None), ("GOOD", None))
+    handled = []
+
+    def dispatch(msg, prepared):
+        handled.append(msg)
+        if msg == "BAD":
+            raise ValueError(msg)
+
+    window.dispatch = dispatch
+    window.process_messages()
+    assert handled == ["BAD", "GOOD"]
+    assert window.root.scheduled == 1
+
+
+def test_polling_stops_once_the_window_is_destroyed(monkeypatch):
+    monkeypatch.setattr(main_client.messagebox, "showerror", lambda *args: None)
+    window = _window((None, ConnectionError("lost")), ("GAME ok", None))
+    window.process_messages()
+    assert window.root.destroyed
+    assert window.root.scheduled == 0
+    assert window.inbox.qsize() == 1
+
+
+def test_replayed_round_keeps_its_steps(monkeypatch):
+    function = main_client.generator_module.FunctionGenerator(1).generate(7)
+    monkeypatch.setattr(main_client, "server_function", function)
+    monkeypatch.setattr(main_client, "steps_left", 3)
+    window = _window()
+    window.current_pos = [1.5, 0.0]
+
+    # The server replays the same FUNC after a resume
+    window.start_round(main_client.generator_module.FunctionGenerator(1).generate(7), (0, 1))
+    assert main_client.steps_left == 3
+    assert window.current_pos == [1.5, 0.0]
@@ -0,0 +1,29 @@
+from PIL import Image
+
+from src.client.main_client import (
+    SPRITE_ANGLE_STEP,
+    build_turtle_atlas,
+    quantize_angle,
+    turtle_sprite,
+)
+
+
+def test_quantize_angle():
+    assert quantize_angle(0.4) == 0
+    assert quantize_angle(1.2) == SPRITE_ANGLE_STEP
+    assert quantize_angle(-45.1) == -46
+    assert quantize_angle(120) == 90
+    assert quantize_angle(-89.9) == -90
+
+
+def test_atlas_matches_on_the_fly_rotation():
+    base = Image.new("RGBA", (40, 30))
+    base.putpixel((2, 3), (255, 0, 0, 255))
+    atlas = build_turtle_atlas(base)
+
+    assert len(atlas) == 2 * (180 // SPRITE_ANGLE_STEP + 1)
+    for key in [(False, 0), (True, 0), (True, -30), (False, 88)]:
+        expected = turtle_sprite(base, *key)
+        assert atlas[key].size == expected.size
+        assert atlas[key].tobytes() == expected.tobytes()
+    assert atlas[(True, 0)].getpixel((37, 3)) == (255, 0, 0, 255)
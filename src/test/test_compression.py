@@ -0,0 +1,66 @@
+import socket
+
+from src.client import main_client
+from src.server.client_handler import ClientHandler
+from src.shared import compression
+from src.test.doubles import NullConnection
+
+
+def _reveal(n):
+    return "REVEAL " + " ".join(f"player{i}|{i * 0.37 - 5:.6f}|{i * 0.011:.6f}" for i in range(n))
+
+
+def _handler(id=1):
+    return ClientHandler(id, NullConnection(), ("127.0.0.1", 0), None, None)
+
+
+def test_compressed_lines_round_trip_and_shrink():
+    message = _reveal(300)
+    line = compression.compressed_line(message)
+
+    assert len(line) < len(message) / 2
+    assert compression.decode(line.decode().strip().strip('"')) == message
+    assert compression.decode("GAME ok") == "GAME ok"
+
+
+def test_compression_is_negotiated_per_connection():
+    handler = _handler()
+    handler.handle_message("COMPRESS deflate64")
+    assert handler.connection.sent[-1] == b'"COMPRESS none"\n'
+    handler.send(_reveal(50))
+    assert handler.connection.sent[-1].startswith(b'"REVEAL')
+
+    handler.handle_message("COMPRESS zlib")
+    assert handler.connection.sent[-1] == b'"COMPRESS zlib"\n'
+    handler.send(_reveal(50))
+    assert handler.connection.sent[-1].startswith(b'"Z ')
+    handler.send("FUNC 42")  # below the threshold
+    assert handler.connection.sent[-1] == b'"FUNC 42"\n'
+
+
+def test_broadcast_compresses_once():
+    handlers = [_handler(i) for i in range(20)]
+    for handler in handlers:
+        handler.compression = compression.MODE
+    message = _reveal(100)
+
+    misses = compression.compressed_line.cache_info().misses
+    for handler in handlers:
+        handler.send(message)
+
+    assert compression.compressed_line.cache_info().misses == misses + 1
+    assert len({handler.connection.sent[0] for handler in handlers}) == 1
+
+
+def test_client_decodes_compressed_lines(monkeypatch):
+    client_end, server_end = socket.socketpair()
+    monkeypatch.setattr(main_client, "sock", client_end)
+    monkeypatch.setattr(main_client, "buffer", "")
+    message = _reveal(80)
+
+    server_end.sendall(compression.compressed_line(message) + b'"GAME over"\n')
+
+    assert main_client.receive() == message
+    assert main_client.receive() == "GAME over"
+    client_end.close()
+    server_end.close()
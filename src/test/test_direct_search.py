@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.shared.direct_search import (
+    STRATEGIES,
+    BatchGame,
+    CompassSearch,
+    FunctionBatch,
+    RandomSearch,
+    WindowDescent,
+    grow_step,
+    play,
+    shrink_step,
+)
+from src.shared.function_generator_claude import Difficulty, HiddenFunction
+
+
+def _functions(dim, n=12, difficulty=Difficulty.HARD):
+    return [HiddenFunction(seed, dim=dim, difficulty=difficulty) for seed in range(n)]
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_batch_matches_each_function(dim):
+    # Few 3D functions: their true minimum is costly to sample
+    functions = _functions(dim, n=12 if dim < 3 else 3)
+    batch = FunctionBatch(functions)
+    X = np.random.default_rng(dim).uniform(*batch.domain, size=(len(functions), 5, dim))
+
+    values = batch.evaluate(X)
+
+    for f, points, row in zip(functions, X, values):
+        expected = [f._raw_eval(x[0] if dim == 1 else tuple(x)) for x in points]
+        assert np.allclose(row, expected, rtol=0, atol=1e-10)
+    assert np.allclose(batch.evaluate(X[:, 0]), values[:, 0])
+
+
+def test_batch_rejects_mixed_dimensions():
+    with pytest.raises(ValueError):
+        FunctionBatch([HiddenFunction(0, dim=1), HiddenFunction(0, dim=2)])
+
+
+def test_step_changes_follow_the_client():
+    steps = np.array([1.0, 0.01, 0.02, 0.5])
+    assert grow_step(steps).tolist() == [1.3, 0.02, 0.03, 0.65]
+    assert shrink_step(steps).tolist() == [0.7, 0.01, 0.01, 0.35]
+
+
+def test_1d_moves_stop_short_of_the_border():
+    batch = FunctionBatch(_functions(1, n=2))
+    game = BatchGame(batch, nb_step=3)
+    game.step[:] = 100.0
+
+    game.move([0, 1])
+
+    lo, hi = batch.domain
+    assert game.pos[:, 0].tolist() == [hi - 0.02, lo + 0.02]
+    assert game.steps_left == 2
+
+
+def test_2d_moves_are_clamped_to_the_domain():
+    batch = FunctionBatch(_functions(2, n=2))
+    game = BatchGame(batch)
+    game.step[:] = 100.0
+
+    game.move([2, 1])  # up, left
+
+    lo, hi = batch.domain
+    assert game.pos.tolist() == [[0.0, hi], [lo, 0.0]]
+    assert np.allclose(game.value, batch.evaluate(game.pos))
+
+
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_strategies_use_exactly_the_step_budget(name):
+    game = play(STRATEGIES[name](), BatchGame(FunctionBatch(_functions(2)), nb_step=7))
+
+    assert game.steps_left == 0
+    assert (game.regret >= -1e-6).all()
+    with pytest.raises(RuntimeError):
+        game.move(np.zeros(game.n, dtype=int))
+
+
+def test_search_beats_random_walk_on_average():
+    batch = FunctionBatch(_functions(1, n=300, difficulty=Difficulty.MEDIUM))
+
+    random = play(RandomSearch(seed=0), BatchGame(batch)).regret.mean()
+    assert play(CompassSearch(), BatchGame(batch)).regret.mean() < random
+    assert play(WindowDescent(), BatchGame(batch)).regret.mean() < random
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.shared.function_bank import bank_path, build_bank, open_bank, save_bank
+from src.shared.function_generator_claude import Difficulty, FunctionGenerator, HiddenFunction
+
+
+@pytest.fixture(scope="module")
+def bank(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("banks")
+    records = build_bank(range(20, 0, -1), dim=2, difficulty=Difficulty.EASY, workers=1)
+    save_bank(bank_path(directory, 2, Difficulty.EASY), records)
+    return open_bank(directory, 2, Difficulty.EASY)
+
+
+def test_bank_is_sorted_and_vetted(bank):
+    assert isinstance(bank.records, np.memmap)
+    assert (np.diff(bank.seeds) > 0).all()
+    assert 0 < len(bank) <= 20
+    lo, hi = bank.domain
+    assert ((bank.records["min_x"] > lo) & (bank.records["min_x"] < hi)).all()
+    assert np.isfinite(bank.records["hardness"]).all()
+
+
+def test_records_rebuild_the_same_function(bank):
+    seed = int(bank.seeds[3])
+    function = bank.function(bank.index_of(seed))
+    expected = HiddenFunction(seed, dim=2, difficulty=Difficulty.EASY, minimum_method="bnb")
+
+    X = np.random.default_rng(0).uniform(*bank.domain, size=(50, 2))
+    assert np.array_equal(function._eval_points(X), expected._eval_points(X))
+    assert function.true_minimum == expected.true_minimum
+    assert function.minimum_gap == expected.minimum_gap
+    assert function.evaluate((0.5, -1.0)) == expected.evaluate((0.5, -1.0))
+    assert function.eval_count == 1
+
+
+def test_missing_banks_and_seeds(bank, tmp_path):
+    assert open_bank(tmp_path, 2, Difficulty.EASY) is None
+    assert open_bank(None, 2, Difficulty.EASY) is None
+    assert bank.index_of(10**9) is None
+
+
+def test_generator_draws_from_the_bank(bank):
+    band = (0.0, float(np.median(bank.records["hardness"])))
+    generator = FunctionGenerator(
+        2, difficulty=Difficulty.EASY, base_seed=0, bank=bank, hardness_band=band
+    )
+
+    in_band = set(bank.seeds[bank.indices_in_band(band)].tolist())
+    assert {generator.generate().seed for _ in range(10)} <= in_band
+    # Seeds missing from the bank are still generated
+    assert generator.generate(10**9).seed == 10**9
+
+
+def test_generator_rejects_a_bank_of_other_settings(bank):
+    with pytest.raises(ValueError):
+        FunctionGenerator(2, difficulty=Difficulty.HARD, bank=bank)
+    with pytest.raises(ValueError):
+        FunctionGenerator(1, difficulty=Difficulty.EASY, bank=bank)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from src.shared.function_generator_claude import Difficulty, HiddenFunction
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+@pytest.mark.parametrize("difficulty", list(Difficulty))
+def test_value_and_grad_matches_finite_differences(dim, difficulty):
+    hf = HiddenFunction(seed=7, dim=dim, difficulty=difficulty)
+    points = np.random.default_rng(0).uniform(-5.5, 5.5, size=(50, dim))
+
+    f, grad = hf._value_and_grad(points)
+
+    assert np.allclose(f, hf._raw_eval(points[:, 0] if dim == 1 else points.T))
+    eps = 1e-6
+    for axis in range(dim):
+        shift = np.zeros(dim)
+        shift[axis] = eps
+        f_plus, _ = hf._value_and_grad(points + shift)
+        f_minus, _ = hf._value_and_grad(points - shift)
+        assert np.allclose(grad[:, axis], (f_plus - f_minus) / (2 * eps), atol=1e-5)
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+@pytest.mark.parametrize("seed", range(5))
+def test_true_minimum_beats_dense_grid(dim, seed):
+    hf = HiddenFunction(seed=seed, dim=dim, difficulty=Difficulty.HARD)
+    lo, hi = hf.domain
+
+    if dim == 1:
+        grid_min = hf._raw_eval(np.linspace(lo, hi, 50_001)).min()
+    else:
+        xs = np.linspace(lo, hi, 801)
+        X, Y = np.meshgrid(xs, xs)
+        grid_min = hf._raw_eval((X, Y)).min()
+
+    assert hf.true_minimum["y"] <= grid_min + 1e-12
+    assert abs(hf._raw_eval(hf.true_minimum["x"]) - hf.true_minimum["y"]) < 1e-9
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+def test_public_gradient_and_hessian(dim):
+    hf = HiddenFunction(seed=3, dim=dim, difficulty=Difficulty.HARD)
+    rng = np.random.default_rng(1)
+    eps = 1e-5
+
+    if dim == 1:
+        xs = rng.uniform(-5.5, 5.5, size=(4, 5))
+        assert hf.gradient(xs).shape == xs.shape
+        assert isinstance(hf.gradient(0.3), float)
+        fd = (hf._raw_eval(xs + eps) - hf._raw_eval(xs - eps)) / (2 * eps)
+        assert np.allclose(hf.gradient(xs), fd, atol=1e-5)
+        fd2 = (hf.gradient(xs + eps) - hf.gradient(xs - eps)) / (2 * eps)
+        assert np.allclose(hf.hessian(xs), fd2, atol=1e-4)
+    else:
+        x, y = rng.uniform(-5.5, 5.5, size=(2, 7))
+        grad = hf.gradient((x, y))
+        hess = hf.hessian((x, y))
+        assert grad.shape == (2, 7) and hess.shape == (2, 2, 7)
+        assert hf.gradient((0.1, 0.2)).shape == (2,)
+        assert np.allclose(hess[0, 1], hess[1, 0])
+        for k, delta in enumerate([(eps, 0), (0, eps)]):
+            plus = (x + delta[0], y + delta[1])
+            minus = (x - delta[0], y - delta[1])
+            fd = (hf._raw_eval(plus) - hf._raw_eval(minus)) / (2 * eps)
+            assert np.allclose(grad[k], fd, atol=1e-5)
+            fd2 = (hf.gradient(plus) - hf.gradient(minus)) / (2 * eps)
+            assert np.allclose(hess[:, k], fd2, atol=1e-4)
+
+    assert hf.eval_count == 0
+
+
+@pytest.mark.parametrize("dim", [1, 2])
+def test_branch_and_bound_minimum_is_certified(dim):
+    for seed in range(5):
+        grid = HiddenFunction(seed=seed, dim=dim, difficulty=Difficulty.HARD)
+        bnb = HiddenFunction(
+            seed=seed, dim=dim, difficulty=Difficulty.HARD, minimum_method="bnb"
+        )
+        assert 0 <= bnb.minimum_gap <= 1e-3
+        assert bnb._minimum_evals < 40_000
+        # Same landscape, only the shift differs: compare unshifted values
+        bnb_min = bnb._raw_eval(bnb.true_minimum["x"]) - bnb._shift
+        grid_min = grid._raw_eval(grid.true_minimum["x"]) - grid._shift
+        assert bnb_min <= grid_min + 1e-9
+        assert grid.minimum_gap is None
+
+
+def test_invalid_minimum_method():
+    with pytest.raises(ValueError):
+        HiddenFunction(seed=0, minimum_method="newton")
+
+
+@pytest.mark.parametrize(
+    "dim, seed, x_min",
+    [
+        (1, 0, -1.621948882513654),
+        (1, 7, 1.8944186565209784),
+        (2, 0, (0.420595819129984, 4.742799974091)),
+        (2, 7, (2.535467022196904, -4.6969205968343495)),
+    ],
+)
+def test_seeds_unchanged_in_1d_and_2d(dim, seed, x_min):
+    hf = HiddenFunction(seed=seed, dim=dim, difficulty=Difficulty.HARD)
+    assert hf.true_minimum["x"] == x_min
+
+
+@pytest.mark.parametrize("dim", [3, 5])
+def test_n_dimensional_function(dim):
+    hf = HiddenFunction(seed=4, dim=dim, difficulty=Difficulty.HARD)
+    rng = np.random.default_rng(2)
+    points = rng.uniform(-5.5, 5.5, size=(3, 4, dim))
+
+    values = hf.evaluate_batch(points)
+    assert values.shape == (3, 4)
+    assert hf.eval_count == 12 and len(hf.history) == 12
+    assert values[1, 2] == pytest.approx(hf.evaluate(tuple(points[1, 2])))
+    assert hf.best_value == pytest.approx(values.min())
+    assert values.min() >= hf.true_minimum["y"]
+
+    x = points[0, 0]
+    grad = hf.gradient(tuple(x))
+    assert grad.shape == (dim,)
+    assert hf.hessian(tuple(x)).shape == (dim, dim)
+    eps = 1e-5
+    for k in range(dim):
+        delta = np.eye(dim)[k] * eps
+        fd = (hf._raw_eval(tuple(x + delta)) - hf._raw_eval(tuple(x - delta))) / (2 * eps)
+        assert grad[k] == pytest.approx(fd, abs=1e-5)
+
+    with pytest.raises(ValueError):
+        hf.evaluate((0.0,) * (dim - 1))
+    with pytest.raises(ValueError):
+        hf.evaluate_batch(np.full((2, dim), 7.0))
+
+
+def test_branch_and_bound_certified_in_3d():
+    hf = HiddenFunction(seed=1, dim=3, difficulty=Difficulty.MEDIUM, minimum_method="bnb")
+    assert hf.minimum_gap <= 1e-3
+    samples = np.random.default_rng(0).uniform(-6, 6, size=(20_000, 3))
+    assert hf.evaluate_batch(samples).min() >= hf.true_minimum["y"] - 1e-3
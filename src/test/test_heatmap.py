@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from src.shared.heatmap import COLORMAPS, HeatmapRasterizer, colormap_lut
+
+
+def test_redblue_lut_matches_the_historical_colors():
+    lut = colormap_lut("redblue")
+    levels = np.arange(256)
+    assert lut.shape == (256, 3) and lut.dtype == np.uint8
+    assert (lut[:, 0] == levels).all()
+    assert (lut[:, 1] == 0).all()
+    assert (lut[:, 2] == 255 - levels).all()
+
+
+@pytest.mark.parametrize("name", sorted(COLORMAPS))
+def test_colormaps_hit_their_end_anchors(name):
+    lut = colormap_lut(name)
+    assert tuple(lut[0]) == COLORMAPS[name][0]
+    assert tuple(lut[-1]) == COLORMAPS[name][-1]
+
+
+def test_unknown_colormap():
+    with pytest.raises(ValueError):
+        colormap_lut("rainbow")
+
+
+def test_render_grid_matches_the_former_pipeline():
+    rng = np.random.default_rng(0)
+    Z = rng.normal(size=(40, 50))
+    raster = HeatmapRasterizer(50, 40)
+
+    pixels = raster.render_grid(Z)
+
+    Z_norm = (Z - Z.min()) / (Z.max() - Z.min())
+    R = (Z_norm * 255).astype(np.uint8)
+    expected = np.flipud(np.stack([R, np.zeros_like(R), 255 - R], axis=2))
+    assert np.abs(pixels.astype(int) - expected).max() <= 1
+
+    ppm = raster.ppm()
+    assert ppm.startswith(b"P6 50 40 255\n")
+    assert ppm[-3:] == pixels[-1, -1].tobytes()
+    assert len(ppm) == len(b"P6 50 40 255\n") + 50 * 40 * 3
+
+
+def test_paint_regions_over_background():
+    raster = HeatmapRasterizer(20, 10)
+    raster.clear()
+    raster.paint(np.array([[0.0, 1.0], [2.0, 3.0]]), 5, 4, 0.0, 3.0)
+
+    assert tuple(raster.pixels[0, 0]) == (30, 30, 30)
+    assert tuple(raster.pixels[4, 5]) == (0, 0, 255)
+    assert tuple(raster.pixels[5, 6]) == (255, 0, 0)
+    assert tuple(raster.pixels[6, 7]) == (30, 30, 30)
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src.shared.lazy_import import LazyModule, lazy_import, prefetch
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_lazy_module_loads_on_first_use():
+    module = LazyModule("json")
+    assert not module.loaded
+    assert module.dumps([1]) == "[1]"
+    assert module.loaded
+
+
+def test_lazy_import_returns_imported_modules_directly():
+    assert lazy_import("sys") is sys
+
+
+def test_prefetch_loads_in_background():
+    module = LazyModule("..shared.function_generator_claude", "src.client")
+    prefetch(module).join()
+    assert module.loaded
+    assert module.Difficulty.HARD.value == "hard"
+
+
+def test_entry_points_do_not_import_heavy_modules():
+    code = (
+        "import sys, src.client.main_client, src.server.main_server\n"
+        "heavy = ('numpy', 'PIL', 'scipy', 'matplotlib')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_client_without_bank_does_not_import_the_bank_modules():
+    code = (
+        "import queue, sys\n"
+        "from src.client import main_client\n"
+        "main_client.MessageReader(queue.Queue()).prepare('GAME start 1 2 hard 10 0.5 (-6, 6)')\n"
+        "bank = ('src.shared.function_bank', 'src.shared.calibration', 'src.shared.direct_search')\n"
+        "print(','.join(m for m in bank if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,91 @@
+import numpy as np
+
+from src.server.leaderboard import Leaderboard
+from src.server.player import Player
+
+
+def _players(n):
+    return [Player(f"p{i}", i, None) for i in range(n)]
+
+
+def _former_points(players, scores):
+    """Points of the former sort-based implementation."""
+    ranked = sorted(players, key=lambda p: scores[p.id])
+    return {p.id: len(players) - idx + 1 for idx, p in enumerate(ranked)}
+
+
+def test_points_match_the_former_ranking():
+    players = _players(50)
+    leaderboard = Leaderboard(players, 2)
+    rng = np.random.default_rng(0)
+    # Rounded values and force-finished players, to exercise ties
+    scores = {p.id: float(s) for p, s in zip(players, np.round(rng.uniform(0, 3, 50)))}
+    scores[7] = scores[12] = float("inf")
+    for p in players:
+        leaderboard.update_function_score(p, 1, scores[p.id])
+
+    leaderboard.update_player_scores(1)
+
+    expected = _former_points(players, scores)
+    assert {p.id: leaderboard.player_points(p)[1] for p in players} == expected
+    assert leaderboard.player_points(players[0])[0] == 0
+
+
+def test_missing_scores_and_round_completion():
+    players = _players(3)
+    leaderboard = Leaderboard(players, 1)
+    leaderboard.update_function_score(players[0], 0, 2.0)
+    leaderboard.update_function_score(players[2], 0, 1.0)
+
+    assert leaderboard.function_score(players[1], 0) is None
+    assert not leaderboard.round_complete(0)
+
+    leaderboard.update_player_scores(0)
+    assert [leaderboard.player_points(p)[0] for p in players] == [3, 2, 4]
+
+    leaderboard.update_function_score(players[1], 0, 3.0)
+    assert leaderboard.round_complete(0)
+
+
+def test_capacity_grows_for_late_joiners():
+    players = _players(3)
+    leaderboard = Leaderboard(players, 1)
+    late = _players(40)[3:]
+
+    for i, p in enumerate(late):
+        leaderboard.update_function_score(p, 0, float(i))
+
+    assert leaderboard.size == 40
+    assert leaderboard.function_score(late[-1], 0) == 36.0
+    assert leaderboard.ids.tolist() == list(range(40))
+
+
+def test_remove_player_keeps_the_other_rows():
+    players = _players(5)
+    leaderboard = Leaderboard(players, 1)
+    for p in players:
+        leaderboard.update_function_score(p, 0, float(p.id))
+
+    leaderboard.remove_player(players[1])
+    leaderboard.remove_player(players[1])  # already gone: no-op
+
+    assert leaderboard.ids.tolist() == [0, 2, 3, 4]
+    assert [leaderboard.function_score(p, 0) for p in players] == [0.0, None, 2.0, 3.0, 4.0]
+    assert leaderboard.row(players[4]) == 3
+
+
+def test_standings_and_freeze():
+    players = _players(3)
+    leaderboard = Leaderboard(players, 2)
+    for r, values in enumerate(([1.0, 0.5, 2.0], [0.1, 3.0, 0.2])):
+        for p, v in zip(players, values):
+            leaderboard.update_function_score(p, r, v)
+        leaderboard.update_player_scores(r)
+
+    assert leaderboard.standings() == [(0, 7), (1, 6), (2, 5)]
+    assert leaderboard.rank_in_round(players[1], 1) == 1
+
+    leaderboard.freeze()
+    assert sorted(leaderboard.frozen_snapshot) == [(0, 7), (1, 6), (2, 5)]
+    leaderboard.unfreeze(players[:2], 1)
+    assert leaderboard.size == 2 and leaderboard.points.shape == (2, 1)
@@ -0,0 +1,84 @@
+import numpy as np
+
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.game_master import LiveMapWindow
+from src.server.live_positions import LivePositions
+from src.test.doubles import NullConnection
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.created = 0
+        self.moves = []
+        self.states = {}
+
+    def create_oval(self, *coords, **options):
+        self.created += 1
+        self.states[self.created] = options.get("state", "normal")
+        return self.created
+
+    def coords(self, item, *coords):
+        self.moves.append(item)
+
+    def itemconfigure(self, item, state):
+        self.states[item] = state
+
+
+def test_positions_grow_and_reset():
+    live = LivePositions(dim=2)
+    for i in range(40):
+        live.update(i, (float(i), -1.0))
+    live.remove(3)
+
+    version, ids, positions = live.snapshot()
+    assert ids.tolist() == list(range(40))
+    assert positions[39].tolist() == [39.0, -1.0]
+    assert np.isnan(positions[3]).all()
+
+    live.reset(1)
+    assert live.snapshot()[0] > version
+    assert live.snapshot()[2].shape == (0, 1)
+
+
+def test_moves_are_only_recorded_during_the_round():
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler = ClientHandler(5, NullConnection(), ("127.0.0.1", 0), game, None)
+    game.player_list.append(handler.player)
+
+    handler.handle_message("MOVE 1.5")  # game not started
+    assert game.live_positions.size == 0
+
+    game.submissions = {5: False}
+    handler.handle_message("MOVE 1.5")
+    handler.handle_message("MOVE nan")
+    handler.handle_message("MOVE 1,2")  # wrong dimension
+    assert game.live_positions.snapshot()[2].tolist() == [[1.5]]
+
+    game.submissions = {5: True}
+    handler.handle_message("MOVE 2.5")
+    assert game.live_positions.snapshot()[2].tolist() == [[1.5]]
+    assert handler.connection.sent == []  # never answered
+
+
+def test_live_map_reuses_its_markers():
+    game = Game(dim=2, player_list=[], nb_round=1)
+    live_map = LiveMapWindow.__new__(LiveMapWindow)
+    live_map.game = game
+    live_map.canvas = FakeCanvas()
+    live_map.label = type("Label", (), {"config": lambda self, **kw: None})()
+    live_map.markers = []
+    live_map.boxes = np.zeros((0, 4))
+
+    positions = np.random.default_rng(0).uniform(-6, 6, (30, 2))
+    live_map.draw(positions)
+    assert live_map.canvas.created == 30 and len(live_map.canvas.moves) == 30
+
+    positions[7] = (0.0, 0.0)
+    live_map.draw(positions)
+    assert live_map.canvas.moves[30:] == [8]
+
+    # Next round: fewer players, no new ovals, the others hidden
+    live_map.draw(positions[:10])
+    assert live_map.canvas.created == 30
+    assert sum(state == "hidden" for state in live_map.canvas.states.values()) == 20
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import numpy as np
+
+from src.shared.function_generator_claude import HiddenFunction
+from src.shared.progressive import ProgressiveRenderer, curve_levels, heatmap_levels
+
+
+class FakeRoot:
+    """Collects ``after`` callbacks so that the test runs them by hand."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+
+    def run_pending(self):
+        pending, self.pending = self.pending, []
+        for func, args in pending:
+            func(*args)
+
+
+def run_until_idle(root, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while root.pending and time.monotonic() < deadline:
+        root.run_pending()
+        time.sleep(0.005)
+
+
+def test_heatmap_levels_end_at_canvas_resolution():
+    hf = HiddenFunction(7, dim=2)
+    levels = list(heatmap_levels(hf, hf.domain, 80, 60, threading.Event()))
+
+    assert [zoom for _, zoom in levels] == [(8, 8), (4, 4), (2, 2), (1, 1)]
+    for ppm, (d, _) in levels:
+        assert ppm.startswith(f"P6 {80 // d} {60 // d} 255\n".encode())
+    assert len(levels[-1][0]) == len(b"P6 80 60 255\n") + 80 * 60 * 3
+
+
+def test_curve_levels_cover_every_pixel_column():
+    hf = HiddenFunction(7, dim=1)
+    coarse, full = curve_levels(hf, hf.domain, 100, lambda ys: -ys, threading.Event())
+
+    assert coarse[0::2][:2] == [0, 8] and coarse[-2] == 99
+    assert full[0::2] == list(range(100))
+    lo, hi = hf.domain
+    xs = lo + np.arange(100) * (hi - lo) / 99
+    assert np.allclose(full[1::2], -hf._raw_eval(xs))
+
+
+def test_levels_stop_once_cancelled():
+    hf = HiddenFunction(7, dim=2)
+    cancel = threading.Event()
+    levels = heatmap_levels(hf, hf.domain, 80, 60, cancel)
+    next(levels)
+    cancel.set()
+    assert list(levels) == []
+
+
+def test_renderer_shows_first_level_at_once_and_ends_on_the_last():
+    root = FakeRoot()
+    shown = []
+
+    ProgressiveRenderer(root).start(lambda cancel: iter(range(5)), shown.append)
+    assert shown == [0]
+
+    run_until_idle(root)
+    assert shown[-1] == 4
+    assert shown == sorted(set(shown))
+
+
+def test_cancelled_render_draws_nothing_more():
+    root = FakeRoot()
+    release = threading.Event()
+    shown = []
+
+    def levels(cancel):
+        yield "coarse"
+        release.wait(5)
+        yield "fine"
+
+    renderer = ProgressiveRenderer(root)
+    renderer.start(levels, shown.append)
+    renderer.start(lambda cancel: iter(["next round"]), shown.append)
+    release.set()
+    run_until_idle(root)
+
+    assert shown == ["coarse", "next round"]
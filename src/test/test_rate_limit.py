@@ -0,0 +1,90 @@
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.metrics import Metrics, render
+from src.server.rate_limit import RateLimiter, TokenBucket
+from src.server.stats import MessageStats
+from src.test.doubles import FakeClock, NullConnection
+
+
+class CountingLock:
+    """Counts how many times the game lock is taken."""
+
+    def __init__(self):
+        self.taken = 0
+
+    def acquire(self):
+        self.taken += 1
+
+    def release(self):
+        pass
+
+
+def test_bucket_allows_a_burst_then_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+    assert [bucket.allow() for _ in range(4)] == [True, True, True, False]
+
+    clock.now = 0.5  # one token back
+    assert bucket.allow()
+    assert not bucket.allow()
+
+    clock.now = 100.0  # refilled up to the burst only
+    assert sum(bucket.allow() for _ in range(10)) == 3
+
+
+def test_a_flood_of_one_type_does_not_starve_the_others():
+    clock = FakeClock()
+    limiter = RateLimiter({"MOVE": (10.0, 10), "SCORE": (1.0, 1)}, clock=clock)
+    assert sum(limiter.allow("MOVE") for _ in range(1000)) == 10
+    assert limiter.allow("SCORE")
+    assert limiter.dropped == 990
+
+    # Unknown codes all share the default bucket
+    for i in range(100):
+        limiter.allow(f"JUNK{i}")
+    assert len(limiter.buckets) == 3
+
+
+def test_connection_bucket_caps_all_types_together():
+    limiter = RateLimiter({}, default=(100.0, 100), connection=(1.0, 5), clock=FakeClock())
+    assert sum(limiter.allow(code) for code in ("A", "B", "C") * 3) == 5
+
+
+def test_handler_drops_before_the_lock():
+    game = Game(dim=1, player_list=[], nb_round=1)
+    stats = MessageStats()
+    lock = CountingLock()
+    limiter = RateLimiter({"GAME": (1.0, 2)}, clock=FakeClock())
+    handler = ClientHandler(
+        3, NullConnection(), ("127.0.0.1", 0), game, lock, stats, rate_limiter=limiter
+    )
+
+    for _ in range(10):
+        handler.handle_message("GAME")
+    assert lock.taken == 2
+    assert len(handler.connection.sent) == 2
+
+    rows = {row[0]: row for row in stats.summary()}
+    assert rows["GAME"][1] == 2
+    assert rows["GAME"][6] == 8
+
+
+def test_dropped_messages_in_metrics():
+    stats = MessageStats()
+    metrics = Metrics()
+    handler = ClientHandler(
+        4,
+        NullConnection(),
+        ("127.0.0.1", 0),
+        None,
+        None,
+        stats,
+        metrics,
+        rate_limiter=RateLimiter({"STATS": (1.0, 1)}, clock=FakeClock()),
+    )
+    for _ in range(3):
+        handler.handle_message("STATS")
+
+    text = render(metrics, stats)
+    assert 'messages_in_total{type="STATS"} 1' in text
+    assert 'messages_rate_limited_total{type="STATS"} 2' in text
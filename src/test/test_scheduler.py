@@ -0,0 +1,96 @@
+import threading
+
+from src.server.game import Game
+from src.server.leaderboard import Leaderboard
+from src.server.player import Player
+from src.server.scheduler import TimerScheduler
+from src.shared.function_generator_claude import HiddenFunction
+from src.test.doubles import FakeClock, SilentHandler
+
+
+def test_timers_run_in_deadline_order_and_can_be_cancelled():
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock)
+    ran = []
+    scheduler.call_at(3.0, ran.append, "c")
+    scheduler.call_at(1.0, ran.append, "a")
+    scheduler.call_at(1.0, ran.append, "b")
+    scheduler.call_at(2.0, ran.append, "x").cancel()
+
+    clock.now = 2.5
+    assert scheduler.run_due() == 2
+    assert ran == ["a", "b"]
+    assert len(scheduler) == 1
+
+    clock.now = 10.0
+    scheduler.run_due()
+    assert ran == ["a", "b", "c"]
+
+
+def test_scheduler_thread_fires_timers():
+    scheduler = TimerScheduler().start()
+    fired = threading.Event()
+    scheduler.call_later(10.0, fired.set)
+    scheduler.call_later(0.01, fired.set)  # earlier: must wake the sleeping thread
+    assert fired.wait(2.0)
+    scheduler.stop()
+
+
+def _game(n, clock, **kwargs):
+    players = [Player(f"p{i}", i, SilentHandler()) for i in range(n)]
+    game = Game(dim=1, player_list=players, nb_round=2, scheduler=TimerScheduler(clock), **kwargs)
+    game.function_list = [HiddenFunction(3, dim=1), HiddenFunction(4, dim=1)]
+    game.leaderboard = Leaderboard(players, 2)
+    game.started = True
+    game.submissions = {p.id: False for p in players}
+    game._begin_round_timers()
+    return game, players
+
+
+def _submit(game, player, x=0.5):
+    f = game.function_list[game.current_round]
+    game.compute_score(player, f.evaluate(x), str(x))
+
+
+def test_deadline_force_finishes_the_round():
+    clock = FakeClock()
+    game, players = _game(3, clock, round_deadline=30)
+    _submit(game, players[0])
+    assert game.deadline_at == 30
+
+    clock.now = 31
+    game.scheduler.run_due()
+
+    assert game.waiting_for_next_round
+    assert game.leaderboard.function_score(players[1], 0) == float("inf")
+
+
+def test_quorum_gives_the_others_a_grace_period():
+    clock = FakeClock()
+    game, players = _game(10, clock, quorum=0.9, quorum_grace=5)
+    for p in players[:8]:
+        _submit(game, p)
+    assert game.deadline_at is None
+
+    clock.now = 2
+    _submit(game, players[8])
+    assert game.deadline_at == 7
+
+    clock.now = 8
+    game.scheduler.run_due()
+    assert game.waiting_for_next_round
+
+
+def test_timers_of_a_finished_round_do_nothing():
+    clock = FakeClock()
+    game, players = _game(2, clock, round_deadline=30)
+    for p in players:
+        _submit(game, p)
+    clock.now = 10
+    game.advance_round()
+    assert game.current_round == 1 and game.deadline_at == 40
+
+    # The deadline of round 0 has passed, but that round is over
+    clock.now = 35
+    assert game.scheduler.run_due() == 0
+    assert not game.waiting_for_next_round
@@ -0,0 +1,180 @@
+import socket
+import threading
+import time
+
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.leaderboard import Leaderboard
+from src.server.player import Player
+from src.server.scheduler import TimerScheduler
+from src.server.sessions import SessionRegistry
+from src.shared.function_generator_claude import HiddenFunction
+from src.test.doubles import FakeClock, SilentHandler
+
+
+def _read_lines(sock, n):
+    data = b""
+    while data.count(b"\n") < n:
+        data += sock.recv(4096)
+    return data.decode().splitlines()
+
+
+def _serve(game, sessions=None):
+    client_end, server_end = socket.socketpair()
+    handler = ClientHandler(1, server_end, ("127.0.0.1", 0), game, threading.Lock(), sessions=sessions)
+    thread = threading.Thread(target=handler.run, daemon=True)
+    thread.start()
+    return handler, thread, client_end
+
+
+def test_messages_are_framed_by_newlines():
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler, thread, client = _serve(game)
+
+    # Split across two sends, two messages in the second one
+    client.sendall(b"USERN")
+    client.sendall(b"AME alice\nGAME\n")
+    assert _read_lines(client, 2) == ['"USERNAME ok"', '"GAME ok"']
+
+    client.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert game.player_list == []
+
+
+def test_reaper_pings_then_drops_silent_sessions():
+    clock = FakeClock()
+    sessions = SessionRegistry(interval=5, timeout=20, clock=clock)
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler, thread, client = _serve(game, sessions)
+    client.sendall(b"USERNAME bob\nGAME\n")
+    _read_lines(client, 2)
+    assert len(sessions) == 1 and game.player_list == [handler.player]
+
+    clock.now = 6
+    assert sessions.heartbeat() == []
+    assert _read_lines(client, 1) == ['"PING"']
+
+    # The reply counts as activity
+    client.sendall(b"PONG\n")
+    for _ in range(5000):
+        if handler.last_seen == 6:
+            break
+        time.sleep(0.001)
+    clock.now = 25
+    assert sessions.heartbeat() == []
+
+    clock.now = 27
+    assert sessions.heartbeat() == [handler]
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(sessions) == 0 and game.player_list == []
+    client.close()
+
+
+def test_failed_send_closes_instead_of_raising():
+    client_end, server_end = socket.socketpair()
+    handler = ClientHandler(1, server_end, ("127.0.0.1", 0), None, threading.Lock())
+    server_end.close()
+
+    assert handler.send("GAME over") is False
+    assert not handler.running
+    client_end.close()
+
+
+def test_leaving_player_no_longer_holds_the_round():
+    players = [Player(f"p{i}", i, SilentHandler()) for i in range(3)]
+    game = Game(dim=1, player_list=list(players), nb_round=1)
+    game.function_list = [HiddenFunction(3, dim=1)]
+    game.leaderboard = Leaderboard(game.player_list, 1)
+    game.started = True
+    game.submissions = {p.id: False for p in players}
+    for p in players[:2]:
+        game.compute_score(p, game.function_list[0].evaluate(0.0), "0.0")
+    assert not game.waiting_for_next_round
+
+    game.remove_player(players[2])
+    assert game.waiting_for_next_round
+
+
+def test_dropped_player_resumes_its_session():
+    clock = FakeClock()
+    sessions = SessionRegistry(interval=0, clock=clock, resume_grace=60)
+    sessions.start(TimerScheduler(clock))
+    game = Game(dim=1, player_list=[], nb_round=1)
+    first, thread, client = _serve(game, sessions)
+    client.sendall(b"USERNAME carol\nGAME\n")
+    reply, _ = _read_lines(client, 2)
+    token = reply.strip('"').split()[2]
+
+    client.close()
+    thread.join(5)
+    assert game.player_list == [first.player]
+
+    # The game starts while the player is away
+    game.start()
+
+    second, thread, client = _serve(game, sessions)
+    client.sendall(f"RESUME {token}\n".encode())
+    lines = _read_lines(client, 3)
+    assert lines[0] == '"RESUME ok"'
+    assert lines[1].startswith('"GAME start 1 1')
+    assert lines[2].startswith('"FUNC ')
+    assert second.player is first.player and first.player.handler is second
+    client.close()
+    thread.join(5)
+
+
+def test_session_expires_after_the_grace_period():
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock)
+    sessions = SessionRegistry(interval=0, clock=clock, resume_grace=60).start(scheduler)
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler, thread, client = _serve(game, sessions)
+    client.sendall(b"USERNAME dave\nGAME\n")
+    token = _read_lines(client, 2)[0].strip('"').split()[2]
+    client.close()
+    thread.join(5)
+
+    clock.now = 61
+    scheduler.run_due()
+    assert game.player_list == []
+    assert sessions.resume(token) is None
+
+
+def test_resume_takes_the_session_under_the_game_lock():
+    lock = threading.Lock()
+    seen = []
+
+    sessions = SessionRegistry(interval=0)
+    resume = sessions.resume
+    sessions.resume = lambda token: seen.append(lock.locked()) or resume(token)
+
+    client_end, server_end = socket.socketpair()
+    game = Game(dim=1, player_list=[], nb_round=1)
+    handler = ClientHandler(1, server_end, ("127.0.0.1", 0), game, lock, sessions=sessions)
+    handler.handle_message("RESUME tok")
+    assert seen == [True]
+    assert _read_lines(client_end, 1) == ['"RESUME unknown"']
+    client_end.close()
+    server_end.close()
+
+
+def test_resume_is_denied_to_a_connection_already_in_the_game():
+    sessions = SessionRegistry(interval=0)
+    game = Game(dim=1, player_list=[], nb_round=1)
+    away = Player("dave", 9, SilentHandler())
+    game.player_list.append(away)
+    token = sessions.issue(away)
+
+    client_end, server_end = socket.socketpair()
+    handler = ClientHandler(1, server_end, ("127.0.0.1", 0), game, threading.Lock(), sessions=sessions)
+    handler.handle_message("USERNAME erin")
+    handler.handle_message("GAME")
+    handler.handle_message(f"RESUME {token}")
+
+    assert _read_lines(client_end, 3)[2] == '"RESUME denied"'
+    assert handler.player.username == "erin" and away.handler is not handler
+    assert game.player_list == [away, handler.player]
+    client_end.close()
+    server_end.close()
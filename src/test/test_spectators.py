@@ -0,0 +1,106 @@
+import socket
+import threading
+
+from src.client.spectator import parse_state
+from src.server.client_handler import ClientHandler
+from src.server.game import Game
+from src.server.player import Player
+from src.server.scheduler import TimerScheduler
+from src.server.spectators import SpectatorFeed, SpectatorHub
+from src.test.doubles import FakeClock
+
+
+class RecordingHandler:
+    def __init__(self, id, gate=None):
+        self.id = id
+        self.gate = gate
+        self.frames = []
+        self.received = threading.Semaphore(0)
+
+    def send(self, message):
+        if self.gate is not None:
+            self.gate.wait()
+        self.frames.append(message)
+        self.received.release()
+        return True
+
+
+def _hub(n_players=3, max_fps=4):
+    clock = FakeClock()
+    players = [Player(f"p{i}", i, RecordingHandler(100 + i)) for i in range(n_players)]
+    game = Game(dim=1, player_list=players, nb_round=2)
+    lock = threading.Lock()
+    game.spectators = SpectatorHub(game, lock, TimerScheduler(clock), max_fps)
+    return game, game.spectators, clock
+
+
+def test_changes_are_coalesced_into_one_frame():
+    game, hub, clock = _hub()
+    spectators = [RecordingHandler(i) for i in range(20)]
+    for s in spectators:
+        hub.subscribe(s)
+        assert s.received.acquire(timeout=5)  # the current state, right away
+
+    for _ in range(100):
+        game.notify_change()
+    assert hub.scheduler.run_due() == 1
+    for s in spectators:
+        assert s.received.acquire(timeout=5)
+    assert hub.frames == 1
+
+    # The next frame waits for the frame interval
+    game.notify_change()
+    assert hub.scheduler.run_due() == 0
+    clock.now = 0.25
+    assert hub.scheduler.run_due() == 1
+
+
+def test_slow_spectator_only_gets_the_latest_frame():
+    gate = threading.Event()
+    handler = RecordingHandler(1, gate)
+    feed = SpectatorFeed(handler)
+    feed.offer("STATE 0")
+    for i in range(1, 6):
+        feed.offer(f"STATE {i}")
+    gate.set()
+    while handler.received.acquire(timeout=5) and handler.frames[-1] != "STATE 5":
+        pass
+    feed.close()
+
+    assert handler.frames[-1] == "STATE 5"
+    assert len(handler.frames) + feed.dropped == 6
+
+
+def test_frame_round_trip():
+    game, hub, _ = _hub()
+    assert parse_state(hub.frame()) == {
+        "status": "lobby",
+        "round": 0,
+        "nb_round": 2,
+        "submitted": 0,
+        "players": 3,
+        "standings": [("p0", 0, False), ("p1", 0, False), ("p2", 0, False)],
+    }
+
+
+def test_spectate_verb_is_read_only():
+    game, hub, _ = _hub()
+    client, server = socket.socketpair()
+    handler = ClientHandler(9, server, ("127.0.0.1", 0), game, threading.Lock())
+    threading.Thread(target=handler.run, daemon=True).start()
+
+    client.sendall(b"SPECTATE\nGAME\n")
+    data = b""
+    while data.count(b"\n") < 3:
+        data += client.recv(4096)
+    lines = data.decode().splitlines()
+    assert lines[0] == '"SPECTATE ok"'
+    assert sorted(lines[1:]) == ['"ERROR spectator"', '"STATE lobby 0 2 0 3 p0|0|0 p1|0|0 p2|0|0"']
+    assert handler.player not in game.player_list
+
+    client.close()
+    for _ in range(500):
+        if len(hub) == 0:
+            break
+        threading.Event().wait(0.01)
+    assert len(hub) == 0
@@ -0,0 +1,80 @@
+import threading
+
+from src.server.metrics import Metrics, render
+from src.server.stats import LatencyHistogram, MessageStats
+
+
+def test_histogram_buckets_are_contiguous():
+    previous_upper = 0
+    for index in range(LatencyHistogram.NB_BUCKETS):
+        lower, upper = LatencyHistogram.bucket_bounds(index)
+        assert lower == previous_upper
+        assert LatencyHistogram.bucket_index(lower) == index
+        assert LatencyHistogram.bucket_index(upper - 1) == index
+        previous_upper = upper
+
+
+def test_histogram_percentiles():
+    hist = LatencyHistogram()
+    for us in range(1, 1001):
+        hist.record(us * 1e-6)
+
+    assert hist.count == 1000
+    assert abs(hist.percentile(50) - 500e-6) / 500e-6 < 0.07
+    assert abs(hist.percentile(99) - 990e-6) / 990e-6 < 0.07
+    assert hist.percentile(100) <= hist.max
+
+
+def test_message_stats_merges_threads():
+    stats = MessageStats()
+
+    def worker():
+        for _ in range(100):
+            stats.record("SCORE", 0.001, 0.0001)
+        stats.retire_thread()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats.record("GAME", 0.002)
+
+    rows = {row[0]: row for row in stats.summary()}
+    assert rows["SCORE"][1] == 400
+    assert rows["GAME"][1] == 1
+    assert "SCORE|400|" in stats.format_protocol()
+
+
+def test_metrics_retired_threads_keep_their_totals():
+    metrics = Metrics()
+
+    def worker():
+        metrics.inc("connections_opened")
+        metrics.observe("broadcast", 0.001)
+        metrics.retire_thread()
+
+    for _ in range(20):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert len(metrics._shards) == 0
+    counters, histograms = metrics.snapshot()
+    assert counters[("connections_opened", ())] == 20
+    assert histograms[("broadcast", ())].count == 20
+
+
+def test_metrics_render_prometheus_text():
+    metrics = Metrics()
+    metrics.inc("connections_opened")
+    metrics.inc("messages_out", (("type", "FUNC"),), 3)
+    metrics.observe("broadcast", 0.002, (("op", "reveal"),))
+
+    text = render(metrics)
+
+    assert "turtles_connected_sockets 1" in text
+    assert 'turtles_messages_out_total{type="FUNC"} 3' in text
+    assert 'turtles_broadcast_seconds_bucket{op="reveal",le="0.001"} 0' in text
+    assert 'turtles_broadcast_seconds_bucket{op="reveal",le="0.0025"} 1' in text
+    assert 'turtles_broadcast_seconds_count{op="reveal"} 1' in text
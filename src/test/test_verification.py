@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+
+from src.server.game import Game
+from src.server.leaderboard import Leaderboard
+from src.server.player import Player
+from src.server.verification import verify_scores
+from src.shared.function_generator_claude import Difficulty, HiddenFunction
+from src.test.doubles import SilentHandler
+
+
+def test_verify_scores_flags_each_kind_of_bad_submission():
+    function = HiddenFunction(7, dim=2, difficulty=Difficulty.MEDIUM)
+    honest = function.evaluate((0.5, -1.25))
+    claimed = [honest, honest - 1.0, 0.0, 0.0, 0.0, float("inf"), float("nan"), 0.0]
+    positions = ["0.5,-1.25", "0.5,-1.25", "7.0,0.0", "", "0.5", None, None, "a,b"]
+
+    verified, flags = verify_scores(function, claimed, positions)
+
+    assert flags == {
+        1: "mismatch",
+        2: "out_of_domain",
+        3: "no_position",
+        4: "bad_position",
+        7: "bad_position",
+    }
+    assert verified[0] == honest
+    assert verified[1] == function._eval_points(np.array([[0.5, -1.25]]))[0]
+    assert np.isinf(verified[[2, 3, 4, 5, 7]]).all()
+    assert math.isnan(verified[6])
+
+
+def test_round_is_ranked_with_verified_scores():
+    players = [Player(f"p{i}", i, SilentHandler()) for i in range(3)]
+    game = Game(dim=1, player_list=players, nb_round=1)
+    game.function_list = [HiddenFunction(3, dim=1)]
+    game.leaderboard = Leaderboard(players, 1)
+    game.started = True
+    game.submissions = {p.id: False for p in players}
+    f = game.function_list[0]
+
+    game.compute_score(players[0], f.evaluate(1.0), "1.0")
+    game.compute_score(players[1], f.evaluate(-2.0), "-2.0")
+    # Claims a value far below anything reachable
+    game.compute_score(players[2], -1e6, "3.0")
+
+    assert game.waiting_for_next_round
+    assert game.flagged_scores == {2: "mismatch"}
+    assert game.leaderboard.function_score(players[2], 0) == f._raw_eval(3.0)
+    values = [f._raw_eval(x) for x in (1.0, -2.0, 3.0)]
+    best = int(np.argmin(values))
+    assert game.leaderboard.player_points(players[best]) == [4]